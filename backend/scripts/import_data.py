@@ -19,10 +19,32 @@ from pathlib import Path
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from src.config import settings
 from src.driver import GraphDBDriver
 from src.services.import_service import ImportService
 
 
+def positive_int(value):
+    """Parse a command line value as an integer of at least 1.
+
+    Args:
+        value: The raw argument string.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def print_banner():
     """Print application banner."""
     print("=" * 70)
@@ -146,12 +168,29 @@ Environment Variables:
     parser.add_argument(
         "--dry-run", action="store_true", help="Validate only, don't import data"
     )
+    parser.add_argument(
+        "--no-ref-check",
+        action="store_true",
+        help="Don't warn about relationships to nodes missing from the file",
+    )
     parser.add_argument(
         "--verbose", action="store_true", help="Enable verbose output (DEBUG level)"
     )
     parser.add_argument(
         "--quiet", action="store_true", help="Minimal output (errors only)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=1000,
+        help="Rows per write transaction (default: 1000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=8,
+        help="Labels imported in parallel (default: 8)",
+    )
 
     args = parser.parse_args()
 
@@ -177,9 +216,9 @@ Environment Variables:
         return 1
 
     # Get Neo4j connection parameters from environment
-    neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    neo4j_user = os.getenv("NEO4J_USER", "neo4j")
-    neo4j_password = os.getenv("NEO4J_PASSWORD", "password")
+    neo4j_uri = settings.neo4j_uri
+    neo4j_user = settings.neo4j_user
+    neo4j_password = settings.neo4j_password
 
     # Print configuration (unless quiet)
     if not args.quiet:
@@ -197,7 +236,17 @@ Environment Variables:
             print("Connecting to Neo4j...")
 
         driver = GraphDBDriver(
-            uri=neo4j_uri, user=neo4j_user, password=neo4j_password, log_level=log_level
+            uri=neo4j_uri,
+            user=neo4j_user,
+            password=neo4j_password,
+            log_level=log_level,
+            pool_size=settings.neo4j_pool_size,
+            acquisition_timeout=settings.neo4j_acq_timeout_sec,
+            max_connection_lifetime=settings.neo4j_max_conn_lifetime_sec,
+            keep_alive=settings.neo4j_keep_alive,
+            cache_size=settings.qcache_size,
+            cache_ttl=settings.qcache_ttl_sec,
+            database=settings.neo4j_database,
         )
 
         # Test connection
@@ -215,13 +264,38 @@ Environment Variables:
         return 1
 
     # Initialize import service
-    importer = ImportService(driver, log_level=log_level)
+    importer = ImportService(
+        driver,
+        log_level=log_level,
+        batch_size=args.batch_size,
+        max_workers=args.workers,
+    )
 
     # Perform import
     try:
+        # Index name first so the import's MERGEs are not label scans
+        index_warning = None
+        if not args.dry_run:
+            try:
+                importer.ensure_name_indexes()
+            except RuntimeError as e:
+                index_warning = f"Failed to create name indexes: {e}"
+
         result = importer.import_from_json(
-            filepath=str(json_path), validate=validate, dry_run=args.dry_run
+            filepath=str(json_path),
+            validate=validate,
+            dry_run=args.dry_run,
+            check_refs=not args.no_ref_check,
         )
+        if index_warning:
+            result.warnings.append(index_warning)
+
+        # Keep the lowercased name index used by autocomplete in sync
+        if result.success and not args.dry_run:
+            try:
+                importer.ensure_name_lc_index()
+            except RuntimeError as e:
+                result.warnings.append(f"Failed to update name_lc index: {e}")
 
         # Print summary (unless quiet)
         if not args.quiet:
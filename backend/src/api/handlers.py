@@ -4,10 +4,22 @@ This module contains all business logic for API endpoints.
 All handlers use SafeQueryBuilder and AdminQueryBuilder - no raw Cypher.
 """
 
-from flask import jsonify
+import hashlib
+import itertools
+import logging
+import sys
+import threading
+import time
+
+import orjson
+from flask import Response, jsonify, stream_with_context
 from neo4j.exceptions import Neo4jError
 from werkzeug.exceptions import BadRequest, UnsupportedMediaType
 
+from src.api.json_provider import ORJSONProvider
+from src.cache import TTLCache
+from src.config import settings
+from src.constants import ALLOWED_LABELS, MAX_TRANSFORM_EDGES
 from src.logger import setup_logger
 from src.services.autocomplete_service import AutocompleteService
 from src.services.query_builder import QueryValidationError, SafeQueryBuilder
@@ -17,6 +29,22 @@ logger = setup_logger("Handlers")
 _db_driver = None
 _autocomplete_service = None
 
+# Transformed node payloads keyed by (label, name, hops)
+_node_cache = TTLCache(maxsize=512, ttl=30)
+
+# Node and relationship counts for /api/stats
+_stats_cache = TTLCache(maxsize=1, ttl=settings.stats_ttl_sec)
+
+# Node properties maintained for query performance, not shown in node details
+_INTERNAL_PROPERTIES = frozenset({"name_lc"})
+
+# Encoded /api/nodes/names responses keyed by (label, limit): (etag, body)
+_names_cache = TTLCache(maxsize=64, ttl=settings.names_ttl_sec)
+
+# Last /api/health database probe; timestamps are time.monotonic() values
+_HEALTH_CACHE = {"ts": None, "healthy": False, "last_success_ts": None}
+_health_lock = threading.Lock()
+
 
 def init_handlers(driver, autocomplete_svc=None):
     """Initialize handlers with dependencies.
@@ -27,6 +55,11 @@ def init_handlers(driver, autocomplete_svc=None):
     """
     global _db_driver, _autocomplete_service
     _db_driver = driver
+    _node_cache.clear()
+    _stats_cache.clear()
+    _names_cache.clear()
+    _HEALTH_CACHE["ts"] = None
+    _HEALTH_CACHE["last_success_ts"] = None
 
     if autocomplete_svc:
         _autocomplete_service = autocomplete_svc
@@ -34,25 +67,102 @@ def init_handlers(driver, autocomplete_svc=None):
         _autocomplete_service = AutocompleteService(driver)
 
 
+def _public_properties(properties):
+    """Return a copy of a node property map without internal properties."""
+    return {k: v for k, v in properties.items() if k not in _INTERNAL_PROPERTIES}
+
+
+def _public_value(value):
+    """Return value with internal properties removed from nested maps.
+
+    Query results carry node properties as plain maps, possibly inside
+    lists (paths, collect()), so every map is filtered.
+    """
+    if isinstance(value, dict):
+        return {
+            k: _public_value(v)
+            for k, v in value.items()
+            if k not in _INTERNAL_PROPERTIES
+        }
+    if isinstance(value, list):
+        return [_public_value(v) for v in value]
+    return value
+
+
+def _public_record(record):
+    """Return a result record with internal properties removed from its values.
+
+    Top-level keys are the query's own column names and are kept.
+    """
+    return {k: _public_value(v) for k, v in record.items()}
+
+
+def _health_cache_fresh(now):
+    """Return True if the cached health probe is younger than the TTL."""
+    ts = _HEALTH_CACHE["ts"]
+    return ts is not None and now - ts < settings.health_ttl_sec
+
+
+def _probe_database():
+    """Return the database health, probing at most once per TTL.
+
+    Concurrent callers with a stale cache wait on a lock and reuse the
+    result of the first probe, so a burst of health checks costs one
+    connectivity check.
+
+    Returns:
+        bool: True if the database is reachable.
+    """
+    if _health_cache_fresh(time.monotonic()):
+        return _HEALTH_CACHE["healthy"]
+
+    with _health_lock:
+        if _health_cache_fresh(time.monotonic()):
+            return _HEALTH_CACHE["healthy"]
+
+        healthy = _db_driver.ping()
+        _HEALTH_CACHE["healthy"] = healthy
+        _HEALTH_CACHE["ts"] = time.monotonic()
+        if healthy:
+            _HEALTH_CACHE["last_success_ts"] = _HEALTH_CACHE["ts"]
+        return healthy
+
+
+def _within_health_grace():
+    """Return True if the last successful probe is within the grace window."""
+    last_success = _HEALTH_CACHE["last_success_ts"]
+    return (
+        last_success is not None
+        and time.monotonic() - last_success < settings.health_grace_sec
+    )
+
+
 def handle_health_check():
-    """Handle health check request."""
+    """Handle health check request.
+
+    The database probe is cached for HEALTH_TTL_SEC seconds (default 5).
+    If the probe fails within HEALTH_GRACE_SEC seconds (default 30) of the
+    last success, the endpoint still answers 200 with database "degraded"
+    so a short database blip does not fail every readiness check at once.
+    """
     try:
         if _db_driver is None:
             return jsonify(
                 {"status": "unhealthy", "error": "Database driver not initialized"}
             ), 503
 
-        result = _db_driver.run_safe_query("RETURN 1 AS health")
-
-        if result.success:
+        if _probe_database():
             return jsonify({"status": "healthy", "database": "connected"}), 200
+        if _within_health_grace():
+            logger.warning("Database probe failed; reporting degraded within grace")
+            return jsonify({"status": "healthy", "database": "degraded"}), 200
         return jsonify(
             {
                 "status": "unhealthy",
                 "database": "disconnected",
-                "error": result.error,
-             }
-         ), 503
+                "error": "Database unreachable",
+            }
+        ), 503
 
     except Neo4jError as e:
         logger.error("Database error in health check: %s", e)
@@ -62,31 +172,38 @@ def handle_health_check():
         logger.exception("Unexpected error in health check")
         return jsonify({"status": "unhealthy", "error": "Internal error"}), 503
 
-def handle_get_stats():
-    """Handle get statistics request."""
+def handle_get_stats(request):
+    """Handle get statistics request.
+
+    Counts are cached for STATS_TTL_SEC seconds (default 30);
+    ``fresh=1`` bypasses the cache and recounts. The driver's result
+    cache is always skipped, so that TTL is the only bound on staleness.
+    """
     try:
         if _db_driver is None:
             return jsonify({"error": "Database not initialized"}), 503
 
-        builder = SafeQueryBuilder()
+        fresh = request.args.get("fresh") == "1"
+        if fresh:
+            _stats_cache.clear()
 
-        node_query, node_params = builder.count_nodes()
-        node_result = _db_driver.run_safe_query(node_query, node_params)
+        stats = _stats_cache.get("stats")
+        if stats is None:
+            builder = SafeQueryBuilder()
 
-        rel_query, rel_params = builder.count_relationships()
-        rel_result = _db_driver.run_safe_query(rel_query, rel_params)
+            query, params = builder.count_stats()
+            result = _db_driver.run_safe_query(query, params, use_cache=False)
 
-        if node_result.success and rel_result.success:
-            return jsonify(
-                {
-                    "success": True,
-                    "nodes": node_result.data[0]["count"],
-                    "relationships": rel_result.data[0]["count"],
-                }
-            ), 200
-        error = node_result.error or rel_result.error
-        logger.error("Stats query failed: %s", error)
-        return jsonify({"success": False, "error": error}), 500
+            if not result.success:
+                logger.error("Stats query failed: %s", result.error)
+                return jsonify({"success": False, "error": result.error}), 500
+
+            stats = (result.data[0]["nodes"], result.data[0]["relationships"])
+            _stats_cache.set("stats", stats)
+
+        return jsonify(
+            {"success": True, "nodes": stats[0], "relationships": stats[1]}
+        ), 200
 
     except QueryValidationError as e:
         logger.warning("Invalid query in get_stats: %s", e)
@@ -101,7 +218,11 @@ def handle_get_stats():
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
 def handle_execute_query(request):
-    """Handle Cypher query execution."""
+    """Handle Cypher query execution.
+
+    Clients sending ``Accept: application/x-ndjson`` receive the records
+    as a newline-delimited JSON stream instead of a single JSON body.
+    """
     try:
         if _db_driver is None:
             return jsonify({"error": "Database not initialized"}), 503
@@ -114,14 +235,17 @@ def handle_execute_query(request):
         query = data["query"]
         parameters = data.get("parameters", None)
 
-        logger.info("Executing query: %s...", query[:100])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing query: %s...", query[:100])
+
+        if _wants_ndjson(request):
+            return _stream_query(query, parameters)
 
         result = _db_driver.run_safe_query(query, parameters)
 
         if result.success:
-            return jsonify(
-                {"success": True, "data": result.data, "count": len(result.data)}
-            ), 200
+            data = [_public_record(record) for record in result.data]
+            return jsonify({"success": True, "data": data, "count": len(data)}), 200
         return jsonify({"success": False, "error": result.error}), 400
 
     except (BadRequest, UnsupportedMediaType) as e:
@@ -140,11 +264,106 @@ def handle_execute_query(request):
         logger.exception("Unexpected error in execute_query")
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
+
+def _wants_ndjson(request):
+    """Return True if the client prefers an NDJSON stream over JSON."""
+    return (
+        request.accept_mimetypes.best_match(
+            ["application/json", "application/x-ndjson"]
+        )
+        == "application/x-ndjson"
+    )
+
+
+def _encode_record(record):
+    """Encode one streamed record as JSON bytes.
+
+    Internal properties are removed, and the same fallback as buffered
+    responses is used, so Neo4j temporal values are written in ISO format.
+
+    Raises:
+        TypeError: If the record contains a value that cannot be encoded.
+    """
+    return orjson.dumps(
+        _public_record(record),
+        default=ORJSONProvider.default,
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def _stream_query(query, parameters):
+    """Stream query results as newline-delimited JSON.
+
+    The first record is fetched before the response starts so that query
+    errors still produce a regular 400 response. Errors after that point
+    are reported as a final ``{"error": ...}`` line.
+    """
+    records = _db_driver.execute_stream(query, parameters)
+    try:
+        first = next(records)
+    except StopIteration:
+        return Response(b"", mimetype="application/x-ndjson")
+    except RuntimeError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    def generate():
+        try:
+            for record in itertools.chain([first], records):
+                yield _encode_record(record) + b"\n"
+        except (RuntimeError, TypeError) as e:
+            logger.error("Streaming query failed: %s", e)
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def _stream_json_list(query, parameters, key):
+    """Stream query results as ``{"success": true, key: [...], "count": n}``.
+
+    The body has the same shape as the buffered response, but records are
+    encoded and sent one at a time instead of being collected first. The
+    first record is fetched before the response starts so that query
+    errors still produce a regular 500 response. Errors after that point
+    close the list and add an ``"error"`` member.
+    """
+    records = _db_driver.execute_stream(query, parameters)
+    try:
+        first = next(records, None)
+    except RuntimeError as e:
+        logger.error("Streaming query failed: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+    head = b'{"success":true,"' + key.encode() + b'":['
+
+    def generate():
+        yield head
+        count = 0
+        error = None
+        try:
+            if first is not None:
+                for record in itertools.chain([first], records):
+                    chunk = _encode_record(record)
+                    yield chunk if count == 0 else b"," + chunk
+                    count += 1
+        except (RuntimeError, TypeError) as e:
+            logger.error("Streaming query failed after %d records: %s", count, e)
+            error = str(e)
+
+        tail = {"count": count}
+        if error is not None:
+            tail["error"] = error
+        # Splice the tail object's members into the outer object
+        yield b"]," + orjson.dumps(tail)[1:]
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
 def handle_autocomplete(request):
     """Handle autocomplete request with optional time filtering.
 
     Query parameters:
-        - q: Search query (minimum 3 characters)
+        - q: Search query (minimum AutocompleteService.MIN_PREFIX_LEN
+          characters, default 3)
         - label: Optional label filter
         - limit: Maximum results (default: 10, max: 20)
         - start_date: Optional start of time range (ISO format)
@@ -163,13 +382,14 @@ def handle_autocomplete(request):
         start_date = request.args.get("start_date", None)
         end_date = request.args.get("end_date", None)
 
-        if len(query) < 3:
+        min_len = _autocomplete_service.MIN_PREFIX_LEN
+        if len(query) < min_len:
             return jsonify(
                 {
                     "success": True,
                     "suggestions": [],
                     "count": 0,
-                    "message": "Minimum 3 characters required",
+                    "message": f"Minimum {min_len} characters required",
                 }
             ), 200
 
@@ -190,11 +410,12 @@ def handle_autocomplete(request):
                 end_date=end_date,
             )
             if fuzzy_result.success:
-                seen = {item["name"] for item in result.data}
+                seen = dict.fromkeys(item["name"] for item in result.data)
                 for item in fuzzy_result.data:
-                    if item["name"] not in seen:
+                    name = item["name"]
+                    if name not in seen:
                         result.data.append(item)
-                        seen.add(item["name"])
+                        seen[name] = None
 
         if result.success:
             return jsonify(
@@ -222,23 +443,59 @@ def handle_autocomplete(request):
         return jsonify({"error": "Internal server error"}), 500
 
 def handle_get_nodes(request):
-    """Handle get all nodes request."""
+    """Handle get all nodes request.
+
+    With ``format=columns`` the response carries ``keys`` and ``rows``
+    instead of one dict per node, which avoids per-record dict conversion
+    and repeated key strings in the JSON payload.
+
+    With ``stream=1`` the default response is streamed record by record,
+    so large limits do not hold the whole result in memory.
+    """
     try:
         if _db_driver is None:
             return jsonify({"error": "Database not initialized"}), 503
 
         limit = request.args.get("limit", 100, type=int)
         label = request.args.get("label", None)
+        result_format = request.args.get("format", "dict")
+
+        if label and label not in ALLOWED_LABELS:
+            return jsonify({"error": "Invalid label"}), 400
+
+        if result_format not in ("dict", "columns"):
+            return jsonify({"error": "Invalid format"}), 400
 
         builder = SafeQueryBuilder()
 
         try:
             query, params = builder.get_all_nodes(label=label, limit=limit)
+
+            if request.args.get("stream") == "1" and result_format == "dict":
+                return _stream_json_list(query, params, "nodes")
+
+            if result_format == "columns":
+                result = _db_driver.run_safe_query(
+                    query, params, result_format="columns"
+                )
+                if result.success:
+                    return jsonify(
+                        {
+                            "success": True,
+                            "keys": result.data["keys"],
+                            "rows": _public_value(result.data["rows"]),
+                            "count": len(result.data["rows"]),
+                        }
+                    ), 200
+                logger.error("Get nodes query failed: %s", result.error)
+                return jsonify({"success": False, "error": result.error}), 500
+
             result = _db_driver.run_safe_query(query, params)
 
             if result.success:
+                nodes = [_public_record(record) for record in result.data]
                 return jsonify(
-                    {"success": True, "nodes": result.data, "count": len(result.data)}
+                    {"success": True, "nodes": nodes, "count": len(nodes)}
                 ), 200
             logger.error("Get nodes query failed: %s", result.error)
             return jsonify({"success": False, "error": result.error}), 500
@@ -258,6 +515,60 @@ def handle_get_nodes(request):
     except Exception as e:
         logger.exception("Unexpected error in [HANDLER_NAME]")
         return jsonify({"error": "Internal server error"}), 500
+
+def handle_get_node_names(request):
+    """Handle get all node names request (for frontend caching).
+
+    The encoded response is kept for NAMES_TTL_SEC seconds (default 60)
+    and carries an ETag, so clients polling with If-None-Match get a 304
+    without any database work or JSON encoding.
+
+    Query parameters:
+        - label: Optional label filter
+        - limit: Maximum names (default: 1000, max: 10000)
+    """
+    try:
+        if _autocomplete_service is None:
+            return jsonify(
+                {"success": False, "error": "Autocomplete service not available"}
+            ), 503
+
+        label = request.args.get("label", None)
+        limit = min(request.args.get("limit", 1000, type=int), 10000)
+
+        if label and label not in ALLOWED_LABELS:
+            return jsonify({"error": "Invalid label"}), 400
+
+        key = (label, limit)
+        snapshot = _names_cache.get(key)
+        if snapshot is None:
+            # The snapshot is the only cache, so its TTL bounds staleness
+            result = _autocomplete_service.get_all_node_names(
+                label=label, max_nodes=limit, use_cache=False
+            )
+            if not result.success:
+                logger.error("Get node names query failed: %s", result.error)
+                return jsonify({"success": False, "error": result.error}), 500
+
+            body = orjson.dumps(
+                {"success": True, "names": result.data, "count": len(result.data)}
+            )
+            snapshot = (hashlib.blake2b(body, digest_size=16).hexdigest(), body)
+            _names_cache.set(key, snapshot)
+
+        etag, body = snapshot
+        response = Response(body, mimetype="application/json")
+        response.set_etag(etag)
+        response.cache_control.max_age = int(settings.names_ttl_sec)
+        return response.make_conditional(request)
+
+    except Neo4jError as e:
+        logger.error("Database error in get_node_names: %s", e)
+        return jsonify({"success": False, "error": "Database error"}), 500
+
+    except Exception as e:
+        logger.exception("Unexpected error in get_node_names")
+        return jsonify({"success": False, "error": "Internal server error"}), 500
 """
 def handle_create_node(request):
     #Handle create node request.
@@ -276,6 +587,9 @@ def handle_create_node(request):
         label = data["label"]
         properties = data.get("properties", {})
 
+        if label not in ALLOWED_LABELS:
+            return jsonify({"error": "Invalid label"}), 400
+
         from src.services.query_builder import AdminQueryBuilder
 
         admin_builder = AdminQueryBuilder()
@@ -289,17 +603,24 @@ def handle_create_node(request):
                 else {},
             )
 
-            result = _db_driver.run_safe_query(query, params)
-
-            if result.success:
-                return jsonify(
-                    {
-                        "success": True,
-                        "data": result.data,
-        "message": f"Node created with label {label}",
-                    }
-                ), 201
-            return jsonify({"success": False, "error": result.error}), 500
+            # run_safe_query rejects writes; the query text only varies by
+            # label (from ALLOWED_LABELS), so there is one plan per label
+            try:
+                created = _db_driver.execute(query, params, write=True)
+            except RuntimeError as e:
+                return jsonify({"success": False, "error": str(e)}), 500
+
+            _node_cache.clear()
+            _names_cache.clear()
+            if _autocomplete_service is not None:
+                _autocomplete_service.invalidate_index()
+            return jsonify(
+                {
+                    "success": True,
+                    "data": created,
+                    "message": f"Node created with label {label}",
+                }
+            ), 201
 
         except QueryValidationError as e:
             logger.warning("Validation error: %s", e)
@@ -321,6 +642,27 @@ def handle_create_node(request):
         logger.exception("Unexpected error in [HANDLER_NAME]")
         return jsonify({"error": "Internal server error"}), 500
 """
+
+
+def _edge_id(source_key, rel_type, target_key):
+    """Build a graph edge id that is unique per (source, type, target).
+
+    The source name is length-prefixed, and relationship types never
+    contain '-', so names containing '-' cannot produce the same id for
+    different edges.
+
+    Args:
+        source_key: Name of the source node.
+        rel_type: Relationship type.
+        target_key: Name of the target node.
+
+    Returns:
+        str: The edge id.
+    """
+    source = str(source_key)
+    return f"{len(source)}:{source}-{rel_type}-{target_key}"
+
+
 def transform_neo4j_results_to_graph(neo4j_results):
     """Transform Neo4j path results to graph format with full path preservation.
 
@@ -338,17 +680,23 @@ def transform_neo4j_results_to_graph(neo4j_results):
             - connections: List of connection objects
             - nodes: List of all unique nodes with labels
             - edges: List of all edges with source/target
+            - truncated: True if MAX_TRANSFORM_EDGES was reached and the
+              remaining records were skipped
     """
     if not neo4j_results:
         return []
 
+    intern = sys.intern
     all_nodes = {}
     all_edges = []
+    seen_edges = set()
+    connections = []
     start_node_key = None
+    truncated = False
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    logger.info("=" * 60)
-    logger.info("Starting transformation of %d Neo4j records", len(neo4j_results))
-    logger.info("=" * 60)
+    if debug:
+        logger.debug("Starting transformation of %d Neo4j records", len(neo4j_results))
 
     for record_idx, record in enumerate(neo4j_results):
         start = record.get("start")
@@ -361,136 +709,149 @@ def transform_neo4j_results_to_graph(neo4j_results):
             logger.warning("Record %d missing 'start' node", record_idx)
             continue
 
-        start_dict = dict(start)
-
-        if start_label:
-            start_dict["label"] = start_label
-            logger.debug(
-                "Start node: %s with label: %s",
-                start_dict.get('name'),
-                start_label
-            )
-        else:
-            logger.warning("Start node missing label: %s", start_dict.get('name'))
-            start_dict["label"] = "Unknown"
-
-        start_node_key = start_dict.get("name", str(id(start)))
+        # Only materialise node dicts once a key is confirmed new
+        start_node_key = start.get("name", str(id(start)))
 
         if start_node_key not in all_nodes:
+            start_dict = _public_properties(start)
+            if start_label:
+                start_dict["label"] = start_label
+            else:
+                logger.warning("Start node missing label: %s", start_dict.get('name'))
+                start_dict["label"] = "Unknown"
+
             all_nodes[start_node_key] = {
                 "id": start_node_key,
                 "data": start_dict,
                 "isMainNode": True,
             }
-            logger.debug(
-                "Added main node: %s with label: %s",
-                start_node_key,
-                start_dict['label']
-            )
-
-        if connected:
-            connected_dict = dict(connected)
-
-            if connected_label:
-                connected_dict["label"] = connected_label
-            else:
-                logger.warning(
-                    "Connected node missing label: %s",
-                    connected_dict.get('name')
+            if debug:
+                logger.debug(
+                    "Added main node: %s with label: %s",
+                    start_node_key,
+                    start_dict['label']
                 )
-                connected_dict["label"] = "Unknown"
 
-            connected_key = connected_dict.get("name", str(id(connected)))
+        if connected:
+            connected_key = connected.get("name", str(id(connected)))
 
             if connected_key not in all_nodes:
+                connected_dict = _public_properties(connected)
+                if connected_label:
+                    connected_dict["label"] = connected_label
+                else:
+                    logger.warning(
+                        "Connected node missing label: %s",
+                        connected_dict.get('name')
+                    )
+                    connected_dict["label"] = "Unknown"
+
                 all_nodes[connected_key] = {
                     "id": connected_key,
                     "data": connected_dict,
                     "isMainNode": False,
                 }
-                logger.debug(
-                    "Added connected node: %s with label: %s",
-                    connected_key,
-                    connected_dict['label']
-                )
+                if debug:
+                    logger.debug(
+                        "Added connected node: %s with label: %s",
+                        connected_key,
+                        connected_dict['label']
+                    )
 
         if relationship_details:
             for rel_detail in relationship_details:
-                rel_type = rel_detail.get("type", "CONNECTED")
-
-                source_node_dict = dict(rel_detail.get("start_node", {}))
-                source_node_label = rel_detail.get("start_node_label")
-
-                if source_node_label:
-                    source_node_dict["label"] = source_node_label
-                else:
-                    source_node_dict["label"] = "Unknown"
+                # Few distinct types - interned strings hash once
+                rel_type = intern(rel_detail.get("type", "CONNECTED"))
 
-                source_key = source_node_dict.get("name", str(id(source_node_dict)))
+                source_node = rel_detail.get("start_node") or {}
+                source_key = source_node.get("name", str(id(source_node)))
 
-                target_node_dict = dict(rel_detail.get("end_node", {}))
-                target_node_label = rel_detail.get("end_node_label")
-
-                if target_node_label:
-                    target_node_dict["label"] = target_node_label
-                else:
-                    target_node_dict["label"] = "Unknown"
-
-                target_key = target_node_dict.get("name", str(id(target_node_dict)))
+                target_node = rel_detail.get("end_node") or {}
+                target_key = target_node.get("name", str(id(target_node)))
 
                 if source_key not in all_nodes:
+                    source_node_dict = _public_properties(source_node)
+                    source_node_dict["label"] = (
+                        rel_detail.get("start_node_label") or "Unknown"
+                    )
                     all_nodes[source_key] = {
                         "id": source_key,
                         "data": source_node_dict,
                         "isMainNode": (source_key == start_node_key),
                     }
-                    logger.debug(
-                        "Added source node: %s with label: %s",
-                        source_key,
-                        source_node_dict['label']
-                    )
+                    if debug:
+                        logger.debug(
+                            "Added source node: %s with label: %s",
+                            source_key,
+                            source_node_dict['label']
+                        )
 
                 if target_key not in all_nodes:
+                    target_node_dict = _public_properties(target_node)
+                    target_node_dict["label"] = (
+                        rel_detail.get("end_node_label") or "Unknown"
+                    )
                     all_nodes[target_key] = {
                         "id": target_key,
                         "data": target_node_dict,
                         "isMainNode": False,
                     }
-                    logger.debug(
-                        "Added target node: %s with label: %s",
-                        target_key,
-                        target_node_dict['label']
-                    )
-
-                edge_id = f"{source_key}-{rel_type}-{target_key}"
-
-                if not any(e["id"] == edge_id for e in all_edges):
+                    if debug:
+                        logger.debug(
+                            "Added target node: %s with label: %s",
+                            target_key,
+                            target_node_dict['label']
+                        )
+
+                # Dedup on the tuple; names containing '-' cannot collide
+                edge_key = (source_key, rel_type, target_key)
+
+                if edge_key not in seen_edges:
+                    seen_edges.add(edge_key)
                     all_edges.append(
                         {
-                            "id": edge_id,
+                            "id": _edge_id(source_key, rel_type, target_key),
                             "source": source_key,
                             "target": target_key,
                             "relationship": rel_type,
                         }
                     )
-                    logger.debug(
-                        "Added edge: %s -[%s]-> %s",
-                        source_key,
-                        rel_type,
-                        target_key
+                    connections.append(
+                        {
+                            "relationship": rel_type,
+                            "node": all_nodes[target_key]["data"],
+                            "source": source_key,
+                            "target": target_key,
+                        }
                     )
+                    if debug:
+                        logger.debug(
+                            "Added edge: %s -[%s]-> %s",
+                            source_key,
+                            rel_type,
+                            target_key
+                        )
+
+                    if len(all_edges) >= MAX_TRANSFORM_EDGES:
+                        truncated = True
+                        break
+
+        if truncated:
+            logger.warning(
+                "Transformation truncated at %d edges after %d of %d records",
+                MAX_TRANSFORM_EDGES,
+                record_idx + 1,
+                len(neo4j_results)
+            )
+            break
 
-    logger.info("=" * 60)
-    logger.info("Transformation complete:")
-    logger.info("  Total unique nodes: %d", len(all_nodes))
-    logger.info("  Total edges: %d", len(all_edges))
-
-    for node_key, node_info in list(all_nodes.items())[:5]:
-        has_label = "label" in node_info["data"]
-        label_value = node_info["data"].get("label", "MISSING")
-        logger.info("  Node '%s': label=%s (present=%s)", node_key, label_value, has_label)
-
-    logger.info("=" * 60)
+    if debug:
+        for node_key, node_info in itertools.islice(all_nodes.items(), 5):
+            has_label = "label" in node_info["data"]
+            label_value = node_info["data"].get("label", "MISSING")
+            logger.debug(
+                "  Node '%s': label=%s (present=%s)", node_key, label_value, has_label
+            )
 
     if not all_nodes:
         logger.warning("No nodes found after transformation")
@@ -506,29 +867,17 @@ def transform_neo4j_results_to_graph(neo4j_results):
         main_node = list(all_nodes.values())[0]
         logger.warning("No main node found, using first node: %s", main_node['id'])
 
-    connections = []
-    for edge in all_edges:
-        target_node = all_nodes.get(edge["target"])
-        if target_node:
-            connections.append(
-                {
-                    "relationship": edge["relationship"],
-                    "node": target_node["data"],
-                    "source": edge["source"],
-                    "target": edge["target"],
-                }
-            )
-
     result = [
         {
             "n": main_node["data"],
             "connections": connections,
             "nodes": list(all_nodes.values()),
             "edges": all_edges,
+            "truncated": truncated,
         }
     ]
 
-    logger.info(
+    logger.debug(
         "Transformed %d Neo4j records into %d unique nodes with %d edges",
         len(neo4j_results),
         len(all_nodes),
@@ -538,6 +887,39 @@ def transform_neo4j_results_to_graph(neo4j_results):
     return result
 
 
+def _single_node_to_graph(record):
+    """Build the graph payload for a single node without relationships.
+
+    Fast path for hops=0: there are no edges to deduplicate, so the
+    general transformation is skipped.
+
+    Args:
+        record: First record from Neo4j containing 'start' and 'start_label'.
+
+    Returns:
+        Same structure as transform_neo4j_results_to_graph, or [] if the
+        record has no start node.
+    """
+    start = record.get("start")
+    if not start:
+        logger.warning("Record 0 missing 'start' node")
+        return []
+
+    node_dict = _public_properties(start)
+    node_dict["label"] = record.get("start_label") or "Unknown"
+    node_key = node_dict.get("name", str(id(start)))
+
+    return [
+        {
+            "n": node_dict,
+            "connections": [],
+            "nodes": [{"id": node_key, "data": node_dict, "isMainNode": True}],
+            "edges": [],
+            "truncated": False,
+        }
+    ]
+
+
 def handle_get_node_by_name(name, request):
     """Handle get node by name request.
 
@@ -552,7 +934,9 @@ def handle_get_node_by_name(name, request):
         - hops: Context depth 0-3 (default: 1)
 
     Returns:
-        JSON response with node details and relationships
+        JSON response with node details and relationships. For large
+        multi-hop results, data[0]["truncated"] is True when the graph
+        was cut off at MAX_TRANSFORM_EDGES edges.
     """
     try:
         if _db_driver is None:
@@ -567,7 +951,16 @@ def handle_get_node_by_name(name, request):
         if not label:
             return jsonify({"error": "Label required for node lookup"}), 400
 
-        logger.info("Fetching node: name='%s', label=%s, hops=%s", name, label, hops)
+        if label not in ALLOWED_LABELS:
+            return jsonify({"error": "Invalid label"}), 400
+
+        cache_key = (label, name, hops)
+        cached = _node_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Node cache hit: name='%s', label=%s, hops=%s", name, label, hops)
+            return jsonify(cached), 200
+
+        logger.debug("Fetching node: name='%s', label=%s, hops=%s", name, label, hops)
 
         builder = SafeQueryBuilder()
 
@@ -601,9 +994,12 @@ def handle_get_node_by_name(name, request):
                     {"success": False, "error": f"Node '{name}' not found"}
                 ), 404
 
-            logger.info("Node found: '%s', returning %d result(s)", name, len(result.data))
+            logger.debug("Node found: '%s', returning %d result(s)", name, len(result.data))
 
-            transformed_data = transform_neo4j_results_to_graph(result.data)
+            if hops == 0:
+                transformed_data = _single_node_to_graph(result.data[0])
+            else:
+                transformed_data = transform_neo4j_results_to_graph(result.data)
 
             if not transformed_data:
                 logger.error("Transformation failed - no data returned")
@@ -611,14 +1007,14 @@ def handle_get_node_by_name(name, request):
                     {"success": False, "error": "Failed to process node data"}
                 ), 500
 
-            return jsonify(
-                {
-                    "success": True,
-                    "data": transformed_data,
-                    "count": len(transformed_data[0].get("nodes", [])),
-                    "hops": hops,
-                }
-            ), 200
+            payload = {
+                "success": True,
+                "data": transformed_data,
+                "count": len(transformed_data[0].get("nodes", [])),
+                "hops": hops,
+            }
+            _node_cache.set(cache_key, payload)
+            return jsonify(payload), 200
         logger.error("Get node query failed: %s", result.error)
         return jsonify({"success": False, "error": result.error}), 500
 
@@ -0,0 +1,80 @@
+"""JSON provider for Flask responses.
+
+This module replaces Flask's stdlib-based JSON encoding with orjson,
+which encodes large lists of query records considerably faster.
+"""
+
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Keys are not sorted and output is always compact, so responses are
+    encoded in a single native call. Values orjson cannot encode fall
+    back to Flask's default handling; Neo4j temporal values are written
+    in ISO format.
+    """
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Convert values orjson cannot encode natively.
+
+        Args:
+            o: The value to convert.
+
+        Returns:
+            Any: A JSON-serializable representation of o.
+
+        Raises:
+            TypeError: If the value cannot be serialized.
+        """
+        if hasattr(o, "iso_format"):
+            return o.iso_format()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string.
+
+        Args:
+            obj: The data to serialize.
+            **kwargs: Ignored; accepted for Flask API compatibility.
+
+        Returns:
+            str: The JSON document.
+        """
+        return orjson.dumps(obj, default=self.default, option=_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize a JSON document.
+
+        Args:
+            s: The JSON text or bytes.
+            **kwargs: Ignored; accepted for Flask API compatibility.
+
+        Returns:
+            Any: The decoded data.
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response without a str round-trip.
+
+        Args:
+            *args: A single value, or several values serialized as a list.
+            **kwargs: Values serialized as a dict.
+
+        Returns:
+            Response: Response with an application/json body.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=_OPTIONS),
+            mimetype=self.mimetype,
+        )
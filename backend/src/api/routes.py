@@ -21,7 +21,7 @@ def health():
 @api_bp.route("/stats", methods=["GET"])
 def stats():
     """Get database statistics."""
-    return handlers.handle_get_stats()
+    return handlers.handle_get_stats(request)
 
 
 # Query & Search
@@ -44,6 +44,12 @@ def get_nodes():
     return handlers.handle_get_nodes(request)
 
 
+@api_bp.route("/nodes/names", methods=["GET"])
+def get_node_names():
+    """Get all node names (ETag-cached snapshot)."""
+    return handlers.handle_get_node_names(request)
+
+
 # @api_bp.route("/nodes", methods=["POST"])
 # def create_node():
 #     """Create a new node."""
@@ -0,0 +1,80 @@
+"""In-process caching helpers.
+
+This module provides a small, thread-safe LRU cache with per-entry
+time-to-live. It is used by the API handlers and services to avoid
+repeating identical database round-trips within a short time window.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Entries are evicted in least-recently-used order once ``maxsize`` is
+    reached. Expired entries are dropped lazily on access.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in the cache.
+        ttl (float): Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache.
+            ttl: Lifetime of an entry in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing/expired.
+
+        Args:
+            key: Cache key.
+            default: Value returned on a cache miss. Defaults to None.
+
+        Returns:
+            Any: The cached value or default.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored (possibly expired) entries."""
+        return len(self._data)
@@ -0,0 +1,128 @@
+"""Application configuration.
+
+This module reads the environment once at import time and exposes the
+result as a read-only ``settings`` object, so entry points do not repeat
+``os.getenv`` parsing and share the same defaults.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+
+from src.logger import setup_logger
+
+logger = setup_logger("Config")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back on bad values."""
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        logger.warning("Invalid %s, using default %d", name, default)
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back on bad values."""
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        logger.warning("Invalid %s, using default %s", name, default)
+        return default
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Resolved application settings.
+
+    Attributes:
+        neo4j_uri: Bolt URI of the Neo4j server.
+        neo4j_user: Database username.
+        neo4j_password: Database password.
+        neo4j_database: Database every session targets.
+        neo4j_pool_size: Maximum number of pooled Neo4j connections.
+        neo4j_acq_timeout_sec: Seconds to wait for a free pooled connection.
+        neo4j_max_conn_lifetime_sec: Seconds before a pooled connection is
+            closed and replaced.
+        neo4j_keep_alive: Whether pooled connections send TCP keep-alives.
+        qcache_size: Maximum number of cached read query results.
+        qcache_ttl_sec: Seconds a read query result stays cached; 0 disables
+            the driver's result cache.
+        log_level: Numeric logging level from LOG_LEVEL.
+        warmup: Whether to warm Neo4j caches on startup.
+        flask_host: Interface the API binds to.
+        flask_port: Port the API listens on.
+        flask_debug: Whether Flask debug mode is enabled.
+        health_ttl_sec: Seconds a /api/health database probe is reused.
+        health_grace_sec: Seconds after the last successful probe during
+            which a failed probe reports "degraded" instead of 503.
+        stats_ttl_sec: Seconds /api/stats counts are served from memory.
+        names_ttl_sec: Seconds a /api/nodes/names snapshot is served.
+        autocomplete_index: Whether prefix suggestions are served from an
+            in-memory index of all node names.
+        autocomplete_index_refresh_sec: Seconds between index reloads.
+        autocomplete_index_max: Maximum number of names held in the index.
+    """
+
+    neo4j_uri: str
+    neo4j_user: str
+    neo4j_password: str
+    neo4j_database: str
+    neo4j_pool_size: int
+    neo4j_acq_timeout_sec: float
+    neo4j_max_conn_lifetime_sec: float
+    neo4j_keep_alive: bool
+    qcache_size: int
+    qcache_ttl_sec: float
+    log_level: int
+    warmup: bool
+    flask_host: str
+    flask_port: int
+    flask_debug: bool
+    health_ttl_sec: float
+    health_grace_sec: float
+    stats_ttl_sec: float
+    names_ttl_sec: float
+    autocomplete_index: bool
+    autocomplete_index_refresh_sec: float
+    autocomplete_index_max: int
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables.
+
+        Returns:
+            Settings: Settings with defaults applied for unset variables.
+        """
+        return cls(
+            neo4j_uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+            neo4j_user=os.getenv("NEO4J_USER", "neo4j"),
+            neo4j_password=os.getenv("NEO4J_PASSWORD", "password"),
+            neo4j_database=os.getenv("NEO4J_DATABASE", "neo4j"),
+            neo4j_pool_size=_env_int("NEO4J_POOL_SIZE", 50),
+            neo4j_acq_timeout_sec=_env_float("NEO4J_ACQ_TIMEOUT", 30.0),
+            neo4j_max_conn_lifetime_sec=_env_float("NEO4J_MAX_CONN_LIFETIME", 3600.0),
+            neo4j_keep_alive=os.getenv("NEO4J_KEEP_ALIVE", "1") == "1",
+            qcache_size=_env_int("QCACHE_SIZE", 1024),
+            qcache_ttl_sec=_env_float("QCACHE_TTL", 30.0),
+            log_level=getattr(
+                logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO
+            ),
+            warmup=os.getenv("NEO4J_WARMUP", "0") == "1",
+            flask_host=os.getenv("FLASK_HOST", "0.0.0.0"),
+            flask_port=_env_int("FLASK_PORT", 8000),
+            flask_debug=os.getenv("FLASK_DEBUG", "False").lower() == "true",
+            health_ttl_sec=_env_float("HEALTH_TTL_SEC", 5.0),
+            health_grace_sec=_env_float("HEALTH_GRACE_SEC", 30.0),
+            stats_ttl_sec=_env_float("STATS_TTL_SEC", 30.0),
+            names_ttl_sec=_env_float("NAMES_TTL_SEC", 60.0),
+            autocomplete_index=os.getenv("AUTOCOMPLETE_INDEX", "0") == "1",
+            autocomplete_index_refresh_sec=_env_float(
+                "AUTOCOMPLETE_INDEX_REFRESH_SEC", 300.0
+            ),
+            autocomplete_index_max=_env_int("AUTOCOMPLETE_INDEX_MAX", 100_000),
+        )
+
+
+settings = Settings.from_env()
@@ -1,7 +1,11 @@
-"""Shared constants across the backend."""
+"""Shared constants across the backend.
+
+The whitelists are frozensets: membership checks are O(1) and the sets
+cannot be modified at runtime.
+"""
 
 # Node Labels
-ALLOWED_LABELS = {
+ALLOWED_LABELS = frozenset({
     "AttackPattern",
     "Campaign",
     "Identity",
@@ -19,10 +23,10 @@ ALLOWED_LABELS = {
     "ThreatActor",
     "Tool",
     "Vulnerability",
-}
+})
 
 # Relationship Types
-ALLOWED_RELATIONSHIPS = {
+ALLOWED_RELATIONSHIPS = frozenset({
     "BASED_ON",
     "DETECTS",
     "DESCRIBES",
@@ -34,10 +38,10 @@ ALLOWED_RELATIONSHIPS = {
     "RELATED_TO",
     "TARGETS",
     "USES",
-}
+})
 
 # Allowed Properties (for validation)
-ALLOWED_PROPERTIES = {
+ALLOWED_PROPERTIES = frozenset({
     "name",
     "description",
     "title",
@@ -64,10 +68,13 @@ ALLOWED_PROPERTIES = {
     "hash_md5",
     "hash_sha256",
     "addressurl",
-}
+})
 
 # API Configuration
 DEFAULT_LIMIT = 10
 MAX_LIMIT = 100
 MIN_SEARCH_LENGTH = 3
 AUTOCOMPLETE_TIMEOUT_MS = 50
+
+# Graph transformation
+MAX_TRANSFORM_EDGES = 5000
@@ -6,14 +6,146 @@ error handling, logging, and a standardized result wrapper for consistent
 query result handling.
 """
 
-import json
+import hashlib
+import importlib.util
 import logging
-from typing import Any, Optional
+import re
+from contextlib import nullcontext
+from functools import lru_cache
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
 
-from neo4j import GraphDatabase
+import orjson
+from neo4j import READ_ACCESS, GraphDatabase
 
+from src.cache import TTLCache
+from src.config import settings
 from src.logger import setup_logger
 
+# Read paths reject queries matching this pattern before they reach the
+# database. A plain alternation of words compiles to a scan without
+# backtracking, so one search per query is cheap. Keywords after a dot
+# are property keys (n.set), not clauses.
+_WRITE_QUERY_PATTERN = re.compile(
+    r"(?<!\.)\b(?:CREATE|MERGE|DELETE|DETACH|SET|REMOVE|DROP|FOREACH)\b",
+    re.IGNORECASE,
+)
+
+# String literals, backtick identifiers and comments, blanked out before the
+# write keyword check so text such as {name: 'DELETE me'} is not a clause
+_NON_CLAUSE_PATTERN = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`(?:[^`]|``)*`|//[^\n]*|/\*.*?\*/",
+    re.DOTALL,
+)
+
+# Shapes execute() can return results in
+RESULT_FORMATS = ("dict", "columns", "raw")
+
+
+# Single left-to-right tokenizer for _normalize_query. String literals and
+# backtick identifiers are consumed whole, so whitespace and keywords inside
+# them are never touched. Comments count as whitespace and are consumed
+# whole, so quotes inside them do not start a string.
+_NORMALIZE_PATTERN = re.compile(
+    r"(?P<eq>=\s*'(?P<eq_value>[^'\\]*)')"
+    r"|(?P<string>'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`(?:[^`]|``)*`)"
+    r"|\b(?P<keyword>LIMIT|SKIP)\s+(?P<number>\d+)\b"
+    r"|(?P<space>(?:\s|//[^\n]*|/\*.*?\*/)+)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Prefix of parameters extracted from literals by _normalize_query
+_LITERAL_PARAM_PREFIX = "_lit"
+
+
+@lru_cache(maxsize=1024)
+def _normalize_query(query: str) -> tuple[str, tuple[tuple[str, Any], ...], str]:
+    """Rewrite a query into its canonical parameterized form.
+
+    Comments are removed, whitespace outside string literals and backtick
+    identifiers is collapsed, and integer LIMIT/SKIP values and simple
+    ``= '...'`` string comparisons are replaced by parameters. Queries that
+    differ only in those literals then share one query text, so Neo4j
+    reuses a single cached plan for them.
+
+    Args:
+        query: The Cypher query as sent by the caller.
+
+    Returns:
+        tuple: The normalized query, the extracted literal parameters as
+            (name, value) pairs, and a short hex digest of the normalized
+            query for cache keys and log correlation.
+    """
+    literals: list[tuple[str, Any]] = []
+
+    def _replace(match: re.Match) -> str:
+        if match.group("space"):
+            return " "
+        if match.group("string"):
+            return match.group("string")
+
+        name = f"{_LITERAL_PARAM_PREFIX}{len(literals)}"
+        if match.group("eq"):
+            literals.append((name, match.group("eq_value")))
+            return f"= ${name}"
+        literals.append((name, int(match.group("number"))))
+        return f"{match.group('keyword')} ${name}"
+
+    normalized = _NORMALIZE_PATTERN.sub(_replace, query).strip()
+    digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    return normalized, tuple(literals), digest
+
+
+@lru_cache(maxsize=1024)
+def _has_write_keyword(query: str) -> bool:
+    """Return True if query contains a write clause keyword.
+
+    Keywords inside string literals, backtick identifiers and comments are
+    ignored.
+
+    Args:
+        query: The Cypher query to check.
+
+    Returns:
+        bool: True if the query would write to the database.
+    """
+    return _WRITE_QUERY_PATTERN.search(_NON_CLAUSE_PATTERN.sub(" ", query)) is not None
+
+
+def _copy_result(data: Any) -> Any:
+    """Return a copy of query data that callers may modify safely.
+
+    Lists and dicts are copied at every level, so records and nested maps
+    are not shared with the cache. Other values (scalars, temporal values,
+    raw records) are immutable and reused as they are.
+
+    Args:
+        data: Result data as returned by GraphDBDriver.execute().
+
+    Returns:
+        Any: A copy of data with new lists and dicts throughout.
+    """
+    if isinstance(data, dict):
+        return {key: _copy_result(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_result(value) for value in data]
+    return data
+
+
+def rust_codec_available() -> bool:
+    """Return True if the neo4j-rust-ext PackStream codec is installed.
+
+    The driver picks the Rust codec up automatically when the package is
+    present; this only reports whether it will.
+
+    Returns:
+        bool: True if the native extension module can be imported.
+    """
+    try:
+        return importlib.util.find_spec("neo4j._rust") is not None
+    except ModuleNotFoundError:
+        return False
+
 
 class ResultWrapper:
     """Encapsulate the outcome of a database operation.
@@ -78,7 +210,9 @@ class ResultWrapper:
         Returns:
             str: JSON string of the result dictionary.
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return orjson.dumps(
+            self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
 
 
 class GraphDBDriver:
@@ -90,23 +224,88 @@ class GraphDBDriver:
 
     Attributes:
         driver: The underlying Neo4j driver instance.
+        database: Name of the database all sessions target.
         logger: Logger instance for this driver.
     """
 
     def __init__(
-        self, uri: str, user: str, password: str, log_level: int = logging.INFO
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        log_level: int = logging.INFO,
+        pool_size: Optional[int] = None,
+        acquisition_timeout: Optional[float] = None,
+        max_connection_lifetime: Optional[float] = None,
+        keep_alive: Optional[bool] = None,
+        cache_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        database: Optional[str] = None,
     ):
         """Initialize the GraphDBDriver with connection parameters.
 
+        Pool, cache and database arguments left as None are taken from
+        src.config.settings, which parses the environment once.
+
         Args:
             uri: The Neo4j connection URI (e.g., 'bolt://localhost:7687').
             user: Database username for authentication.
             password: Database password for authentication.
             log_level: Logging level for this driver. Defaults to logging.INFO.
+            pool_size: Maximum number of pooled connections. Defaults to
+                settings.neo4j_pool_size.
+            acquisition_timeout: Seconds to wait for a free pooled connection.
+                Defaults to settings.neo4j_acq_timeout_sec.
+            max_connection_lifetime: Seconds before a pooled connection is
+                replaced. Defaults to settings.neo4j_max_conn_lifetime_sec.
+            keep_alive: Whether pooled connections send TCP keep-alives.
+                Defaults to settings.neo4j_keep_alive.
+            cache_size: Maximum number of cached read results. Defaults to
+                settings.qcache_size.
+            cache_ttl: Seconds a read result stays cached; 0 disables the
+                cache. Defaults to settings.qcache_ttl_sec.
+            database: Name of the database every session targets. Passing
+                it avoids a home-database lookup per session. Defaults to
+                settings.neo4j_database.
         """
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        if pool_size is None:
+            pool_size = settings.neo4j_pool_size
+        if acquisition_timeout is None:
+            acquisition_timeout = settings.neo4j_acq_timeout_sec
+        if max_connection_lifetime is None:
+            max_connection_lifetime = settings.neo4j_max_conn_lifetime_sec
+        if keep_alive is None:
+            keep_alive = settings.neo4j_keep_alive
+
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=pool_size,
+            connection_acquisition_timeout=acquisition_timeout,
+            max_connection_lifetime=max_connection_lifetime,
+            keep_alive=keep_alive,
+        )
+        self.database = database or settings.neo4j_database
         self.logger = setup_logger("GraphDBDriver", log_level)
-        self.logger.info("Neo4j driver initialized.")
+        self.logger.info(
+            "Neo4j driver initialized (pool_size=%d, acquisition_timeout=%.1fs).",
+            pool_size,
+            acquisition_timeout,
+        )
+
+        if cache_size is None:
+            cache_size = settings.qcache_size
+        if cache_ttl is None:
+            cache_ttl = settings.qcache_ttl_sec
+
+        self._query_cache = (
+            TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+
+        # Session bound to the current request/context by bind_session()
+        self._bound_session: ContextVar = ContextVar(
+            f"neo4j_session_{id(self)}", default=None
+        )
 
     def connect(self) -> str:
         """Verify connection to the database.
@@ -119,6 +318,57 @@ class GraphDBDriver:
         """
         return "connected"
 
+    def ping(self) -> bool:
+        """Check that the database is reachable without running a query.
+
+        Uses the driver's connectivity check, which only acquires and
+        verifies a pooled connection, so there is no query parse, plan or
+        transaction per probe.
+
+        Returns:
+            bool: True if the database is reachable, False otherwise.
+        """
+        try:
+            self.driver.verify_connectivity()
+            return True
+        except Exception as e:
+            self.logger.warning("Connectivity check failed: %s", e)
+            return False
+
+    def invalidate(self) -> None:
+        """Drop all cached read results.
+
+        Called automatically after write queries so subsequent reads see
+        the new data.
+        """
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def bind_session(self) -> None:
+        """Open a session that execute() reuses in the current context.
+
+        Intended to be called at the start of a web request so that all
+        queries of that request share one session instead of acquiring a
+        new one per query. Must be paired with release_session().
+
+        The session defaults to read access, so auto-commit queries run on
+        it are rejected by the server if they write. Writes go through
+        execute_write transaction functions, which set their own mode.
+        """
+        if self._bound_session.get() is None:
+            self._bound_session.set(
+                self.driver.session(
+                    database=self.database, default_access_mode=READ_ACCESS
+                )
+            )
+
+    def release_session(self) -> None:
+        """Close the session opened by bind_session(), if any."""
+        session = self._bound_session.get()
+        if session is not None:
+            self._bound_session.set(None)
+            session.close()
+
     def close(self) -> None:
         """Close the connection to the database.
 
@@ -129,15 +379,33 @@ class GraphDBDriver:
         self.logger.info("Neo4j driver closed.")
 
     def execute(
-        self, query: str, parameters: Optional[dict] = None, write: bool = False
-    ) -> list[dict]:
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        write: bool = False,
+        result_format: str = "dict",
+        return_data: bool = True,
+    ) -> Any:
         """Execute a Cypher query and return raw result data.
 
         This method runs the given Cypher query against the Neo4j database
-        using the active driver session. It automatically manages session
-        lifecycle and returns the raw query results as a list of dictionaries
-        (one per record). On failure, it raises a RuntimeError with detailed
-        information about the query and parameters.
+        using the session bound by bind_session(), or a new session whose
+        lifecycle it manages, and returns the raw query results as a list
+        of dictionaries (one per record). On failure, it raises a
+        RuntimeError with detailed information about the query and
+        parameters.
+
+        For large results of a known shape, ``result_format="columns"``
+        skips the per-record dict conversion and returns
+        ``{"keys": [...], "rows": [[...], ...]}``. Column values are
+        returned as the driver yields them, so queries should return
+        scalars or maps (e.g. ``properties(n)``) rather than graph entities.
+        ``result_format="raw"`` returns the neo4j Record objects, detached
+        from the consumed result.
+
+        Writes whose result is not needed can pass ``return_data=False``;
+        the result is then consumed without reading any records and None
+        is returned.
 
         Args:
             query: The Cypher query to execute.
@@ -145,33 +413,70 @@ class GraphDBDriver:
                 Defaults to None.
             write: Whether this is a write operation. If True, uses
                 execute_write for transactional guarantees. Defaults to False.
+            result_format: One of "dict", "columns" or "raw".
+                Defaults to "dict".
+            return_data: Whether to read and return the records. Only
+                honoured for write queries. Defaults to True.
 
         Returns:
-            list[dict]: The result records as dictionaries.
+            list[dict] | dict | list[Record] | None: The result records as
+                dictionaries, a keys/rows mapping, or raw records depending
+                on result_format; None for writes with return_data=False.
 
         Raises:
+            ValueError: If result_format is not supported.
             RuntimeError: If the query execution fails, with details about
                 the query, parameters, and underlying exception.
         """
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(f"Unsupported result format: {result_format}")
 
         def _execute_query(tx):
             """Execute query within transaction and consume results."""
             result = tx.run(query, parameters or {})
             # CRITICAL: Consume results INSIDE the transaction
+            if write and not return_data:
+                result.consume()
+                return None
+            if result_format == "columns":
+                keys = list(result.keys())
+                return {"keys": keys, "rows": [list(record.values()) for record in result]}
+            if result_format == "raw":
+                return list(result)
             return [record.data() for record in result]
 
+        bound_session = self._bound_session.get()
+        session_context = (
+            nullcontext(bound_session)
+            if bound_session is not None
+            else self.driver.session(database=self.database)
+        )
+
         try:
-            # Open session using context manager for automatic cleanup
-            with self.driver.session() as session:
+            # Reuse the bound session, or open one with automatic cleanup
+            with session_context as session:
                 # Use appropriate transaction function based on operation type
                 if write:
                     data = session.execute_write(_execute_query)
-                    self.logger.info("Write query executed: %s with params: %s", query, parameters)
+                    self.invalidate()
                 else:
                     data = session.execute_read(_execute_query)
-                    self.logger.info("Read query executed: %s with params: %s", query, parameters)
 
-                self.logger.debug("Query returned %d records", len(data))
+                # Per-query logging is DEBUG only; INFO is for lifecycle events
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    if data is None:
+                        count = 0
+                    elif result_format == "columns":
+                        count = len(data["rows"])
+                    else:
+                        count = len(data)
+                    self.logger.debug(
+                        "Query executed (%s, %d records): %s params=%r",
+                        "W" if write else "R",
+                        count,
+                        query,
+                        parameters,
+                    )
 
                 return data
 
@@ -181,8 +486,182 @@ class GraphDBDriver:
                 f"Query failed: {e}\nQuery: {query}\nParams: {parameters}"
             ) from e
 
-    def run_safe_query(
+    def execute_stream(
         self, query: str, parameters: Optional[dict] = None
+    ) -> Iterator[dict]:
+        """Execute a read query and yield records one at a time.
+
+        Unlike execute(), records are not collected into a list first, so
+        memory stays flat for large results and the caller can start
+        sending data as soon as the first records arrive.
+
+        Records are read from the session bound by bind_session(), or from
+        a new session that stays open until the generator is exhausted or
+        closed. Both are opened with READ_ACCESS, so the server rejects
+        writes the keyword check misses (e.g. write procedures called
+        with CALL). A bound session must not be released while
+        the generator is still being consumed; in Flask, wrap it in
+        stream_with_context() so teardown runs after the last record.
+
+        Args:
+            query: The Cypher query to execute.
+            parameters: Query parameters for parameterized queries.
+                Defaults to None.
+
+        Yields:
+            dict: One result record as a dictionary.
+
+        Raises:
+            RuntimeError: If the query contains write keywords or fails,
+                with details about the query and parameters.
+        """
+        if _has_write_keyword(query):
+            raise RuntimeError(f"Write keyword in read query\nQuery: {query}")
+
+        bound_session = self._bound_session.get()
+        session_context = (
+            nullcontext(bound_session)
+            if bound_session is not None
+            else self.driver.session(
+                database=self.database, default_access_mode=READ_ACCESS
+            )
+        )
+
+        try:
+            with session_context as session:
+                for record in session.run(query, parameters or {}):
+                    yield record.data()
+
+        except Exception as e:
+            self.logger.error("Streaming query failed: %s", e)
+            raise RuntimeError(
+                f"Query failed: {e}\nQuery: {query}\nParams: {parameters}"
+            ) from e
+
+    def execute_batch(
+        self,
+        query: str,
+        rows: list[dict],
+        batch_size: int = 1000,
+        param_name: str = "rows",
+    ) -> list[dict]:
+        """Execute an UNWIND write query over rows in fixed-size chunks.
+
+        The query is expected to start with ``UNWIND $<param_name> AS ...``.
+        Each chunk runs in its own write transaction; all chunks share the
+        session bound by bind_session(), or one new session, so a large
+        import costs one round-trip and one commit per chunk instead of
+        one per row.
+
+        Args:
+            query: The UNWIND Cypher query to execute.
+            rows: Parameter dicts, one per row.
+            batch_size: Number of rows per transaction. Defaults to 1000.
+            param_name: Name of the list parameter in the query.
+                Defaults to "rows".
+
+        Returns:
+            list[dict]: The records returned by every chunk, in order.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+            RuntimeError: If a chunk fails, with details about the query
+                and the failing chunk offset. Earlier chunks stay committed.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        def _run_chunk(tx, chunk):
+            """Run one chunk and read its records inside the transaction."""
+            return [record.data() for record in tx.run(query, {param_name: chunk})]
+
+        bound_session = self._bound_session.get()
+        session_context = (
+            nullcontext(bound_session)
+            if bound_session is not None
+            else self.driver.session(database=self.database)
+        )
+
+        records: list[dict] = []
+        offset = 0
+        try:
+            with session_context as session:
+                for offset in range(0, len(rows), batch_size):
+                    chunk = rows[offset:offset + batch_size]
+                    records.extend(session.execute_write(_run_chunk, chunk))
+                    self.logger.debug(
+                        "Batch chunk written: rows %d-%d",
+                        offset,
+                        offset + len(chunk),
+                    )
+
+            self.invalidate()
+            self.logger.debug(
+                "Batch query executed: %d rows in chunks of %d", len(rows), batch_size
+            )
+            return records
+
+        except Exception as e:
+            self.logger.error("Batch execution failed at row %d: %s", offset, e)
+            raise RuntimeError(
+                f"Batch query failed at row {offset}: {e}\nQuery: {query}"
+            ) from e
+
+    def run_read_many(
+        self, queries: list[tuple[str, Optional[dict]]]
+    ) -> ResultWrapper:
+        """Run several read queries in a single read transaction.
+
+        Callers that need more than one query pay transaction setup and
+        retry handling once instead of once per query. The queries see a
+        consistent snapshot; if one fails, none of the results are returned.
+        Results are not cached.
+
+        Args:
+            queries: (query, parameters) tuples, run in order.
+
+        Returns:
+            ResultWrapper: On success, data holds one list of record dicts
+                per query, in the order of queries.
+        """
+        if any(_has_write_keyword(query) for query, _ in queries):
+            self.logger.warning("Rejected write keyword in read query")
+            return ResultWrapper(success=False, error="Write keyword in read query")
+
+        normalized = [self._normalize(query, params)[:2] for query, params in queries]
+
+        def _run_all(tx):
+            """Run every query in the same transaction and read all records."""
+            return [
+                [record.data() for record in tx.run(query, params or {})]
+                for query, params in normalized
+            ]
+
+        bound_session = self._bound_session.get()
+        session_context = (
+            nullcontext(bound_session)
+            if bound_session is not None
+            else self.driver.session(
+                database=self.database, default_access_mode=READ_ACCESS
+            )
+        )
+
+        try:
+            with session_context as session:
+                data = session.execute_read(_run_all)
+            self.logger.debug("Read transaction executed: %d queries", len(queries))
+            return ResultWrapper(success=True, data=data)
+
+        except Exception as e:
+            self.logger.error("Read transaction failed: %s", e)
+            return ResultWrapper(success=False, error=f"Query failed: {e}")
+
+    def run_safe_query(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        result_format: str = "dict",
+        use_cache: bool = True,
     ) -> ResultWrapper:
         """Execute a Cypher query safely and return a standardized result object.
 
@@ -192,23 +671,54 @@ class GraphDBDriver:
         to the caller, making it suitable for batch jobs, GUIs, or APIs where
         graceful error handling is required.
 
-        Note: This method only supports read operations. For write operations,
-        use the execute() method directly.
+        Note: This method only supports read operations. Queries containing
+        write keywords are rejected without contacting the database. For
+        write operations, use the execute() method directly.
+
+        The query is normalized first (see _normalize_query), so inlined
+        LIMIT values and string comparisons are sent as parameters.
+        Successful results of read queries are cached for a short TTL keyed
+        by the normalized query and parameters. Each call returns its own
+        deep copy of the cached data, so callers may modify it.
 
         Args:
             query: The Cypher query to execute.
             parameters: Query parameters for parameterized queries.
                 Defaults to None.
+            result_format: Result shape passed to execute().
+                Defaults to "dict".
+            use_cache: If False, skip the cache lookup and run the query;
+                the fresh result still replaces the cached one.
+                Defaults to True.
 
         Returns:
             ResultWrapper: An object containing success status, data, and
                 error info. Use the boolean evaluation or .success attribute
                 to check if the operation succeeded.
         """
+        if _has_write_keyword(query):
+            self.logger.warning("Rejected write keyword in read query")
+            return ResultWrapper(success=False, error="Write keyword in read query")
+
+        query, parameters, digest = self._normalize(query, parameters)
+
+        cache_key = self._cache_key(digest, parameters, result_format)
+        if cache_key is not None and use_cache:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Query cache hit: %s", digest)
+                return ResultWrapper(success=True, data=_copy_result(cached))
+
         try:
-            data = self.execute(query, parameters)
+            data = self.execute(query, parameters, result_format=result_format)
+            if cache_key is not None:
+                self._query_cache.set(cache_key, _copy_result(data))
             return ResultWrapper(success=True, data=data)
 
+        except ValueError as e:
+            self.logger.error("Invalid query call: %s", e)
+            return ResultWrapper(success=False, error=str(e))
+
         except RuntimeError as e:
             # Expected: execute() raises RuntimeError on query failures
             # (execute() already logged the error)
@@ -220,3 +730,53 @@ class GraphDBDriver:
             # since this is a "safe" wrapper
             self.logger.exception("Unexpected error in run_safe_query")
             return ResultWrapper(success=False, error=f"Unexpected error: {str(e)}")
+
+    @staticmethod
+    def _normalize(
+        query: str, parameters: Optional[dict]
+    ) -> tuple[str, Optional[dict], str]:
+        """Normalize a query and merge extracted literals into its parameters.
+
+        Args:
+            query: The Cypher query.
+            parameters: Query parameters supplied by the caller.
+
+        Returns:
+            tuple: (query, parameters, digest). The original query and
+                parameters are returned unchanged if an extracted parameter
+                name would clash with a caller parameter.
+        """
+        normalized, literals, digest = _normalize_query(query)
+        if not literals:
+            return normalized, parameters, digest
+
+        parameters = parameters or {}
+        if any(name in parameters for name, _ in literals):
+            return query, parameters, hashlib.blake2b(
+                query.encode(), digest_size=16
+            ).hexdigest()
+        return normalized, {**parameters, **dict(literals)}, digest
+
+    def _cache_key(
+        self, query: str, parameters: Optional[dict], result_format: str = "dict"
+    ) -> Optional[tuple]:
+        """Build the result cache key for a read query.
+
+        Args:
+            query: The normalized query digest or query text.
+            parameters: Query parameters.
+            result_format: Result shape the data is returned in.
+
+        Returns:
+            tuple or None: The key, or None if the query must not be cached
+                (cache disabled or unhashable parameters).
+        """
+        if self._query_cache is None:
+            return None
+
+        key = (query, result_format, tuple(sorted((parameters or {}).items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
@@ -6,28 +6,43 @@ for consistent logging across all modules.
 """
 import logging
 
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s] [%(levelname)s] %(name)s: %(message)s",
+    "%Y-%m-%d %H:%M:%S"
+)
+
+# Loggers already configured by setup_logger, keyed by name
+_CACHE: dict[str, logging.Logger] = {}
+
 
 def setup_logger(name: str, level=logging.INFO) -> logging.Logger:
     """
     Create and configure a logger with specified name and level.
-    
+
+    Each logger gets its StreamHandler once; later calls with the same
+    name only update the level. Loggers do not propagate to the root
+    logger, so records are not handled twice.
+
     Args:
         name: Logger name
         level: Logging level (default: INFO)
-    
+
     Returns:
         Configured logger instance with StreamHandler
     """
+    logger = _CACHE.get(name)
+    if logger is not None:
+        logger.setLevel(level)
+        return logger
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
 
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "[%(asctime)s] [%(levelname)s] %(name)s: %(message)s",
-            "%Y-%m-%d %H:%M:%S"
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
 
+    _CACHE[name] = logger
     return logger
@@ -5,18 +5,22 @@ All routes are in api/routes.py, all logic is in api/handlers.py.
 """
 
 import logging
-import os
 import sys
 
 from flask import Flask
 from flask_cors import CORS
 from neo4j.exceptions import AuthError, Neo4jError, ServiceUnavailable
 
-from src.driver import GraphDBDriver
+from src.api.json_provider import ORJSONProvider
+from src.config import settings
+from src.driver import GraphDBDriver, rust_codec_available
 from src.logger import setup_logger
+from src.services.autocomplete_service import AutocompleteService
+from src.services.query_builder import AdminQueryBuilder, SafeQueryBuilder
 
 # Initialize Flask
 app = Flask(__name__)
+app.json = ORJSONProvider(app)  # Encode responses with orjson
 CORS(app)  # Enable CORS for frontend communication
 
 # Initialize logger
@@ -26,31 +30,121 @@ logger = setup_logger("API", logging.INFO)
 DB_DRIVER = None
 
 
+@app.before_request
+def open_db_session():
+    """Bind one database session to the current request."""
+    if DB_DRIVER is not None:
+        DB_DRIVER.bind_session()
+
+
+@app.teardown_request
+def close_db_session(exc=None):
+    """Release the request's database session."""
+    if DB_DRIVER is not None:
+        DB_DRIVER.release_session()
+
+
+def _warmup_queries() -> list[tuple[str, dict]]:
+    """Return the queries run by _warmup().
+
+    The API queries are built with SafeQueryBuilder so their text matches
+    what the handlers send and Neo4j caches the same plans. The final scan
+    reads every node and relationship once to load the page cache.
+
+    Returns:
+        list: (query_string, parameters_dict) tuples.
+    """
+    builder = SafeQueryBuilder()
+    return [
+        builder.count_stats(),
+        builder.get_all_nodes(limit=100),
+        (
+            "MATCH (n) OPTIONAL MATCH (n)-[r]->() "
+            "RETURN count(n) AS nodes, count(r) AS relationships",
+            {},
+        ),
+    ]
+
+
+def _warmup(driver: GraphDBDriver) -> None:
+    """Pre-load Neo4j's plan and page caches before serving requests.
+
+    All queries run in one read transaction. Failures are logged and
+    ignored; warmup only affects latency.
+
+    Args:
+        driver: Connected driver instance.
+    """
+    result = driver.run_read_many(_warmup_queries())
+    if not result.success:
+        logger.warning("Warmup queries failed: %s", result.error)
+    logger.info("Database warmup completed")
+
+
+def _ensure_name_lc(driver: GraphDBDriver) -> None:
+    """Create the name_lc text indexes if they do not exist.
+
+    Autocomplete and search match on ``n.name_lc``. Only the idempotent
+    index queries run here, so worker startup stays fast; name_lc values
+    are backfilled by scripts/import_data.py. Failures are logged and
+    ignored.
+
+    Args:
+        driver: Connected driver instance.
+    """
+    for query, params in AdminQueryBuilder().name_lc_index_queries():
+        try:
+            driver.execute(query, params, write=True, return_data=False)
+        except RuntimeError as e:
+            logger.warning("name_lc maintenance query failed: %s", e)
+    logger.info("name_lc indexes ensured")
+
+
 def init_database() -> GraphDBDriver:
     """Initialize database connection with environmental variables.
 
+    All connection, pool and cache settings come from src.config
+    (NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD, NEO4J_DATABASE, LOG_LEVEL,
+    NEO4J_POOL_SIZE, NEO4J_ACQ_TIMEOUT, NEO4J_MAX_CONN_LIFETIME,
+    NEO4J_KEEP_ALIVE, QCACHE_SIZE, QCACHE_TTL). After the connection test the name_lc
+    indexes are created if missing. With NEO4J_WARMUP=1 the plan and
+    page caches are warmed as well.
+
     Returns:
         GraphDBDriver: Initialized driver instance.
 
     Raises:
         SystemExit: If connection fails.
     """
-    neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    neo4j_user = os.getenv("NEO4J_USER", "neo4j")
-    neo4j_password = os.getenv("NEO4J_PASSWORD", "password")
-    log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper())
-
-    logger.info("Connecting to Neo4j at %s", neo4j_uri)
+    logger.info("Connecting to Neo4j at %s", settings.neo4j_uri)
 
     try:
         driver = GraphDBDriver(
-            uri=neo4j_uri, user=neo4j_user, password=neo4j_password, log_level=log_level
+            uri=settings.neo4j_uri,
+            user=settings.neo4j_user,
+            password=settings.neo4j_password,
+            log_level=settings.log_level,
+            pool_size=settings.neo4j_pool_size,
+            acquisition_timeout=settings.neo4j_acq_timeout_sec,
+            max_connection_lifetime=settings.neo4j_max_conn_lifetime_sec,
+            keep_alive=settings.neo4j_keep_alive,
+            cache_size=settings.qcache_size,
+            cache_ttl=settings.qcache_ttl_sec,
+            database=settings.neo4j_database,
         )
         # Test connection
         result = driver.run_safe_query("RETURN 1 AS test")
         if not result.success:
             raise RuntimeError(f"Connection test failed: {result.error}")
         logger.info("Database connection established")
+        logger.info(
+            "Neo4j Rust PackStream codec: %s",
+            "enabled" if rust_codec_available() else "not installed",
+        )
+
+        _ensure_name_lc(driver)
+        if settings.warmup:
+            _warmup(driver)
         return driver
 
     except AuthError as e:
@@ -75,37 +169,68 @@ def init_database() -> GraphDBDriver:
         logger.exception("Unexpected error during database initialization")
         sys.exit(1)
 
-def main():
-    """Initialize and run the Flask application."""
+def get_driver() -> GraphDBDriver:
+    """Return the process-wide database driver.
+
+    The driver is created on first use and reused afterwards, so the
+    underlying Neo4j connection pool is shared by all handlers.
+
+    Returns:
+        GraphDBDriver: The shared driver instance.
+    """
     global DB_DRIVER
 
-    print("=" * 60)
-    print("Starting Flask Backend API")
-    print("=" * 60)
+    if DB_DRIVER is None:
+        DB_DRIVER = init_database()
+    return DB_DRIVER
+
+
+def init_app() -> Flask:
+    """Connect the database and register the API on the Flask app.
 
-    # Initialize database
-    DB_DRIVER = init_database()
+    Safe to call more than once; the driver and blueprint are only set up
+    on the first call. With AUTOCOMPLETE_INDEX=1 the autocomplete name
+    index is loaded and refreshed in the background. Used by main() for
+    the development server and by src.wsgi for production WSGI servers.
+
+    Returns:
+        Flask: The configured application.
+    """
+    driver = get_driver()
 
     # Import here to avoid circular dependencies and ensure proper initialization order
     from src.api import handlers  # pylint: disable=import-outside-toplevel
+    from src.api.routes import api_bp  # pylint: disable=import-outside-toplevel
 
-    handlers.init_handlers(DB_DRIVER)
+    if "api" not in app.blueprints:
+        autocomplete_svc = AutocompleteService(driver)
+        if settings.autocomplete_index:
+            autocomplete_svc.start_index_refresh(
+                settings.autocomplete_index_refresh_sec,
+                settings.autocomplete_index_max,
+            )
+        handlers.init_handlers(driver, autocomplete_svc)
+        app.register_blueprint(api_bp)
+    return app
 
-    # Register routes blueprint
-    from src.api.routes import api_bp
 
-    app.register_blueprint(api_bp)
+def main():
+    """Initialize and run the Flask development server.
 
-    # Get configuration
-    host = os.getenv("FLASK_HOST", "0.0.0.0")
+    For production use a WSGI server with src.wsgi:app, e.g.
+    ``gunicorn -k gthread -w 2 --threads 8 src.wsgi:app``.
+    """
+    print("=" * 60)
+    print("Starting Flask Backend API")
+    print("=" * 60)
 
-    # port is int but getenv returns string,
-    try:
-        port = int(os.getenv("FLASK_PORT", "8000"))
-    except ValueError:
-        logger.warning("Invalid FLASK_PORT, using default 8000")
-        port = 8000
-    debug = os.getenv("FLASK_DEBUG", "False").lower() == "true"
+    init_app()
+    driver = get_driver()
+
+    # Get configuration
+    host = settings.flask_host
+    port = settings.flask_port
+    debug = settings.flask_debug
 
     print(f"API running at: http://{host}:{port}")
     print(f"Health check: http://{host}:{port}/api/health")
@@ -113,13 +238,13 @@ def main():
     print("=" * 60)
 
     try:
-        app.run(host=host, port=port, debug=debug)
+        # Threaded so Neo4j round-trips of concurrent requests overlap
+        app.run(host=host, port=port, debug=debug, threaded=True)
     except KeyboardInterrupt:
         print("\n\nShutting down gracefully...")
     finally:
-        if DB_DRIVER:
-            DB_DRIVER.close()
-            logger.info("Database connection closed")
+        driver.close()
+        logger.info("Database connection closed")
         print("Goodbye!")
 
 
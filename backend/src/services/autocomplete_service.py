@@ -4,10 +4,15 @@ This module provides autocomplete functionality for searching
 nodes in the Neo4j database using the SafeQueryBuilder.
 """
 
+import heapq
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future
 from typing import Optional
 
 from neo4j.exceptions import Neo4jError, ServiceUnavailable, SessionExpired
 
+from src.cache import TTLCache
 from src.driver import GraphDBDriver, ResultWrapper
 from src.logger import setup_logger
 from src.services.query_builder import QueryValidationError, SafeQueryBuilder
@@ -22,16 +27,252 @@ class AutocompleteService:
     - Properly parameterized
     - Validated
     - Consistent with the rest of the application
+
+    Successful suggestion and fuzzy search results are kept in a short-lived
+    LRU cache keyed on the case-folded search term and filters, because the
+    frontend repeats the same prefixes on every keystroke.
+
+    Optionally, all node names can be loaded into an in-memory index
+    (see refresh_index and start_index_refresh). While the index is loaded,
+    prefix suggestions and fuzzy searches without a time filter are
+    answered from memory.
+
+    Attributes:
+        MIN_PREFIX_LEN (int): Search terms shorter than this (after
+            stripping) return no results without querying the database.
     """
 
-    def __init__(self, driver: GraphDBDriver):
+    MIN_PREFIX_LEN = 3
+
+    def __init__(
+        self,
+        driver: GraphDBDriver,
+        cache_size: int = 10_000,
+        cache_ttl: float = 60.0,
+    ):
         """Initialize the autocomplete service.
 
         Args:
             driver: The Neo4j database driver instance.
+            cache_size: Maximum number of cached result lists (default: 10000).
+            cache_ttl: Seconds a cached result list is reused (default: 60).
         """
         self.driver = driver
         self.query_builder = SafeQueryBuilder(max_results=100)
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # label (None for all labels) -> (lowercased names, suggestion rows),
+        # both sorted by lowercased name; replaced as a whole on refresh
+        self._name_index: Optional[dict] = None
+        self._refresh_timer: Optional[threading.Timer] = None
+
+    def clear_cache(self) -> None:
+        """Drop all cached suggestion results."""
+        self._cache.clear()
+
+    def refresh_index(self, max_nodes: int = 100_000) -> bool:
+        """Load all node names into the in-memory prefix index.
+
+        If the query fails the previous index is kept. If the database holds
+        more than max_nodes named nodes the index is dropped, because an
+        incomplete index would hide matches; suggestions then go to Neo4j.
+
+        Args:
+            max_nodes: Maximum number of nodes to hold in memory.
+
+        Returns:
+            bool: True if the index was rebuilt.
+        """
+        try:
+            # An empty prefix matches every named node
+            query, params = self.query_builder.search_nodes(
+                search_property="name",
+                search_value="",
+                match_type="starts_with",
+                limit=max_nodes + 1,
+                include_metadata=True,
+            )
+            result = self.driver.run_safe_query(query, params, use_cache=False)
+        except Exception:
+            logger.exception("Failed to load autocomplete index")
+            return False
+
+        if not result.success:
+            logger.warning("Failed to load autocomplete index: %s", result.error)
+            return False
+
+        if len(result.data) > max_nodes:
+            logger.warning(
+                "More than %d named nodes, autocomplete index disabled", max_nodes
+            )
+            self._name_index = None
+            return False
+
+        index: dict = {}
+        rows = sorted(result.data, key=lambda r: (r["name"].lower(), r["name"]))
+        for row in rows:
+            item = {"name": row["name"], "label": row["label"], "id": row["id"]}
+            for key in (None, row["label"]):
+                names, items = index.setdefault(key, ([], []))
+                names.append(row["name"].lower())
+                items.append(item)
+
+        self._name_index = index
+        logger.info("Autocomplete index loaded with %d names", len(rows))
+        return True
+
+    def invalidate_index(self) -> None:
+        """Drop the prefix index and cached results after a data change.
+
+        Suggestions go to Neo4j until the next refresh_index call.
+        """
+        self._name_index = None
+        self._cache.clear()
+
+    def start_index_refresh(self, interval: float, max_nodes: int = 100_000) -> None:
+        """Load the prefix index now and reload it every interval seconds.
+
+        Args:
+            interval: Seconds between refreshes.
+            max_nodes: Maximum number of nodes to hold in memory.
+        """
+        self.refresh_index(max_nodes)
+
+        def _tick():
+            self.refresh_index(max_nodes)
+            self._schedule_refresh(interval, _tick)
+
+        self._schedule_refresh(interval, _tick)
+
+    def stop_index_refresh(self) -> None:
+        """Cancel the periodic index refresh, if running."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def _schedule_refresh(self, interval: float, func) -> None:
+        """Run func once after interval seconds on a daemon timer thread."""
+        timer = threading.Timer(interval, func)
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def _lookup_prefix(
+        self, prefix: str, label: Optional[str], limit: int
+    ) -> Optional[list]:
+        """Return suggestions for prefix from the in-memory index.
+
+        Args:
+            prefix: The text prefix to match, case-insensitively.
+            label: Optional node label to filter by.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            list | None: Matching rows ordered by name, as the database
+                query orders them, or None if no index is loaded.
+        """
+        index = self._name_index
+        if index is None:
+            return None
+
+        names, items = index.get(label, ((), ()))
+        needle = prefix.lower()
+        # Matches are contiguous in the lowercased order, but are returned
+        # in ORDER BY n.name order so both paths agree on which rows a
+        # limited result keeps
+        start = end = bisect_left(names, needle)
+        while end < len(names) and names[end].startswith(needle):
+            end += 1
+        ranked = heapq.nsmallest(
+            limit, ((items[i]["name"], i) for i in range(start, end))
+        )
+        return [dict(items[i]) for _, i in ranked]
+
+    def _lookup_substring(
+        self, term: str, label: Optional[str], limit: int
+    ) -> Optional[list]:
+        """Return fuzzy search results for term from the in-memory index.
+
+        Rows are ranked like fuzzy_search_nodes: names starting with term
+        (relevance 1) before names only containing it (relevance 2), then
+        by name.
+
+        Args:
+            term: The text to find anywhere in a name, case-insensitively.
+            label: Optional node label to filter by.
+            limit: Maximum number of results.
+
+        Returns:
+            list | None: Matching rows with a relevance key, or None if no
+                index is loaded.
+        """
+        index = self._name_index
+        if index is None:
+            return None
+
+        names, items = index.get(label, ((), ()))
+        needle = term.lower()
+        ranked = heapq.nsmallest(
+            limit,
+            (
+                (1 if name.startswith(needle) else 2, items[i]["name"], i)
+                for i, name in enumerate(names)
+                if needle in name
+            ),
+        )
+        return [
+            {**items[i], "relevance": relevance} for relevance, _, i in ranked
+        ]
+
+    def _run_cached(self, key: tuple, query: str, params: dict) -> ResultWrapper:
+        """Run a read query, serving repeated keys from the result cache.
+
+        Only successful results are cached. Callers receive a fresh list
+        so that appending to ``result.data`` does not alter the cache.
+        Concurrent callers with the same key share a single in-flight query
+        instead of each sending their own. The driver's result cache is
+        skipped, so a result is never older than this cache's TTL.
+
+        Args:
+            key: Normalized request tuple identifying the search.
+            query: The Cypher query to run on a cache miss.
+            params: Parameters for the query.
+
+        Returns:
+            ResultWrapper: The cached or freshly queried result.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return ResultWrapper(success=True, data=list(cached))
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            result = future.result()
+            if result.success and isinstance(result.data, tuple):
+                return ResultWrapper(success=True, data=list(result.data))
+            return result
+
+        try:
+            result = self.driver.run_safe_query(query, params, use_cache=False)
+            if result.success and isinstance(result.data, list):
+                self._cache.set(key, tuple(result.data))
+                future.set_result(ResultWrapper(success=True, data=tuple(result.data)))
+            else:
+                future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def suggest_node_names(
         self,
@@ -63,13 +304,23 @@ class AutocompleteService:
                     {'name': 'Shadow Malware', 'label': 'Malware', 'id': '5:def456'}
                 ]
         """
-        # Sanitize input
-        if not prefix or len(prefix.strip()) == 0:
+        # Sanitize input; short prefixes match too much to be useful
+        prefix = (prefix or "").strip()
+        if len(prefix) < self.MIN_PREFIX_LEN:
             return ResultWrapper(success=True, data=[])
 
-        prefix = prefix.strip()
+        key = ("suggest", prefix.lower(), label, limit, start_date, end_date)
 
         try:
+            if self._name_index is not None and not (start_date and end_date):
+                if label:
+                    self.query_builder.validate_label(label)
+                matches = self._lookup_prefix(
+                    prefix, label, limit or self.query_builder.max_results
+                )
+                if matches is not None:
+                    return ResultWrapper(success=True, data=matches)
+
             # Check if time filtering is requested
             if start_date and end_date:
                 # Use time-aware query
@@ -94,10 +345,8 @@ class AutocompleteService:
                     include_metadata=True,
                 )
 
-            # Execute query
-            result = self.driver.run_safe_query(query, params)
-
-            return result
+            # Execute query (hot prefixes are served from the cache)
+            return self._run_cached(key, query, params)
 
         except QueryValidationError as e:
             # Exception: Invalid Label/Properties
@@ -149,12 +398,22 @@ class AutocompleteService:
                     {'name': 'AttackShadow', 'label': 'Campaign', 'id': '7:xyz', 'relevance': 2}
                 ]
         """
-        if not search_term or len(search_term.strip()) == 0:
+        search_term = (search_term or "").strip()
+        if len(search_term) < self.MIN_PREFIX_LEN:
             return ResultWrapper(success=True, data=[])
 
-        search_term = search_term.strip()
+        key = ("fuzzy", search_term.lower(), label, limit, start_date, end_date)
 
         try:
+            if self._name_index is not None and not (start_date and end_date):
+                if label:
+                    self.query_builder.validate_label(label)
+                matches = self._lookup_substring(
+                    search_term, label, limit or self.query_builder.max_results
+                )
+                if matches is not None:
+                    return ResultWrapper(success=True, data=matches)
+
             # Check if time filtering is requested
             if start_date and end_date:
                 # Use time-aware query with CONTAINS matching
@@ -178,10 +437,8 @@ class AutocompleteService:
                     include_metadata=True,
                 )
 
-            # Execute query
-            result = self.driver.run_safe_query(query, params)
-
-            return result
+            # Execute query (hot prefixes are served from the cache)
+            return self._run_cached(key, query, params)
 
         except QueryValidationError as e:
             logger.warning("Invalid fuzzy search parameters: %s", e)
@@ -209,6 +466,7 @@ class AutocompleteService:
         """Check if a node with given name exists.
 
         This is a lightweight check that returns only boolean result.
+        It is a single-name call of check_nodes_exist.
 
         Args:
             name: The exact node name to check.
@@ -216,15 +474,36 @@ class AutocompleteService:
 
         Returns:
             ResultWrapper: Contains existence check result.
-                Example data: [{'exists': True, 'count': 1}]
+                Example data: [{'name': 'APT28', 'exists': True}]
+        """
+        return self.check_nodes_exist([name], label=label)
+
+    def check_nodes_exist(
+        self, names: list[str], label: Optional[str] = None
+    ) -> ResultWrapper:
+        """Check several node names for existence in one query.
+
+        Args:
+            names: The exact node names to check.
+            label: Optional node label to filter by.
+
+        Returns:
+            ResultWrapper: One row per name, in the order of names.
+                Example data: [
+                    {'name': 'APT28', 'exists': True},
+                    {'name': 'Unknown', 'exists': False}
+                ]
         """
         try:
-            # Use query builder for efficient existence check
-            # Returns only count and boolean, not full node data
-            query, params = self.query_builder.check_node_exists(
-                property_name="name", property_value=name, label=label
+            # Use query builder for a batched existence check
+            # Returns only a boolean per name, not full node data
+            query, params = self.query_builder.check_nodes_exist(
+                property_name="name", property_values=names, label=label
             )
 
+            if not names:
+                return ResultWrapper(success=True, data=[])
+
             result = self.driver.run_safe_query(query, params)
 
             return result
@@ -234,24 +513,24 @@ class AutocompleteService:
             return ResultWrapper(success=False, error=f"Invalid parameters: {str(e)}")
 
         except (ServiceUnavailable, SessionExpired) as e:
-            logger.error("Database connection error in check_node_exists: %s", e)
+            logger.error("Database connection error in check_nodes_exist: %s", e)
             return ResultWrapper(success=False, error="Database temporarily unavailable")
 
         except Neo4jError as e:
-            logger.error("Database error in check_node_exists: %s", e)
+            logger.error("Database error in check_nodes_exist: %s", e)
             return ResultWrapper(success=False, error=f"Database error: {str(e)}")
 
         except Exception as e:
             logger.exception(
-                "Unexpected error in check_node_exists with name='%s', label=%s",
-                name,
+                "Unexpected error in check_nodes_exist with %d names, label=%s",
+                len(names),
                 label
             )
             return ResultWrapper(success=False, error="An unexpected error occurred")
 
 
     def get_all_node_names(
-        self, label: Optional[str] = None, max_nodes: int = 1000
+        self, label: Optional[str] = None, max_nodes: int = 1000, use_cache: bool = True
     ) -> ResultWrapper:
         """Get all node names for frontend caching.
 
@@ -261,6 +540,8 @@ class AutocompleteService:
         Args:
             label: Optional node label to filter by.
             max_nodes: Maximum number of names to return (safety limit).
+            use_cache: Whether the driver's result cache may serve the
+                query. Callers with their own cache pass False.
 
         Returns:
             ResultWrapper: Contains all node names.
@@ -272,17 +553,22 @@ class AutocompleteService:
         """
         try:
             # Use query builder for bulk name retrieval
-            # Returns DISTINCT names with labels for frontend caching
+            # Returns DISTINCT names with labels for frontend caching,
+            # collected into one record to avoid per-row Bolt overhead
             query, params = self.query_builder.get_all_node_names(
                 label=label,
                 property_name="name",
                 limit=max_nodes,
                 include_metadata=True,
+                as_list=True,
             )
 
-            result = self.driver.run_safe_query(query, params)
+            result = self.driver.run_safe_query(query, params, use_cache=use_cache)
+            if not result.success:
+                return result
 
-            return result
+            rows = result.data[0]["rows"] if result.data else []
+            return ResultWrapper(success=True, data=rows)
 
         except QueryValidationError as e:
             logger.warning("Invalid get all names parameters: %s", e)
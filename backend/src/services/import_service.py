@@ -8,19 +8,22 @@ reporting.
 
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from neo4j.exceptions import Neo4jError
 
+from src.constants import ALLOWED_LABELS, ALLOWED_PROPERTIES, ALLOWED_RELATIONSHIPS
 from src.driver import GraphDBDriver
 from src.logger import setup_logger
 from src.services.query_builder import AdminQueryBuilder, QueryValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportResult:
     """Result of a data import operation.
 
@@ -70,22 +73,40 @@ class ImportService:
     - Batch importing nodes and relationships
     - Error handling and reporting
     - Transaction management
+
+    Batch queries are executed in chunks of batch_size rows, one write
+    transaction per chunk, so a large label or pattern does not have to fit
+    into a single transaction. Labels are imported in parallel on up to
+    max_workers threads; relationships are imported serially.
     """
 
-    def __init__(self, driver: GraphDBDriver, log_level: int = logging.INFO):
+    def __init__(
+        self,
+        driver: GraphDBDriver,
+        log_level: int = logging.INFO,
+        batch_size: int = 1000,
+        max_workers: int = 8,
+    ):
         """Initialize the import service.
 
         Args:
             driver: Neo4j database driver.
             log_level: Logging level (default: INFO).
+            batch_size: Maximum rows per write transaction (default: 1000).
+            max_workers: Maximum labels imported concurrently (default: 8).
         """
         self.driver = driver
         self.builder = AdminQueryBuilder()
         self.logger = setup_logger("ImportService", log_level)
+        self.batch_size = batch_size
+        self.max_workers = max_workers
 
     def load_json_file(self, filepath: str) -> Dict[str, Any]:
         """Load and parse JSON file.
 
+        The file is read as bytes and parsed with orjson, which is several
+        times faster than the json module on large exports.
+
         Args:
             filepath: Path to JSON file.
 
@@ -94,7 +115,8 @@ class ImportService:
 
         Raises:
             FileNotFoundError: If file doesn't exist.
-            json.JSONDecodeError: If file is not valid JSON.
+            json.JSONDecodeError: If file is not valid JSON (orjson's
+                JSONDecodeError is a subclass).
         """
         path = Path(filepath)
 
@@ -103,10 +125,10 @@ class ImportService:
 
         self.logger.info("Loading JSON file: %s", filepath)
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = path.read_bytes()
+        data = orjson.loads(raw)
 
-        self.logger.info("Loaded JSON file (%d bytes)", path.stat().st_size)
+        self.logger.info("Loaded JSON file (%d bytes)", len(raw))
         return data
 
     def validate_json_structure(self, data: Dict[str, Any]) -> List[str]:
@@ -154,6 +176,18 @@ class ImportService:
         """
         errors = []
         warnings = []
+        # Labels and property names repeat across nodes, so check the
+        # distinct names against the whitelists with set operations up
+        # front. The loop below only calls the builder for names that are
+        # not allowed, to report them per node.
+        valid_labels = ALLOWED_LABELS.intersection(
+            node["label"] for node in nodes
+            if isinstance(node.get("label"), str)
+        )
+        valid_props = ALLOWED_PROPERTIES.intersection(set().union(
+            *(node["properties"] for node in nodes
+              if isinstance(node.get("properties"), dict))
+        ))
 
         for idx, node in enumerate(nodes):
             # Check required fields
@@ -166,10 +200,11 @@ class ImportService:
                 continue
 
             # Validate label
-            try:
-                self.builder.validate_label(node["label"])
-            except QueryValidationError as e:
-                errors.append(f"Node {idx}: {str(e)}")
+            if node["label"] not in valid_labels:
+                try:
+                    self.builder.validate_label(node["label"])
+                except QueryValidationError as e:
+                    errors.append(f"Node {idx}: {str(e)}")
 
             # Validate properties
             properties = node["properties"]
@@ -186,6 +221,8 @@ class ImportService:
 
             # Validate each property name
             for prop_name in properties.keys():
+                if prop_name in valid_props:
+                    continue
                 try:
                     self.builder.validate_property(prop_name)
                 except QueryValidationError as e:
@@ -197,45 +234,51 @@ class ImportService:
         self,
         relationships: List[Dict[str, Any]],
         existing_nodes: Optional[List[Dict[str, Any]]] = None,
+        max_ref_warnings: int = 100,
     ) -> tuple[List[str], List[str]]:
         """Validate relationship data.
 
         Args:
             relationships: List of relationship objects.
             existing_nodes: Optional list of nodes to check references.
+            max_ref_warnings: Stop checking references after this many
+                "Referenced node not found" warnings (default: 100).
 
         Returns:
             Tuple of (errors, warnings).
         """
         errors = []
         warnings = []
-
-        # Build node index if provided
-        node_index = {}
-        if existing_nodes:
-            for node in existing_nodes:
-                label = node.get("label")
-                props = node.get("properties", {})
-                # Index by label and name
-                if "name" in props:
-                    key = f"{label}:{props['name']}"
-                    node_index[key] = node
+        ref_warnings = 0
+
+        # Build node index if provided: a set of (label, name) pairs.
+        # Malformed nodes (non-string label or name) are left out
+        node_index: set[tuple[str, str]] = {
+            (node["label"], props["name"])
+            for node in existing_nodes or ()
+            if isinstance(node.get("label"), str)
+            and isinstance(props := node.get("properties"), dict)
+            and isinstance(props.get("name"), str)
+        }
+        check_refs = bool(node_index)
 
         for idx, rel in enumerate(relationships):
-            # Check required fields
-            required_fields = ["type", "from", "to"]
-            for field in required_fields:
-                if field not in rel:
-                    errors.append(f"Relationship {idx}: Missing '{field}' field")
-
-            if len(errors) > idx:  # Skip further validation if missing required fields
+            # Check required fields; skip further validation if any is missing
+            missing = [f for f in ("type", "from", "to") if f not in rel]
+            if missing:
+                errors.extend(
+                    f"Relationship {idx}: Missing '{field}' field"
+                    for field in missing
+                )
                 continue
 
-            # Validate relationship type
-            try:
-                self.builder.validate_relationship(rel["type"])
-            except QueryValidationError as e:
-                errors.append(f"Relationship {idx}: {str(e)}")
+            # Names are checked against the whitelists directly; the builder
+            # is only called for disallowed names, to get its error message
+            if rel["type"] not in ALLOWED_RELATIONSHIPS:
+                try:
+                    self.builder.validate_relationship(rel["type"])
+                except QueryValidationError as e:
+                    errors.append(f"Relationship {idx}: {str(e)}")
 
             # Validate 'from' and 'to' structure
             for direction in ["from", "to"]:
@@ -254,33 +297,60 @@ class ImportService:
                         )
 
                 # Validate label
-                if "label" in node_ref:
+                if "label" in node_ref and not isinstance(node_ref["label"], str):
+                    errors.append(
+                        f"Relationship {idx}: '{direction}.label' must be a string"
+                    )
+                elif "label" in node_ref and node_ref["label"] not in ALLOWED_LABELS:
                     try:
                         self.builder.validate_label(node_ref["label"])
                     except QueryValidationError as e:
                         errors.append(f"Relationship {idx}: {direction} - {str(e)}")
 
                 # Validate property name
-                if "property" in node_ref:
+                ref_property = node_ref.get("property")
+                if "property" in node_ref and ref_property not in ALLOWED_PROPERTIES:
                     try:
-                        self.builder.validate_property(node_ref["property"])
+                        self.builder.validate_property(ref_property)
                     except QueryValidationError as e:
                         errors.append(f"Relationship {idx}: {direction} - {str(e)}")
 
-                # Check if referenced node exists (if we have the index)
-                if node_index and "label" in node_ref and "value" in node_ref:
-                    # Currently only checks 'name' property
-                    if node_ref.get("property") == "name":
-                        key = f"{node_ref['label']}:{node_ref['value']}"
-                        if key not in node_index:
+                # Check if referenced node exists (if we have the index).
+                # Currently only checks 'name' property
+                if (
+                    check_refs
+                    and ref_property == "name"
+                    and "label" in node_ref
+                    and "value" in node_ref
+                ):
+                    ref_label = node_ref["label"]
+                    ref_value = node_ref["value"]
+                    if not isinstance(ref_label, str):
+                        pass  # Already reported by the label check above
+                    elif not isinstance(ref_value, str):
+                        errors.append(
+                            f"Relationship {idx}: {direction} - invalid reference "
+                            f"value: {ref_value!r}"
+                        )
+                    elif (ref_label, ref_value) not in node_index:
+                        warnings.append(
+                            f"Relationship {idx}: Referenced node not found: "
+                            f"{ref_label} with name='{ref_value}'"
+                        )
+                        ref_warnings += 1
+                        if ref_warnings >= max_ref_warnings:
                             warnings.append(
-                                f"Relationship {idx}: Referenced node not found: "
-                                f"{node_ref['label']} with name='{node_ref['value']}'"
+                                f"Stopped checking references after "
+                                f"{ref_warnings} missing nodes"
                             )
+                            check_refs = False
 
             # Validate relationship properties if present
-            if "properties" in rel and rel["properties"]:
-                for prop_name in rel["properties"].keys():
+            rel_properties = rel.get("properties")
+            if rel_properties:
+                for prop_name in rel_properties.keys():
+                    if prop_name in ALLOWED_PROPERTIES:
+                        continue
                     try:
                         self.builder.validate_property(prop_name)
                     except QueryValidationError as e:
@@ -318,26 +388,60 @@ class ImportService:
             List of relationships in AdminQueryBuilder format.
         """
         transformed = []
+        append = transformed.append
 
         for rel in relationships:
             # Note: Currently assumes 'name' property for matching
             # In future, could support custom match_property per relationship
+            from_ref = rel["from"]
+            to_ref = rel["to"]
             transformed_rel = {
-                "from_label": rel["from"]["label"],
-                "from_value": rel["from"]["value"],
-                "to_label": rel["to"]["label"],
-                "to_value": rel["to"]["value"],
+                "from_label": from_ref["label"],
+                "from_value": from_ref["value"],
+                "to_label": to_ref["label"],
+                "to_value": to_ref["value"],
                 "type": rel["type"],
             }
 
             # Add properties if present
-            if "properties" in rel and rel["properties"]:
-                transformed_rel["properties"] = rel["properties"]
+            properties = rel.get("properties")
+            if properties:
+                transformed_rel["properties"] = properties
 
-            transformed.append(transformed_rel)
+            append(transformed_rel)
 
         return transformed
 
+    def _execute_batch(
+        self, query: str, params: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Execute an UNWIND batch query in chunks of batch_size rows.
+
+        Chunking is done by GraphDBDriver.execute_batch: one write
+        transaction per chunk, all on one session.
+
+        Args:
+            query: Query from merge_nodes_batch or merge_relationships_batch.
+            params: Its parameters, holding a single list of rows.
+
+        Returns:
+            The first result row with "count" summed over all chunks, or
+            None if no chunk returned a row.
+
+        Raises:
+            RuntimeError: If a chunk fails; earlier chunks stay committed.
+        """
+        (param_name, rows), = params.items()
+        records = self.driver.execute_batch(
+            query, rows, batch_size=self.batch_size, param_name=param_name
+        )
+        if not records:
+            return None
+
+        summary = dict(records[0])
+        summary["count"] = sum(record.get("count", 0) for record in records)
+        return summary
+
     def import_nodes(self, nodes: List[Dict[str, Any]]) -> int:
         """Import nodes into database using batch merge.
 
@@ -362,14 +466,20 @@ class ImportService:
         total_count = 0
         label_counts = {}
 
-        # Execute each query separately
-        for query, params in queries:
-            result = self.driver.execute(query, params, write=True)
+        # Labels never share nodes, so their queries run concurrently; the
+        # chunks of one label stay in order on one thread, so duplicate
+        # names in a label cannot race each other in MERGE
+        workers = max(1, min(self.max_workers, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            summaries = list(
+                executor.map(lambda qp: self._execute_batch(*qp), queries)
+            )
 
+        for summary in summaries:
             # Extract count and label from result
-            if result and len(result) > 0:
-                count = result[0].get("count", 0)
-                label = result[0].get("label", "Unknown")
+            if summary:
+                count = summary.get("count", 0)
+                label = summary.get("label", "Unknown")
                 label_counts[label] = count
                 total_count += count
                 self.logger.info(" %s: %d nodes", label, count)
@@ -406,16 +516,18 @@ class ImportService:
         total_count = 0
         pattern_counts = []
 
-        # Execute each query separately
+        # Execute each query separately, chunked by batch_size. Patterns
+        # run serially: concurrent MERGEs on shared end nodes would take
+        # node locks in different orders and can deadlock
         for query, params in queries:
-            result = self.driver.execute(query, params, write=True)
+            summary = self._execute_batch(query, params)
 
             # Extract count and pattern info from result
-            if result and len(result) > 0:
-                count = result[0].get("count", 0)
-                from_label = result[0].get("from_label", "?")
-                to_label = result[0].get("to_label", "?")
-                rel_type = result[0].get("type", "?")
+            if summary:
+                count = summary.get("count", 0)
+                from_label = summary.get("from_label", "?")
+                to_label = summary.get("to_label", "?")
+                rel_type = summary.get("type", "?")
                 pattern_counts.append((from_label, rel_type, to_label, count))
                 total_count += count
                 self.logger.info(
@@ -434,8 +546,48 @@ class ImportService:
 
         return total_count
 
+    def ensure_name_indexes(self) -> None:
+        """Create the name indexes that the batch MERGEs look nodes up by.
+
+        Run before importing so node and relationship MERGEs are index
+        lookups rather than label scans. Safe to run repeatedly.
+
+        Raises:
+            RuntimeError: If an index query fails.
+        """
+        for query, params in self.builder.name_index_queries():
+            self.driver.execute(query, params, write=True, return_data=False)
+        self.logger.info("name indexes ensured")
+
+    def ensure_name_lc_index(self) -> None:
+        """Create the name_lc text indexes and backfill name_lc.
+
+        Prefix autocomplete matches on ``n.name_lc``; nodes written before
+        the property existed get it here. The backfill runs in transactions
+        of batch_size nodes. Safe to run repeatedly.
+
+        Raises:
+            RuntimeError: If a schema or backfill query fails.
+        """
+        for query, params in self.builder.name_lc_index_queries():
+            self.driver.execute(query, params, write=True, return_data=False)
+
+        updated = 0
+        for query, params in self.builder.name_lc_backfill_queries(self.batch_size):
+            while True:
+                records = self.driver.execute(query, params, write=True)
+                count = records[0]["count"] if records else 0
+                updated += count
+                if count < self.batch_size:
+                    break
+        self.logger.info("name_lc indexes ensured, %d nodes backfilled", updated)
+
     def import_from_json(
-        self, filepath: str, validate: bool = True, dry_run: bool = False
+        self,
+        filepath: str,
+        validate: bool = True,
+        dry_run: bool = False,
+        check_refs: bool = True,
     ) -> ImportResult:
         """Import data from JSON file into Neo4j database.
 
@@ -450,11 +602,13 @@ class ImportService:
             filepath: Path to JSON file.
             validate: Whether to validate data before import (default: True).
             dry_run: If True, validate but don't import (default: False).
+            check_refs: Whether validation warns about relationships that
+                reference nodes missing from the file (default: True).
 
         Returns:
             ImportResult with statistics and any errors/warnings.
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         result = ImportResult(success=False)
 
         try:
@@ -476,6 +630,9 @@ class ImportService:
 
             nodes = data.get("nodes", [])
             relationships = data.get("relationships", [])
+            # Drop the parsed document; from here on only the two lists
+            # are kept, and each is released as soon as it is imported
+            del data
 
             # Validate nodes
             if validate:
@@ -509,7 +666,7 @@ class ImportService:
             if validate:
                 self.logger.info("Validating %d relationships...", len(relationships))
                 rel_errors, rel_warnings = self.validate_relationships(
-                    relationships, existing_nodes=nodes
+                    relationships, existing_nodes=nodes if check_refs else None
                 )
                 result.errors.extend(rel_errors)
                 result.warnings.extend(rel_warnings)
@@ -563,10 +720,12 @@ class ImportService:
                 self.logger.exception("Unexpected error in node import")
                 result.errors.append(error_msg)
                 return result
+            del nodes
 
             # Transform and import relationships
             try:
                 transformed_rels = self.transform_relationships(relationships)
+                del relationships
                 result.relationships_created = self.import_relationships(transformed_rels)
             except QueryValidationError as e:
                 error_msg = f"Invalid query during relationship import: {str(e)}"
@@ -608,8 +767,7 @@ class ImportService:
             result.errors.append(error_msg)
 
         finally:
-            # Calculate duration
-            end_time = datetime.now()
-            result.duration_seconds = (end_time - start_time).total_seconds()
+            # Calculate duration on the monotonic clock
+            result.duration_seconds = time.perf_counter() - start_time
 
         return result
@@ -22,6 +22,38 @@ class QueryType(Enum):
 class QueryValidationError(Exception):
     """Raised when query validation fails."""
 
+
+# Validated query text keyed by (builder class, method, arguments). The
+# arguments are whitelisted labels/properties and flags, so the number of
+# entries is bounded.
+_QUERY_TEMPLATES: Dict[tuple, str] = {}
+
+
+def _name_lc_union(operator: str = "STARTS WITH") -> str:
+    """Build a subquery matching name_lc across all allowed labels.
+
+    Text indexes are per label, so a label-less ``MATCH (n)`` cannot use
+    them. One branch per label (sorted, so the query text is stable) lets
+    every lookup go through its ``node_name_lc_<label>`` index; UNION
+    removes nodes found under two labels.
+
+    Args:
+        operator: String operator applied to ``$search_value``
+            ('STARTS WITH' or 'CONTAINS').
+
+    Returns:
+        str: A ``CALL { ... }`` clause binding ``n``.
+    """
+    branches = "\n            UNION\n".join(
+        f"            MATCH (n:{label}) "
+        f"WHERE n.name_lc {operator} $search_value RETURN n"
+        for label in sorted(ALLOWED_LABELS)
+    )
+    return f"""CALL {{
+{branches}
+        }}"""
+
+
 class SafeQueryBuilder:
     """Builder for constructing safe, parameterized Cypher queries.
 
@@ -52,6 +84,30 @@ class SafeQueryBuilder:
         """
         self.max_results = max_results
 
+    def _cached_query(self, method: str, *args: Any) -> str:
+        """Return query text from _<method>_query, building it once.
+
+        Query text depends only on labels, property names and flags, never
+        on user values, so each combination is built and validated once per
+        process. Identical text also lets Neo4j reuse its cached plan.
+
+        Args:
+            method: Name of the public builder method.
+            *args: Arguments passed to the _<method>_query builder.
+
+        Returns:
+            str: The validated Cypher query.
+
+        Raises:
+            QueryValidationError: If validation fails (nothing is cached).
+        """
+        key = (type(self), method, *args)
+        query = _QUERY_TEMPLATES.get(key)
+        if query is None:
+            query = getattr(self, f"_{method}_query")(*args)
+            _QUERY_TEMPLATES[key] = query
+        return query
+
     def validate_label(self, label: str) -> str:
         """Validate that a node label is allowed.
 
@@ -439,6 +495,39 @@ class SafeQueryBuilder:
             ...     include_metadata=True
             ... )
         """
+        query = self._cached_query(
+            "search_nodes", label, search_property, match_type, include_metadata
+        )
+
+        if match_type != "exact":
+            # Case-insensitive matches compare lowercased values against an
+            # already lowercased $search_value
+            search_value = search_value.lower()
+
+        params = {"search_value": search_value, "limit": limit or self.max_results}
+        return query, params
+
+    def _search_nodes_query(
+        self,
+        label: Optional[str],
+        search_property: str,
+        match_type: str,
+        include_metadata: bool,
+    ) -> str:
+        """Build and validate the query text used by search_nodes.
+
+        Args:
+            label: Optional node label to filter by.
+            search_property: Property to search in.
+            match_type: Type of matching ('exact', 'starts_with', 'contains').
+            include_metadata: If True, returns labels and IDs.
+
+        Returns:
+            str: The Cypher query.
+
+        Raises:
+            QueryValidationError: If validation fails or match_type is invalid.
+        """
         # Validate inputs using whitelist approach
         # This prevents injection by ensuring only safe, pre-approved property names
         search_property = self.validate_property(search_property)
@@ -451,18 +540,22 @@ class SafeQueryBuilder:
             label_clause = ""
 
         # Build WHERE clause based on match type
-        # All values are parameterized ($search_value) to prevent injection
+        # All values are parameterized ($search_value) to prevent injection.
+        # For starts_with/contains $search_value is already lowercase (see
+        # search_nodes), so only the node side needs lowering
+        operators = {"starts_with": "STARTS WITH", "contains": "CONTAINS"}
         if match_type == "exact":
             where_clause = f"n.{search_property} = $search_value"
-        elif match_type == "starts_with":
-            # Case-insensitive prefix match for autocomplete
+        elif match_type in operators and search_property == "name":
+            # Case-insensitive match for autocomplete. name_lc holds
+            # toLower(name) and has a text index (see
+            # AdminQueryBuilder.name_lc_schema_queries), so no row is
+            # lowercased at query time
+            where_clause = f"n.name_lc {operators[match_type]} $search_value"
+        elif match_type in operators:
+            # Case-insensitive match on properties without a lowercase copy
             where_clause = (
-                f"toLower(n.{search_property}) STARTS WITH toLower($search_value)"
-            )
-        elif match_type == "contains":
-            # Case-insensitive substring match for fuzzy search
-            where_clause = (
-                f"toLower(n.{search_property}) CONTAINS toLower($search_value)"
+                f"toLower(n.{search_property}) {operators[match_type]} $search_value"
             )
         else:
             raise QueryValidationError(
@@ -483,7 +576,17 @@ class SafeQueryBuilder:
             return_clause = "n"
 
         # Build complete query
-        query = f"""
+        if not label and where_clause.startswith("n.name_lc"):
+            # A label-less MATCH cannot use the per-label text indexes; one
+            # indexed lookup per allowed label avoids an AllNodesScan
+            query = f"""
+        {_name_lc_union(operators[match_type])}
+        RETURN {return_clause}
+        ORDER BY n.{search_property}
+        LIMIT $limit
+        """
+        else:
+            query = f"""
         MATCH (n{label_clause})
         WHERE n.{search_property} IS NOT NULL AND {where_clause}
         RETURN {return_clause}
@@ -491,11 +594,9 @@ class SafeQueryBuilder:
         LIMIT $limit
         """
 
-        params = {"search_value": search_value, "limit": limit or self.max_results}
-
         # Final safety check - ensures no forbidden keywords
         self.validate_query_safety(query)
-        return query, params
+        return query
 
     def fuzzy_search_nodes(
         self,
@@ -540,6 +641,33 @@ class SafeQueryBuilder:
             ... )
             Returns nodes where name contains "shadow", ordered by relevance
         """
+        query = self._cached_query(
+            "fuzzy_search_nodes", label, search_property, include_metadata
+        )
+
+        # The query compares lowercased values against $search_value
+        params = {
+            "search_value": search_value.lower(),
+            "limit": limit or self.max_results,
+        }
+        return query, params
+
+    def _fuzzy_search_nodes_query(
+        self, label: Optional[str], search_property: str, include_metadata: bool
+    ) -> str:
+        """Build and validate the query text used by fuzzy_search_nodes.
+
+        Args:
+            label: Optional node label to filter by.
+            search_property: Property to search in.
+            include_metadata: If True, returns labels, IDs and relevance.
+
+        Returns:
+            str: The Cypher query.
+
+        Raises:
+            QueryValidationError: If validation fails.
+        """
         # Validate inputs against whitelist
         search_property = self.validate_property(search_property)
 
@@ -550,39 +678,48 @@ class SafeQueryBuilder:
         else:
             label_clause = ""
 
+        # $search_value arrives lowercased, and every candidate value is
+        # lowercased once and reused for both CONTAINS and the relevance CASE
+        if search_property == "name" and not label:
+            match_clause = _name_lc_union("CONTAINS")
+            lowered = "n.name_lc"
+        elif search_property == "name":
+            match_clause = f"""MATCH (n{label_clause})
+        WHERE n.name_lc CONTAINS $search_value"""
+            lowered = "n.name_lc"
+        else:
+            match_clause = f"""MATCH (n{label_clause})
+        WHERE n.{search_property} IS NOT NULL
+        WITH n, toLower(n.{search_property}) AS lowered
+        WHERE lowered CONTAINS $search_value"""
+            lowered = "lowered"
+
         # Build RETURN clause with relevance scoring
+        relevance = f"""CASE
+                     WHEN {lowered} STARTS WITH $search_value THEN 1
+                     ELSE 2
+                   END AS relevance"""
         if include_metadata:
             return_clause = f"""n.{search_property} AS {search_property},
                    labels(n)[0] AS label,
                    elementId(n) AS id,
-                   CASE
-                     WHEN toLower(n.{search_property}) STARTS WITH toLower($search_value) THEN 1
-                     ELSE 2
-                   END AS relevance"""
-            order_clause = f"relevance, n.{search_property}"
+                   {relevance}"""
         else:
             # Without metadata, still include relevance for ordering but don't return it
             return_clause = f"""n,
-                   CASE
-                     WHEN toLower(n.{search_property}) STARTS WITH toLower($search_value) THEN 1
-                     ELSE 2
-                   END AS relevance"""
-            order_clause = f"relevance, n.{search_property}"
+                   {relevance}"""
+        order_clause = f"relevance, n.{search_property}"
 
         # Build complete query with CONTAINS for fuzzy matching
         query = f"""
-        MATCH (n{label_clause})
-        WHERE n.{search_property} IS NOT NULL
-          AND toLower(n.{search_property}) CONTAINS toLower($search_value)
+        {match_clause}
         RETURN {return_clause}
         ORDER BY {order_clause}
         LIMIT $limit
         """
 
-        params = {"search_value": search_value, "limit": limit or self.max_results}
-
         self.validate_query_safety(query)
-        return query, params
+        return query
 
     def search_nodes_with_time_filter(
         self,
@@ -633,6 +770,59 @@ class SafeQueryBuilder:
         Raises:
             QueryValidationError: If validation fails.
         """
+        if start_date and end_date and start_date > end_date:
+            raise QueryValidationError(
+                f"start_date ({start_date}) must be before end_date ({end_date})"
+            )
+
+        # Only the presence of each date changes the query text
+        query = self._cached_query(
+            "search_nodes_with_time_filter",
+            label,
+            search_property,
+            match_type,
+            include_metadata,
+            bool(start_date),
+            bool(end_date),
+        )
+
+        if match_type != "exact":
+            # As in search_nodes, case-insensitive matches compare against
+            # an already lowercased $search_value
+            search_value = search_value.lower()
+
+        params = {"search_value": search_value, "limit": limit or self.max_results}
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        return query, params
+
+    def _search_nodes_with_time_filter_query(
+        self,
+        label: Optional[str],
+        search_property: str,
+        match_type: str,
+        include_metadata: bool,
+        has_start: bool,
+        has_end: bool,
+    ) -> str:
+        """Build and validate the query text used by search_nodes_with_time_filter.
+
+        Args:
+            label: Optional node label to filter by.
+            search_property: Property to search in.
+            match_type: Type of matching ('exact', 'starts_with', 'contains').
+            include_metadata: If True, returns labels and IDs.
+            has_start: Whether a start_date parameter is passed.
+            has_end: Whether an end_date parameter is passed.
+
+        Returns:
+            str: The Cypher query.
+
+        Raises:
+            QueryValidationError: If validation fails or match_type is invalid.
+        """
         # Validate inputs using whitelist approach
         search_property = self.validate_property(search_property)
 
@@ -644,14 +834,16 @@ class SafeQueryBuilder:
             label_clause = ""
 
         # Build text search WHERE clause based on match type
+        operators = {"starts_with": "STARTS WITH", "contains": "CONTAINS"}
         if match_type == "exact":
             text_where = f"n.{search_property} = $search_value"
-        elif match_type == "starts_with":
+        elif match_type in operators and search_property == "name":
+            # Indexed lowercase copy, as in search_nodes
+            text_where = f"n.name_lc {operators[match_type]} $search_value"
+        elif match_type in operators:
             text_where = (
-                f"toLower(n.{search_property}) STARTS WITH toLower($search_value)"
+                f"toLower(n.{search_property}) {operators[match_type]} $search_value"
             )
-        elif match_type == "contains":
-            text_where = f"toLower(n.{search_property}) CONTAINS toLower($search_value)"
         else:
             raise QueryValidationError(
                 f"Invalid match_type: {match_type}. "
@@ -660,14 +852,8 @@ class SafeQueryBuilder:
 
         # Build time filter WHERE clause
         time_where = ""
-        params = {"search_value": search_value, "limit": limit or self.max_results}
 
-        if start_date and end_date:
-            # Validate: start must be before end
-            if start_date > end_date:
-                raise QueryValidationError(
-                    f"start_date ({start_date}) must be before end_date ({end_date})"
-                )
+        if has_start and has_end:
             time_where = """
       AND (
         (n.published_date >= $start_date AND n.published_date <= $end_date)
@@ -682,10 +868,8 @@ class SafeQueryBuilder:
         (n.start_date IS NOT NULL AND n.end_date IS NOT NULL
          AND n.start_date <= $end_date AND n.end_date >= $start_date)
       )"""
-            params["start_date"] = start_date
-            params["end_date"] = end_date
 
-        elif start_date:
+        elif has_start:
             # Only start: nodes active after this date
             time_where = """
       AND (
@@ -699,9 +883,8 @@ class SafeQueryBuilder:
         OR
         (n.end_date >= $start_date)
       )"""
-            params["start_date"] = start_date
 
-        elif end_date:
+        elif has_end:
             # Only end: nodes active before this date
             time_where = """
       AND (
@@ -715,7 +898,6 @@ class SafeQueryBuilder:
         OR
         (n.start_date <= $end_date)
       )"""
-            params["end_date"] = end_date
 
         # Build RETURN clause
         if include_metadata:
@@ -726,7 +908,17 @@ class SafeQueryBuilder:
             return_clause = "n"
 
         # Build complete query
-        query = f"""
+        if not label and text_where.startswith("n.name_lc"):
+            query = f"""
+            {_name_lc_union(operators[match_type])}
+            WITH n
+            WHERE n.name IS NOT NULL{time_where}
+            RETURN {return_clause}
+            ORDER BY n.{search_property}
+            LIMIT $limit
+            """
+        else:
+            query = f"""
             MATCH (n{label_clause})
             WHERE n.{search_property} IS NOT NULL AND {text_where}{time_where}
             RETURN {return_clause}
@@ -736,8 +928,7 @@ class SafeQueryBuilder:
 
         # Final safety check
         self.validate_query_safety(query)
-
-        return query, params
+        return query
 
     def check_node_exists(
         self,
@@ -747,8 +938,8 @@ class SafeQueryBuilder:
     ) -> tuple[str, Dict[str, Any]]:
         """Build a query to check if a node exists.
 
-        This is a lightweight query that only returns count and boolean,
-        not the full node data. Useful for validation before operations.
+        This is a lightweight query that only returns a boolean, not the
+        full node data. Useful for validation before operations.
 
         Security: Uses parameterization to safely check user input.
 
@@ -759,7 +950,7 @@ class SafeQueryBuilder:
 
         Returns:
             tuple: (query_string, parameters_dict)
-            Query returns: {count: number, exists: boolean}
+            Query returns: {exists: boolean}
 
         Raises:
             QueryValidationError: If validation fails.
@@ -771,7 +962,7 @@ class SafeQueryBuilder:
             ...     property_value="APT28",
             ...     label="ThreatActor"
             ... )
-            Returns: [{"count": 1, "exists": true}] if node exists
+            Returns: [{"exists": true}] if node exists
         """
         # Validate property name against whitelist
         property_name = self.validate_property(property_name)
@@ -783,12 +974,12 @@ class SafeQueryBuilder:
         else:
             label_clause = ""
 
-        # Build query - using COUNT for efficiency
-        # No need to return node data, just existence check
+        # Build query - the existential subquery stops at the first match
+        # instead of counting every matching node
         query = f"""
-        MATCH (n{label_clause} {{{property_name}: $value}})
-        WHERE n.{property_name} IS NOT NULL
-        RETURN count(n) AS count, count(n) > 0 AS exists
+        RETURN EXISTS {{
+          MATCH (n{label_clause} {{{property_name}: $value}})
+        }} AS exists
         """
 
         params = {"value": property_value}
@@ -796,12 +987,69 @@ class SafeQueryBuilder:
         self.validate_query_safety(query)
         return query, params
 
+    def check_nodes_exist(
+        self,
+        property_name: str = "name",
+        property_values: Optional[List[Any]] = None,
+        label: Optional[str] = None,
+    ) -> tuple[str, Dict[str, Any]]:
+        """Build a query that checks several nodes for existence at once.
+
+        Batch variant of check_node_exists: all values are sent in one
+        UNWIND query instead of one query per value. Rows are returned in
+        the order of property_values, one row per value (duplicates included).
+
+        Args:
+            property_name: Property to match on (must be in ALLOWED_PROPERTIES).
+            property_values: Values to match (parameterized for safety).
+            label: Optional node label to filter by.
+
+        Returns:
+            tuple: (query_string, parameters_dict)
+            Query returns: {<property_name>: value, exists: boolean}
+
+        Raises:
+            QueryValidationError: If validation fails.
+
+        Examples:
+            >>> builder = SafeQueryBuilder()
+            >>> query, params = builder.check_nodes_exist(
+            ...     property_values=["APT28", "Unknown"],
+            ...     label="ThreatActor"
+            ... )
+            Returns: [{"name": "APT28", "exists": true},
+                      {"name": "Unknown", "exists": false}]
+        """
+        property_name = self.validate_property(property_name)
+
+        if label:
+            label = self.validate_label(label)
+            label_clause = f":{label}"
+        else:
+            label_clause = ""
+
+        # No aggregation, so rows keep the order of $values; each
+        # existential subquery stops at the first matching node
+        query = f"""
+        UNWIND $values AS value
+        RETURN value AS {property_name},
+               EXISTS {{
+                 MATCH (n{label_clause} {{{property_name}: value}})
+               }} AS exists
+        """
+
+        params = {"values": list(property_values or [])}
+
+        self.validate_query_safety(query)
+        return query, params
+
     def get_all_node_names(
         self,
         label: Optional[str] = None,
         property_name: str = "name",
         limit: Optional[int] = None,
         include_metadata: bool = True,
+        as_list: bool = False,
     ) -> tuple[str, Dict[str, Any]]:
         """Build a query to get all node names for frontend caching.
 
@@ -810,6 +1058,9 @@ class SafeQueryBuilder:
         This method is designed for frontend autocomplete caching where
         the UI needs a list of all available node names upfront.
 
+        Without a label, the query unions one label scan per entry in
+        ALLOWED_LABELS instead of scanning every node in the store.
+
         Security: Validated and parameterized for safety.
 
         Args:
@@ -817,6 +1068,9 @@ class SafeQueryBuilder:
             property_name: Property to return (default: "name").
             limit: Maximum results to return (safety limit).
             include_metadata: If True, returns labels alongside names.
+            as_list: If True, the rows are collected into a single record
+                with a ``rows`` list, so thousands of names are sent as one
+                Bolt record instead of one record each.
 
         Returns:
             tuple: (query_string, parameters_dict)
@@ -836,25 +1090,44 @@ class SafeQueryBuilder:
         # Validate property name against whitelist
         property_name = self.validate_property(property_name)
 
-        # Build label clause with validation
-        if label:
-            label = self.validate_label(label)
-            label_clause = f":{label}"
-        else:
-            label_clause = ""
-
         # Build RETURN clause
         if include_metadata:
             return_clause = (
                 f"DISTINCT n.{property_name} AS {property_name}, labels(n)[0] AS label"
             )
+            row_map = f"{{{property_name}: {property_name}, label: label}}"
         else:
             return_clause = f"DISTINCT n.{property_name} AS {property_name}"
+            row_map = f"{{{property_name}: {property_name}}}"
+
+        if label:
+            label = self.validate_label(label)
+            match_clause = f"""MATCH (n:{label})
+        WHERE n.{property_name} IS NOT NULL"""
+        else:
+            # One label scan per allowed label instead of a scan over all
+            # nodes; sorted so the query text (and its cached plan) is stable
+            branches = "\n            UNION\n".join(
+                f"            MATCH (n:{allowed}) "
+                f"WHERE n.{property_name} IS NOT NULL RETURN n"
+                for allowed in sorted(ALLOWED_LABELS)
+            )
+            match_clause = f"""CALL {{
+{branches}
+        }}"""
 
         # Build query with DISTINCT to avoid duplicates
-        query = f"""
-        MATCH (n{label_clause})
-        WHERE n.{property_name} IS NOT NULL
+        if as_list:
+            query = f"""
+        {match_clause}
+        WITH {return_clause}
+        ORDER BY {property_name}
+        LIMIT $limit
+        RETURN collect({row_map}) AS rows
+        """
+        else:
+            query = f"""
+        {match_clause}
         RETURN {return_clause}
         ORDER BY n.{property_name}
         LIMIT $limit
@@ -903,11 +1176,33 @@ class SafeQueryBuilder:
         self.validate_query_safety(query)
         return query, {}
 
+    def count_stats(self) -> tuple[str, Dict[str, Any]]:
+        """Build query to count all nodes and relationships in one round-trip.
+
+        Each count runs in its own subquery so Neo4j can still answer both
+        from its count store.
+
+        Returns:
+            tuple: (query_string, parameters_dict)
+            Query returns: {nodes: number, relationships: number}
+        """
+        query = """
+        CALL { MATCH (n) RETURN count(n) AS nodes }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+        RETURN nodes, relationships
+        """
+
+        self.validate_query_safety(query)
+        return query, {}
+
     def get_all_nodes(
         self, label: Optional[str] = None, limit: Optional[int] = None
     ) -> tuple[str, Dict[str, Any]]:
         """Build query to get all nodes.
 
+        Nodes are returned as property maps so the result can be consumed
+        in columnar form without converting graph entities.
+
         Args:
             label: Optional label to filter by
             limit: Maximum results to return
@@ -917,9 +1212,9 @@ class SafeQueryBuilder:
         """
         if label:
             label = self.validate_label(label)
-            query = f"MATCH (n:{label}) RETURN n LIMIT $limit"
+            query = f"MATCH (n:{label}) RETURN properties(n) AS n LIMIT $limit"
         else:
-            query = "MATCH (n) RETURN n LIMIT $limit"
+            query = "MATCH (n) RETURN properties(n) AS n LIMIT $limit"
 
         params = {"limit": limit or self.max_results}
         self.validate_query_safety(query)
@@ -949,6 +1244,93 @@ class AdminQueryBuilder(SafeQueryBuilder):
             query: The query string (not validated for write keywords).
         """
 
+    def name_lc_schema_queries(
+        self, batch_size: int = 10_000
+    ) -> List[tuple[str, Dict[str, Any]]]:
+        """Build the queries that maintain the lowercased name property.
+
+        SafeQueryBuilder.search_nodes matches name prefixes against
+        ``n.name_lc`` (``toLower(n.name)``). New and updated nodes get
+        name_lc from merge_nodes_batch. All queries are idempotent.
+
+        Args:
+            batch_size: Nodes updated per backfill query (default: 10000).
+
+        Returns:
+            List of tuples: [(query_string, parameters_dict), ...]
+            Index queries first (see name_lc_index_queries), then backfill
+            queries (see name_lc_backfill_queries).
+        """
+        return self.name_lc_index_queries() + self.name_lc_backfill_queries(
+            batch_size
+        )
+
+    def name_lc_index_queries(self) -> List[tuple[str, Dict[str, Any]]]:
+        """Build the queries that create a name_lc text index per label.
+
+        Returns:
+            List of tuples: [(query_string, parameters_dict), ...]
+            One query per allowed label.
+        """
+        return [
+            (
+                f"CREATE TEXT INDEX node_name_lc_{label} IF NOT EXISTS "
+                f"FOR (n:{label}) ON (n.name_lc)",
+                {},
+            )
+            for label in sorted(ALLOWED_LABELS)
+        ]
+
+    def name_lc_backfill_queries(
+        self, batch_size: int = 10_000
+    ) -> List[tuple[str, Dict[str, Any]]]:
+        """Build the queries that backfill name_lc where it is missing or stale.
+
+        Each query updates at most batch_size nodes of one label and returns
+        how many it updated as ``count``, so a caller repeats it until the
+        count drops below batch_size. That keeps every write transaction
+        bounded on large graphs.
+
+        Args:
+            batch_size: Maximum number of nodes updated per query.
+
+        Returns:
+            List of tuples: [(query_string, parameters_dict), ...]
+            One query per allowed label.
+        """
+        return [
+            (
+                f"MATCH (n:{label}) WHERE n.name IS NOT NULL "
+                "AND (n.name_lc IS NULL OR n.name_lc <> toLower(n.name)) "
+                "WITH n LIMIT $batch_size "
+                "SET n.name_lc = toLower(n.name) "
+                "RETURN count(n) AS count",
+                {"batch_size": batch_size},
+            )
+            for label in sorted(ALLOWED_LABELS)
+        ]
+
+    def name_index_queries(self) -> List[tuple[str, Dict[str, Any]]]:
+        """Build the queries that index ``name`` for every allowed label.
+
+        merge_nodes_batch and merge_relationships_batch look nodes up by
+        name; without a range index each of those lookups scans the whole
+        label, so a bulk import slows down as the label grows. All queries
+        are idempotent.
+
+        Returns:
+            List of tuples: [(query_string, parameters_dict), ...]
+            One query per allowed label.
+        """
+        return [
+            (
+                f"CREATE INDEX node_name_{label} IF NOT EXISTS "
+                f"FOR (n:{label}) ON (n.name)",
+                {},
+            )
+            for label in sorted(ALLOWED_LABELS)
+        ]
+
     def _validate_properties_dict(self, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Validate all properties in a dictionary.
 
@@ -1008,24 +1390,23 @@ class AdminQueryBuilder(SafeQueryBuilder):
         )
         match_clause = f"{{{match_keys}}}"
 
-        # Build SET clause for additional properties
-        set_clause = ""
+        # Validate additional properties
         if set_properties:
             set_properties = self._validate_properties_dict(set_properties)
-            # Use += to merge properties (Neo4j map addition)
-            set_clause = "SET n += $set_properties"
 
-        # Build query
+        # Build query - SET is always present (empty map when unused) so the
+        # query text only depends on label and match keys, keeping the
+        # Neo4j plan cache hot across calls with different properties.
+        # name_lc mirrors merge_nodes_batch for the name prefix index.
         query = f"""
         MERGE (n:{label} {match_clause})
-        {set_clause}
+        SET n += $set_properties, n.name_lc = toLower(n.name)
         RETURN n
         """
 
         # Build parameters
         params = {f"match_{k}": v for k, v in match_properties.items()}
-        if set_properties:
-            params["set_properties"] = set_properties
+        params["set_properties"] = set_properties or {}
 
         return query, params
 
@@ -1102,7 +1483,7 @@ class AdminQueryBuilder(SafeQueryBuilder):
             query = f"""
 UNWIND ${param_name} AS props
 MERGE (n:{label} {{{match_property}: props.{match_property}}})
-SET n += props
+SET n += props, n.name_lc = toLower(n.name)
 RETURN count(n) AS count, '{label}' AS label"""
 
             queries.append((query, params))
@@ -1291,8 +1672,9 @@ RETURN count(n) AS count, '{label}' AS label"""
             rel_type = self.validate_relationship(rel["type"])
 
             # Validate relationship properties if provided
-            if "properties" in rel and rel["properties"]:
-                self._validate_properties_dict(rel["properties"])
+            properties = rel.get("properties")
+            if properties:
+                self._validate_properties_dict(properties)
 
             # Create pattern key
             pattern = (from_label, to_label, rel_type)
@@ -1305,7 +1687,7 @@ RETURN count(n) AS count, '{label}' AS label"""
                 {
                     "from_value": rel["from_value"],
                     "to_value": rel["to_value"],
-                    "properties": rel.get("properties", {}),
+                    "properties": properties or {},
                 }
             )
 
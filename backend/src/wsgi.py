@@ -0,0 +1,13 @@
+"""WSGI entry point for production servers.
+
+Usage:
+    gunicorn -k gthread -w 2 --threads 8 -b 0.0.0.0:8000 src.wsgi:app
+
+Without --preload every worker imports this module after forking, so
+each worker process creates its own Neo4j driver and connection pool.
+The driver is thread-safe and shared by all threads of a worker.
+"""
+
+from src.main import init_app
+
+app = init_app()
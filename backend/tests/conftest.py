@@ -20,6 +20,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from src.driver import GraphDBDriver, ResultWrapper
+from src.services.autocomplete_service import AutocompleteService
 from src.services.import_service import ImportService
 from src.api import handlers
 
@@ -133,6 +134,7 @@ def mock_driver():
     # Patch autocomplete service with proper ResultWrapper responses
     # Access the PRIVATE variable through the module
     handlers._autocomplete_service = Mock()
+    handlers._autocomplete_service.MIN_PREFIX_LEN = AutocompleteService.MIN_PREFIX_LEN
     handlers._autocomplete_service.suggest_node_names.return_value = ResultWrapper(
         success=True, data=[{"name": "Alpha"}, {"name": "Beta"}]
     )
@@ -162,7 +164,10 @@ def app():
     from flask import Flask
     from flask_cors import CORS
 
+    from src.api.json_provider import ORJSONProvider
+
     test_app = Flask(__name__)
+    test_app.json = ORJSONProvider(test_app)
     CORS(test_app)
     test_app.config["TESTING"] = True
 
@@ -256,7 +261,8 @@ def mock_import_driver():
     """
 
     driver = Mock(spec=GraphDBDriver)
-    driver.execute = Mock(return_value=[{"count": 1, "label": "TestLabel"}])
+    driver.execute = Mock(return_value=None)
+    driver.execute_batch = Mock(return_value=[{"count": 1, "label": "TestLabel"}])
     driver.run_safe_query = Mock(return_value=ResultWrapper(success=True, data=[]))
     return driver
 
@@ -4,6 +4,8 @@ This module tests the autocomplete service with various scenarios
 to achieve high test coverage.
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock
 from src.driver import ResultWrapper
@@ -216,7 +218,7 @@ class TestCheckNodeExists:
         """Test checking for existing node."""
         mock_driver = Mock()
         mock_driver.run_safe_query.return_value = ResultWrapper(
-            success=True, data=[{"count": 1, "exists": True}]
+            success=True, data=[{"name": "APT28", "exists": True}]
         )
         service = AutocompleteService(mock_driver)
 
@@ -224,13 +226,12 @@ class TestCheckNodeExists:
 
         assert result.success is True
         assert result.data[0]["exists"] is True
-        assert result.data[0]["count"] == 1
 
     def test_check_exists_false(self):
         """Test checking for non-existent node."""
         mock_driver = Mock()
         mock_driver.run_safe_query.return_value = ResultWrapper(
-            success=True, data=[{"count": 0, "exists": False}]
+            success=True, data=[{"name": "NonExistent", "exists": False}]
         )
         service = AutocompleteService(mock_driver)
 
@@ -243,7 +244,7 @@ class TestCheckNodeExists:
         """Test checking node existence with label filter."""
         mock_driver = Mock()
         mock_driver.run_safe_query.return_value = ResultWrapper(
-            success=True, data=[{"count": 1, "exists": True}]
+            success=True, data=[{"name": "APT28", "exists": True}]
         )
         service = AutocompleteService(mock_driver)
 
@@ -262,6 +263,49 @@ class TestCheckNodeExists:
         assert "not allowed" in result.error or "Invalid label" in result.error
 
 
+class TestCheckNodesExist:
+    """Test check_nodes_exist method."""
+
+    def test_batch_uses_one_query(self):
+        """Test several names are checked in a single round-trip."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data=[
+                {"name": "APT28", "exists": True},
+                {"name": "Unknown", "exists": False},
+            ],
+        )
+        service = AutocompleteService(mock_driver)
+
+        result = service.check_nodes_exist(["APT28", "Unknown"], label="ThreatActor")
+
+        mock_driver.run_safe_query.assert_called_once()
+        query, params = mock_driver.run_safe_query.call_args.args
+        assert "UNWIND" in query
+        assert params == {"values": ["APT28", "Unknown"]}
+        assert [row["exists"] for row in result.data] == [True, False]
+
+    def test_empty_names_skip_query(self):
+        """Test an empty list returns no rows without querying."""
+        mock_driver = Mock()
+        service = AutocompleteService(mock_driver)
+
+        result = service.check_nodes_exist([])
+
+        assert result.success is True
+        assert result.data == []
+        mock_driver.run_safe_query.assert_not_called()
+
+    def test_invalid_label(self):
+        """Test invalid label returns an error result."""
+        service = AutocompleteService(Mock())
+
+        result = service.check_nodes_exist(["x"], label="InvalidLabel")
+
+        assert result.success is False
+
+
 class TestGetAllNodeNames:
     """Test get_all_node_names method."""
 
@@ -271,9 +315,13 @@ class TestGetAllNodeNames:
         mock_driver.run_safe_query.return_value = ResultWrapper(
             success=True,
             data=[
-                {"name": "APT28", "label": "ThreatActor"},
-                {"name": "X-Agent", "label": "Malware"},
-                {"name": "Campaign1", "label": "Campaign"},
+                {
+                    "rows": [
+                        {"name": "APT28", "label": "ThreatActor"},
+                        {"name": "X-Agent", "label": "Malware"},
+                        {"name": "Campaign1", "label": "Campaign"},
+                    ]
+                }
             ],
         )
         service = AutocompleteService(mock_driver)
@@ -289,8 +337,12 @@ class TestGetAllNodeNames:
         mock_driver.run_safe_query.return_value = ResultWrapper(
             success=True,
             data=[
-                {"name": "APT28", "label": "ThreatActor"},
-                {"name": "APT29", "label": "ThreatActor"},
+                {
+                    "rows": [
+                        {"name": "APT28", "label": "ThreatActor"},
+                        {"name": "APT29", "label": "ThreatActor"},
+                    ]
+                }
             ],
         )
         service = AutocompleteService(mock_driver)
@@ -312,6 +364,30 @@ class TestGetAllNodeNames:
         # Check that limit was passed to driver
         call_args = mock_driver.run_safe_query.call_args
         assert call_args[0][1]["limit"] == 500
+        assert call_args.kwargs == {"use_cache": True}
+
+    def test_get_all_nodes_can_skip_driver_cache(self):
+        """Test use_cache=False is passed through to the driver."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(success=True, data=[])
+        service = AutocompleteService(mock_driver)
+
+        service.get_all_node_names(use_cache=False)
+
+        assert mock_driver.run_safe_query.call_args.kwargs == {"use_cache": False}
+
+    def test_get_all_nodes_requests_single_record(self):
+        """Test names are fetched as one collected record."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(success=True, data=[])
+        service = AutocompleteService(mock_driver)
+
+        result = service.get_all_node_names()
+
+        query = mock_driver.run_safe_query.call_args[0][0]
+        assert "AS rows" in query
+        assert result.success is True
+        assert result.data == []
 
     def test_get_all_nodes_invalid_label(self):
         """Test getting all nodes with invalid label."""
@@ -375,3 +451,305 @@ class TestIntegrationScenarios:
 
         assert prefix.success is True
         assert fuzzy.success is True
+
+
+class TestMinPrefixLength:
+    """Test the minimum search term length."""
+
+    def test_short_prefix_skips_query(self):
+        """Test prefixes below MIN_PREFIX_LEN return no results."""
+        mock_driver = Mock()
+        service = AutocompleteService(mock_driver)
+
+        assert service.suggest_node_names(" ab ").data == []
+        assert service.fuzzy_search("ab").data == []
+        mock_driver.run_safe_query.assert_not_called()
+
+    def test_short_prefix_results_not_shared(self):
+        """Test each short-prefix call gets its own empty list."""
+        service = AutocompleteService(Mock())
+
+        first = service.suggest_node_names("")
+        first.data.append({"name": "Injected"})
+
+        assert service.suggest_node_names("a").data == []
+
+    def test_min_prefix_len_overridable(self):
+        """Test MIN_PREFIX_LEN can be lowered per instance."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(success=True, data=[])
+        service = AutocompleteService(mock_driver)
+        service.MIN_PREFIX_LEN = 1
+
+        result = service.suggest_node_names("a")
+
+        assert result.success is True
+        mock_driver.run_safe_query.assert_called_once()
+
+
+class TestResultCache:
+    """Test caching of autocomplete results."""
+
+    def _service(self, data=None):
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data=data if data is not None else [{"name": "Lockbit", "label": "Malware", "id": "1"}],
+        )
+        return mock_driver, AutocompleteService(mock_driver)
+
+    def test_repeated_prefix_hits_cache(self):
+        """Test same prefix with different case only queries once."""
+        mock_driver, service = self._service()
+
+        first = service.suggest_node_names("lock")
+        second = service.suggest_node_names("LOCK ")
+
+        assert mock_driver.run_safe_query.call_count == 1
+        assert second.data == first.data
+
+    def test_driver_cache_skipped(self):
+        """Test misses bypass the driver's cache so TTLs do not stack."""
+        mock_driver, service = self._service()
+
+        service.suggest_node_names("lock")
+
+        assert mock_driver.run_safe_query.call_args.kwargs == {"use_cache": False}
+
+    def test_cache_key_includes_filters(self):
+        """Test different label or limit triggers a new query."""
+        mock_driver, service = self._service()
+
+        service.suggest_node_names("lock")
+        service.suggest_node_names("lock", label="Malware")
+        service.suggest_node_names("lock", limit=5)
+        service.fuzzy_search("lock")
+
+        assert mock_driver.run_safe_query.call_count == 4
+
+    def test_failed_result_not_cached(self):
+        """Test errors are not cached."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=False, error="Database error"
+        )
+        service = AutocompleteService(mock_driver)
+
+        service.suggest_node_names("lock")
+        service.suggest_node_names("lock")
+
+        assert mock_driver.run_safe_query.call_count == 2
+
+    def test_cached_data_is_copied(self):
+        """Test appending to returned data does not alter the cache."""
+        _, service = self._service()
+
+        first = service.suggest_node_names("lock")
+        first.data.append({"name": "Extra"})
+        second = service.suggest_node_names("lock")
+
+        assert len(second.data) == 1
+
+    def test_ttl_expiry_and_clear(self):
+        """Test zero TTL disables reuse and clear_cache drops entries."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(success=True, data=[])
+        service = AutocompleteService(mock_driver, cache_ttl=0)
+
+        service.suggest_node_names("lock")
+        service.suggest_node_names("lock")
+        assert mock_driver.run_safe_query.call_count == 2
+
+        mock_driver, service = self._service()
+        service.suggest_node_names("lock")
+        service.clear_cache()
+        service.suggest_node_names("lock")
+        assert mock_driver.run_safe_query.call_count == 2
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical autocomplete queries."""
+
+    def test_concurrent_calls_share_one_query(self):
+        """Test concurrent callers with the same key run one query."""
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_query(query, params, use_cache=True):
+            entered.set()
+            release.wait(5)
+            return ResultWrapper(success=True, data=[{"name": "Lockbit"}])
+
+        mock_driver = Mock()
+        mock_driver.run_safe_query.side_effect = slow_query
+        service = AutocompleteService(mock_driver)
+        results = []
+
+        def call():
+            results.append(service.suggest_node_names("lock"))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        assert entered.wait(5)
+        followers = [threading.Thread(target=call) for _ in range(4)]
+        for t in followers:
+            t.start()
+        release.set()
+        for t in [leader, *followers]:
+            t.join(5)
+
+        assert mock_driver.run_safe_query.call_count == 1
+        assert len(results) == 5
+        assert all(r.data == [{"name": "Lockbit"}] for r in results)
+        assert len({id(r.data) for r in results}) == 5
+
+    def test_inflight_entry_cleared_on_error(self):
+        """Test a raising query does not leave a stale in-flight entry."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.side_effect = [
+            RuntimeError("boom"),
+            ResultWrapper(success=True, data=[]),
+        ]
+        service = AutocompleteService(mock_driver)
+
+        failed = service.suggest_node_names("lock")
+        retried = service.suggest_node_names("lock")
+
+        assert failed.success is False
+        assert retried.success is True
+        assert service._inflight == {}
+
+
+class TestNameIndex:
+    """Test the in-memory prefix index."""
+
+    ROWS = [
+        {"name": "LockBit", "label": "Malware", "id": "1"},
+        {"name": "lockdown", "label": "Campaign", "id": "2"},
+        {"name": "Lazarus", "label": "ThreatActor", "id": "3"},
+        {"name": "Locksmith", "label": "Malware", "id": "4"},
+    ]
+
+    def _service(self, rows=None):
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True, data=list(self.ROWS if rows is None else rows)
+        )
+        service = AutocompleteService(mock_driver)
+        assert service.refresh_index() is True
+        mock_driver.run_safe_query.reset_mock()
+        return mock_driver, service
+
+    def test_prefix_served_from_index(self):
+        """Test prefix suggestions come from memory without a query."""
+        mock_driver, service = self._service()
+
+        result = service.suggest_node_names("LOCK")
+
+        mock_driver.run_safe_query.assert_not_called()
+        # Same order as the database query (ORDER BY n.name)
+        assert [r["name"] for r in result.data] == ["LockBit", "Locksmith", "lockdown"]
+
+    def test_label_filter_and_limit(self):
+        """Test label filtering and limit in the index."""
+        _, service = self._service()
+
+        assert [r["id"] for r in service.suggest_node_names("lock", label="Malware").data] == ["1", "4"]
+        assert [r["name"] for r in service.suggest_node_names("lock", limit=2).data] == [
+            "LockBit",
+            "Locksmith",
+        ]
+        assert service.suggest_node_names("zzz").data == []
+
+    def test_invalid_label_rejected(self):
+        """Test label validation still applies with an index."""
+        _, service = self._service()
+
+        result = service.suggest_node_names("lock", label="Bogus")
+
+        assert result.success is False
+
+    def test_time_filter_uses_database(self):
+        """Test time-filtered suggestions bypass the index."""
+        mock_driver, service = self._service()
+
+        service.suggest_node_names("lock", start_date="2022-01-01", end_date="2023-01-01")
+
+        mock_driver.run_safe_query.assert_called_once()
+
+    def test_fuzzy_search_served_from_index(self):
+        """Test fuzzy search ranks prefix matches first without a query."""
+        mock_driver, service = self._service(
+            self.ROWS + [{"name": "Unlocked", "label": "Campaign", "id": "5"}]
+        )
+
+        result = service.fuzzy_search("LOCK")
+
+        mock_driver.run_safe_query.assert_not_called()
+        assert [(r["name"], r["relevance"]) for r in result.data] == [
+            ("LockBit", 1),
+            ("Locksmith", 1),
+            ("lockdown", 1),
+            ("Unlocked", 2),
+        ]
+
+    def test_fuzzy_search_index_label_and_limit(self):
+        """Test label filtering and limit for fuzzy search in the index."""
+        _, service = self._service()
+
+        assert [r["id"] for r in service.fuzzy_search("ock", label="Malware").data] == ["1", "4"]
+        assert len(service.fuzzy_search("ock", limit=1).data) == 1
+        assert service.fuzzy_search("fuzzy_search", label="Bogus").success is False
+
+    def test_fuzzy_time_filter_uses_database(self):
+        """Test time-filtered fuzzy searches bypass the index."""
+        mock_driver, service = self._service()
+
+        service.fuzzy_search("ock", start_date="2022-01-01", end_date="2023-01-01")
+
+        mock_driver.run_safe_query.assert_called_once()
+
+    def test_index_disabled_when_too_large(self):
+        """Test the index is dropped when names exceed max_nodes."""
+        mock_driver, service = self._service()
+
+        assert service.refresh_index(max_nodes=2) is False
+        mock_driver.run_safe_query.reset_mock()
+        service.suggest_node_names("lock")
+
+        mock_driver.run_safe_query.assert_called_once()
+
+    def test_failed_refresh_keeps_index(self):
+        """Test a failed reload keeps serving the previous index."""
+        mock_driver, service = self._service()
+        mock_driver.run_safe_query.return_value = ResultWrapper(success=False, error="down")
+
+        assert service.refresh_index() is False
+        mock_driver.run_safe_query.reset_mock()
+
+        assert len(service.suggest_node_names("lock").data) == 3
+        mock_driver.run_safe_query.assert_not_called()
+
+    def test_invalidate_index(self):
+        """Test invalidate_index falls back to the database."""
+        mock_driver, service = self._service()
+
+        service.invalidate_index()
+        service.suggest_node_names("lock")
+
+        mock_driver.run_safe_query.assert_called_once()
+
+    def test_start_and_stop_refresh(self):
+        """Test start_index_refresh loads now and schedules a timer."""
+        mock_driver = Mock()
+        mock_driver.run_safe_query.return_value = ResultWrapper(success=True, data=[])
+        service = AutocompleteService(mock_driver)
+
+        service.start_index_refresh(interval=3600)
+        try:
+            assert service._name_index == {}
+            assert service._refresh_timer.daemon is True
+        finally:
+            service.stop_index_refresh()
+
+        assert service._refresh_timer is None
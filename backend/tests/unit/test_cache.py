@@ -0,0 +1,54 @@
+"""Unit tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from src.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_get_returns_stored_value(self):
+        """Test a stored value is returned."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+
+    def test_get_missing_returns_default(self):
+        """Test a missing key returns the default."""
+        cache = TTLCache(maxsize=2, ttl=30)
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_entry_expires_after_ttl(self):
+        """Test entries are dropped once their TTL has elapsed."""
+        cache = TTLCache(maxsize=2, ttl=30)
+
+        with patch("src.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear_removes_all_entries(self):
+        """Test clear empties the cache."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
@@ -0,0 +1,89 @@
+"""Unit tests for the application settings."""
+
+import logging
+
+import pytest
+
+from src.config import Settings
+
+
+class TestSettingsFromEnv:
+    """Test Settings.from_env parsing."""
+
+    def test_defaults(self, monkeypatch):
+        """Test defaults apply when no variables are set."""
+        for name in (
+            "NEO4J_URI",
+            "NEO4J_USER",
+            "NEO4J_PASSWORD",
+            "LOG_LEVEL",
+            "NEO4J_WARMUP",
+            "FLASK_HOST",
+            "FLASK_PORT",
+            "FLASK_DEBUG",
+            "NEO4J_POOL_SIZE",
+            "NEO4J_ACQ_TIMEOUT",
+            "NEO4J_MAX_CONN_LIFETIME",
+            "NEO4J_KEEP_ALIVE",
+            "NEO4J_DATABASE",
+            "QCACHE_SIZE",
+            "QCACHE_TTL",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = Settings.from_env()
+
+        assert settings.neo4j_uri == "bolt://localhost:7687"
+        assert settings.neo4j_user == "neo4j"
+        assert settings.log_level == logging.INFO
+        assert settings.warmup is False
+        assert settings.flask_port == 8000
+        assert settings.flask_debug is False
+        assert settings.neo4j_pool_size == 50
+        assert settings.neo4j_acq_timeout_sec == 30.0
+        assert settings.neo4j_max_conn_lifetime_sec == 3600.0
+        assert settings.neo4j_keep_alive is True
+        assert settings.neo4j_database == "neo4j"
+        assert settings.qcache_size == 1024
+        assert settings.qcache_ttl_sec == 30.0
+
+    def test_values_from_environment(self, monkeypatch):
+        """Test variables are parsed into typed settings."""
+        monkeypatch.setenv("NEO4J_URI", "bolt://neo4j:7687")
+        monkeypatch.setenv("LOG_LEVEL", "debug")
+        monkeypatch.setenv("NEO4J_WARMUP", "1")
+        monkeypatch.setenv("FLASK_PORT", "9000")
+        monkeypatch.setenv("FLASK_DEBUG", "True")
+        monkeypatch.setenv("NEO4J_MAX_CONN_LIFETIME", "900")
+        monkeypatch.setenv("NEO4J_KEEP_ALIVE", "0")
+
+        settings = Settings.from_env()
+
+        assert settings.neo4j_uri == "bolt://neo4j:7687"
+        assert settings.log_level == logging.DEBUG
+        assert settings.warmup is True
+        assert settings.flask_port == 9000
+        assert settings.flask_debug is True
+        assert settings.neo4j_max_conn_lifetime_sec == 900.0
+        assert settings.neo4j_keep_alive is False
+
+    def test_invalid_values_fall_back(self, monkeypatch):
+        """Test invalid numeric and level values use the defaults."""
+        monkeypatch.setenv("LOG_LEVEL", "LOUD")
+        monkeypatch.setenv("FLASK_PORT", "eighty")
+        monkeypatch.setenv("NEO4J_POOL_SIZE", "many")
+        monkeypatch.setenv("QCACHE_TTL", "soon")
+
+        settings = Settings.from_env()
+
+        assert settings.log_level == logging.INFO
+        assert settings.flask_port == 8000
+        assert settings.neo4j_pool_size == 50
+        assert settings.qcache_ttl_sec == 30.0
+
+    def test_settings_are_read_only(self):
+        """Test settings cannot be modified after creation."""
+        settings = Settings.from_env()
+
+        with pytest.raises(AttributeError):
+            settings.flask_port = 1
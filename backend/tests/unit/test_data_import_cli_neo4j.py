@@ -161,7 +161,7 @@ class TestImportServiceIntegration:
 
         try:
             # Mock execute for all queries
-            mock_import_driver.execute.side_effect = [
+            mock_import_driver.execute_batch.side_effect = [
                 [{"count": 2, "label": "ThreatActor"}],
                 [{"count": 1, "label": "Malware"}],
                 [{"count": 1, "label": "Campaign"}],
@@ -190,7 +190,7 @@ class TestImportServiceIntegration:
             assert result.relationships_created == 3
             assert result.errors == []
             assert (
-                mock_import_driver.execute.call_count == 5
+                mock_import_driver.execute_batch.call_count == 5
             )  # 3 node queries + 2 relationship queries
 
         finally:
@@ -206,7 +206,7 @@ class TestImportServiceIntegration:
 
         try:
             # Mock execute for the three label groups
-            mock_import_driver.execute.side_effect = [
+            mock_import_driver.execute_batch.side_effect = [
                 [{"count": 20, "label": "ThreatActor"}],
                 [{"count": 15, "label": "Malware"}],
                 [{"count": 15, "label": "Tool"}],
@@ -216,7 +216,7 @@ class TestImportServiceIntegration:
 
             assert result.success is True
             assert result.nodes_created == 50
-            assert mock_import_driver.execute.call_count == 3
+            assert mock_import_driver.execute_batch.call_count == 3
 
         finally:
             Path(temp_path).unlink(missing_ok=True)
@@ -288,7 +288,7 @@ class TestImportServiceIntegration:
 
         try:
             # Mock execute for all 10 label queries
-            mock_import_driver.execute.side_effect = [
+            mock_import_driver.execute_batch.side_effect = [
                 [{"count": 5, "label": label}] for label in labels
             ]
 
@@ -296,7 +296,7 @@ class TestImportServiceIntegration:
 
             assert result.success is True
             assert result.nodes_created == 50
-            assert mock_import_driver.execute.call_count == 10  # One per label
+            assert mock_import_driver.execute_batch.call_count == 10  # One per label
 
         finally:
             Path(temp_path).unlink(missing_ok=True)
@@ -367,7 +367,7 @@ class TestImportServiceIntegration:
 
         try:
             # Mock execute for nodes and relationships
-            mock_import_driver.execute.side_effect = [
+            mock_import_driver.execute_batch.side_effect = [
                 [{"count": 1, "label": "ThreatActor"}],
                 [{"count": 1, "label": "Malware"}],
                 [{"count": 1, "label": "Campaign"}],
@@ -412,7 +412,7 @@ class TestImportServiceIntegration:
             assert result.nodes_created == 4
             assert result.relationships_created == 4
             # 4 node queries + 4 relationship queries
-            assert mock_import_driver.execute.call_count == 8
+            assert mock_import_driver.execute_batch.call_count == 8
 
         finally:
             Path(temp_path).unlink(missing_ok=True)
@@ -440,7 +440,7 @@ class TestImportServiceIntegration:
             assert result.nodes_created == 0
             assert result.relationships_created == 0
             # Verify no database operations were executed
-            assert mock_import_driver.execute.call_count == 0
+            assert mock_import_driver.execute_batch.call_count == 0
 
         finally:
             Path(temp_path).unlink(missing_ok=True)
@@ -472,7 +472,7 @@ class TestImportServiceIntegration:
             temp_path = f.name
 
         try:
-            mock_import_driver.execute.return_value = [
+            mock_import_driver.execute_batch.return_value = [
                 {"count": 1, "label": "ThreatActor"}
             ]
 
@@ -481,11 +481,12 @@ class TestImportServiceIntegration:
             assert result.success is True
 
             # Verify the query was called with all properties
-            call_args = mock_import_driver.execute.call_args
-            query, params = call_args[0]
+            call_args = mock_import_driver.execute_batch.call_args
+            query, rows = call_args[0]
 
             # Check that all properties were included in parameters
-            node_data = params["nodes_ThreatActor"][0]
+            assert call_args.kwargs["param_name"] == "nodes_ThreatActor"
+            node_data = rows[0]
             assert node_data["name"] == "APT28"
             assert node_data["type"] == "Nation-State"
             assert node_data["motivation"] == "Espionage"
@@ -530,7 +531,7 @@ class TestImportServiceIntegration:
             temp_path = f.name
 
         try:
-            mock_import_driver.execute.side_effect = [
+            mock_import_driver.execute_batch.side_effect = [
                 [{"count": 1, "label": "ThreatActor"}],
                 [{"count": 1, "label": "Malware"}],
                 [
@@ -549,10 +550,11 @@ class TestImportServiceIntegration:
 
             # Verify relationship properties were included
             # The third call should be for the relationship
-            rel_call = mock_import_driver.execute.call_args_list[2]
-            query, params = rel_call[0]
+            rel_call = mock_import_driver.execute_batch.call_args_list[2]
+            query, rows = rel_call[0]
 
-            rel_data = params["rels_ThreatActor_USES_Malware"][0]
+            assert rel_call.kwargs["param_name"] == "rels_ThreatActor_USES_Malware"
+            rel_data = rows[0]
             assert rel_data["properties"]["source"] == "Report 123"
             assert rel_data["properties"]["first_seen"] == "2020-01-01"
             assert rel_data["properties"]["last_seen"] == "2024-01-01"
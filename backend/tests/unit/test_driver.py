@@ -5,10 +5,17 @@ and ResultWrapper class. All tests use mocked Neo4j dependencies to ensure
 fast, isolated testing without requiring a database connection.
 """
 
+import dataclasses
 import pytest
 import logging
 from unittest.mock import Mock, MagicMock, patch, call
-from src.driver import GraphDBDriver, ResultWrapper
+from src import driver as driver_module
+from src.driver import (
+    GraphDBDriver,
+    ResultWrapper,
+    _normalize_query,
+    rust_codec_available,
+)
 
 
 class TestResultWrapper:
@@ -69,6 +76,12 @@ class TestResultWrapper:
         assert '"success": false' in str_result
         assert '"error": "Test error"' in str_result
 
+    def test_str_non_string_keys(self):
+        """Test ResultWrapper string representation with integer keys."""
+        wrapper = ResultWrapper(success=True, data={1: "one"})
+
+        assert '"1": "one"' in str(wrapper)
+
 
 class TestGraphDBDriverInit:
     """Test suite for GraphDBDriver initialization."""
@@ -81,9 +94,87 @@ class TestGraphDBDriverInit:
 
         driver = GraphDBDriver(uri, user, password)
 
-        mock_neo4j_driver.assert_called_once_with(uri, auth=(user, password))
+        mock_neo4j_driver.assert_called_once_with(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=50,
+            connection_acquisition_timeout=30.0,
+            max_connection_lifetime=3600,
+            keep_alive=True,
+        )
         assert driver.driver is not None
 
+    @staticmethod
+    def _patch_settings(monkeypatch, **changes):
+        """Replace src.driver.settings with a copy holding changes."""
+        monkeypatch.setattr(
+            driver_module,
+            "settings",
+            dataclasses.replace(driver_module.settings, **changes),
+        )
+
+    def test_init_pool_settings_from_config(self, mock_neo4j_driver, monkeypatch):
+        """Test that pool settings default to src.config settings."""
+        self._patch_settings(monkeypatch, neo4j_pool_size=8, neo4j_acq_timeout_sec=5.0)
+
+        GraphDBDriver("bolt://localhost", "user", "pass")
+
+        kwargs = mock_neo4j_driver.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 8
+        assert kwargs["connection_acquisition_timeout"] == 5.0
+
+    def test_init_pool_settings_explicit(self, mock_neo4j_driver):
+        """Test that explicit pool settings override the defaults."""
+        GraphDBDriver(
+            "bolt://localhost", "user", "pass", pool_size=4, acquisition_timeout=2
+        )
+
+        kwargs = mock_neo4j_driver.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 4
+        assert kwargs["connection_acquisition_timeout"] == 2
+
+    def test_init_connection_lifetime_settings(self, mock_neo4j_driver, monkeypatch):
+        """Test connection lifetime and keep-alive come from config or arguments."""
+        self._patch_settings(
+            monkeypatch, neo4j_max_conn_lifetime_sec=600.0, neo4j_keep_alive=False
+        )
+
+        GraphDBDriver("bolt://localhost", "user", "pass")
+        kwargs = mock_neo4j_driver.call_args.kwargs
+        assert kwargs["max_connection_lifetime"] == 600.0
+        assert kwargs["keep_alive"] is False
+
+        GraphDBDriver(
+            "bolt://localhost", "user", "pass", max_connection_lifetime=60, keep_alive=True
+        )
+        kwargs = mock_neo4j_driver.call_args.kwargs
+        assert kwargs["max_connection_lifetime"] == 60
+        assert kwargs["keep_alive"] is True
+
+    def test_init_database_default(self, mock_neo4j_driver, monkeypatch):
+        """Test that the target database defaults to neo4j."""
+        self._patch_settings(monkeypatch, neo4j_database="neo4j")
+
+        driver = GraphDBDriver("bolt://localhost", "user", "pass")
+
+        assert driver.database == "neo4j"
+
+    def test_init_database_from_config(self, mock_neo4j_driver, monkeypatch):
+        """Test that the target database defaults to settings.neo4j_database."""
+        self._patch_settings(monkeypatch, neo4j_database="threatintel")
+
+        driver = GraphDBDriver("bolt://localhost", "user", "pass")
+
+        assert driver.database == "threatintel"
+
+    def test_init_database_explicit(self, mock_neo4j_driver, monkeypatch):
+        """Test that an explicit database overrides the settings."""
+        self._patch_settings(monkeypatch, neo4j_database="threatintel")
+
+        driver = GraphDBDriver("bolt://localhost", "user", "pass", database="other")
+
+        assert driver.database == "other"
+
     def test_init_sets_default_log_level(self, mock_neo4j_driver):
         """Test that initialization sets default logging level to INFO."""
         driver = GraphDBDriver("bolt://localhost", "user", "pass")
@@ -108,6 +199,24 @@ class TestGraphDBDriverConnect:
         assert result == "connected"
 
 
+class TestGraphDBDriverPing:
+    """Test suite for GraphDBDriver ping method."""
+
+    def test_ping_success(self, db_driver, mock_neo4j_driver):
+        """Test that ping returns True when connectivity is verified."""
+        assert db_driver.ping() is True
+        mock_neo4j_driver.return_value.verify_connectivity.assert_called_once()
+
+    def test_ping_failure(self, db_driver, mock_neo4j_driver, mock_session):
+        """Test that ping returns False and runs no query on failure."""
+        mock_neo4j_driver.return_value.verify_connectivity.side_effect = Exception(
+            "Connection refused"
+        )
+
+        assert db_driver.ping() is False
+        mock_session.execute_read.assert_not_called()
+
+
 class TestGraphDBDriverClose:
     """Test suite for GraphDBDriver close method."""
 
@@ -188,29 +297,45 @@ class TestGraphDBDriverExecute:
     def test_execute_logs_read_operation(
         self, db_driver, mock_session, sample_query_result
     ):
-        """Test that execute logs read operations."""
+        """Test that execute logs read operations at DEBUG level."""
         query = "MATCH (n) RETURN n"
         params = {"test": "value"}
         mock_session.execute_read.return_value = sample_query_result
+        db_driver.logger.setLevel(logging.DEBUG)
 
-        with patch.object(db_driver.logger, "info") as mock_log:
+        with patch.object(db_driver.logger, "debug") as mock_log:
             db_driver.execute(query, params)
 
-            calls = mock_log.call_args_list
-            assert any("Read query executed" in str(c) for c in calls)
+            assert mock_log.call_args.args[1] == "R"
+            assert query in mock_log.call_args.args
 
     def test_execute_logs_write_operation(
         self, db_driver, mock_session, sample_query_result
     ):
-        """Test that execute logs write operations."""
+        """Test that execute logs write operations at DEBUG level."""
         query = "CREATE (n:Test)"
         mock_session.execute_write.return_value = sample_query_result
+        db_driver.logger.setLevel(logging.DEBUG)
 
-        with patch.object(db_driver.logger, "info") as mock_log:
+        with patch.object(db_driver.logger, "debug") as mock_log:
             db_driver.execute(query, write=True)
 
-            calls = mock_log.call_args_list
-            assert any("Write query executed" in str(c) for c in calls)
+            assert mock_log.call_args.args[1] == "W"
+
+    def test_execute_does_not_log_queries_at_info(
+        self, db_driver, mock_session, sample_query_result
+    ):
+        """Test that query logging is skipped entirely above DEBUG level."""
+        mock_session.execute_read.return_value = sample_query_result
+        db_driver.logger.setLevel(logging.INFO)
+
+        with patch.object(db_driver.logger, "info") as mock_info, patch.object(
+            db_driver.logger, "debug"
+        ) as mock_debug:
+            db_driver.execute("MATCH (n) RETURN n", {"test": "value"})
+
+            mock_info.assert_not_called()
+            mock_debug.assert_not_called()
 
     def test_execute_raises_runtime_error_on_failure(self, db_driver, mock_session):
         """Test that execute raises RuntimeError on query failure."""
@@ -237,6 +362,190 @@ class TestGraphDBDriverExecute:
             assert error_msg in str(mock_log.call_args)
 
 
+class TestGraphDBDriverResultFormat:
+    """Test suite for the result_format option of execute."""
+
+    @staticmethod
+    def _run_in_tx(mock_session, records, keys):
+        """Make execute_read run the transaction function on a fake result."""
+        result = MagicMock()
+        result.keys.return_value = keys
+        result.__iter__.return_value = iter(records)
+        tx = Mock()
+        tx.run.return_value = result
+        mock_session.execute_read.side_effect = lambda fn: fn(tx)
+
+    @staticmethod
+    def _record(values, data):
+        """Build a fake neo4j Record."""
+        record = Mock()
+        record.values.return_value = values
+        record.data.return_value = data
+        return record
+
+    def test_dict_format_is_default(self, db_driver, mock_session):
+        """Test that records are converted to dicts by default."""
+        record = self._record(["APT28"], {"name": "APT28"})
+        self._run_in_tx(mock_session, [record], ["name"])
+
+        assert db_driver.execute("MATCH (n) RETURN n.name AS name") == [
+            {"name": "APT28"}
+        ]
+
+    def test_columns_format(self, db_driver, mock_session):
+        """Test that columns format returns keys and value rows."""
+        records = [
+            self._record(["APT28", "ThreatActor"], None),
+            self._record(["X-Agent", "Malware"], None),
+        ]
+        self._run_in_tx(mock_session, records, ["name", "label"])
+
+        result = db_driver.execute(
+            "MATCH (n) RETURN n.name AS name, labels(n)[0] AS label",
+            result_format="columns",
+        )
+
+        assert result == {
+            "keys": ["name", "label"],
+            "rows": [["APT28", "ThreatActor"], ["X-Agent", "Malware"]],
+        }
+        for record in records:
+            record.data.assert_not_called()
+
+    def test_raw_format_returns_records(self, db_driver, mock_session):
+        """Test that raw format returns the records unconverted."""
+        record = self._record(["APT28"], {"name": "APT28"})
+        self._run_in_tx(mock_session, [record], ["name"])
+
+        result = db_driver.execute("MATCH (n) RETURN n.name", result_format="raw")
+
+        assert result == [record]
+        record.data.assert_not_called()
+
+    def test_write_without_return_data_consumes(self, db_driver, mock_session):
+        """Test that writes with return_data=False skip record iteration."""
+        result = MagicMock()
+        tx = Mock()
+        tx.run.return_value = result
+        mock_session.execute_write.side_effect = lambda fn: fn(tx)
+        db_driver.logger.setLevel(logging.DEBUG)
+
+        data = db_driver.execute(
+            "CREATE (n:Tool {name: $name})", {"name": "x"}, write=True, return_data=False
+        )
+
+        assert data is None
+        result.consume.assert_called_once()
+        result.__iter__.assert_not_called()
+
+    def test_read_ignores_return_data_false(self, db_driver, mock_session):
+        """Test that read queries always return their records."""
+        record = self._record(["APT28"], {"name": "APT28"})
+        self._run_in_tx(mock_session, [record], ["name"])
+
+        data = db_driver.execute("MATCH (n) RETURN n.name AS name", return_data=False)
+
+        assert data == [{"name": "APT28"}]
+
+    def test_invalid_format_raises(self, db_driver, mock_session):
+        """Test that an unknown format is rejected before opening a session."""
+        with pytest.raises(ValueError, match="Unsupported result format"):
+            db_driver.execute("MATCH (n) RETURN n", result_format="xml")
+
+        mock_session.execute_read.assert_not_called()
+
+    def test_run_safe_query_invalid_format(self, db_driver):
+        """Test that run_safe_query reports an unknown format as failure."""
+        result = db_driver.run_safe_query("MATCH (n) RETURN n", result_format="xml")
+
+        assert result.success is False
+        assert "Unsupported result format" in result.error
+
+    def test_columns_results_cached_separately(self, db_driver, mock_session):
+        """Test that dict and columns results do not share cache entries."""
+        mock_session.execute_read.side_effect = [
+            [{"name": "APT28"}],
+            {"keys": ["name"], "rows": [["APT28"]]},
+        ]
+        query = "MATCH (n) RETURN n.name AS name"
+
+        as_dicts = db_driver.run_safe_query(query)
+        as_columns = db_driver.run_safe_query(query, result_format="columns")
+        cached = db_driver.run_safe_query(query, result_format="columns")
+
+        assert as_dicts.data == [{"name": "APT28"}]
+        assert as_columns.data == {"keys": ["name"], "rows": [["APT28"]]}
+        assert cached.data == as_columns.data
+        assert cached.data["rows"] is not as_columns.data["rows"]
+        assert mock_session.execute_read.call_count == 2
+
+
+class TestGraphDBDriverExecuteStream:
+    """Test suite for GraphDBDriver execute_stream method."""
+
+    def test_execute_stream_yields_records(self, db_driver, mock_session):
+        """Test that records are yielded one by one as dicts."""
+        records = [Mock(), Mock()]
+        records[0].data.return_value = {"name": "APT28"}
+        records[1].data.return_value = {"name": "APT29"}
+        mock_session.run.return_value = iter(records)
+
+        stream = db_driver.execute_stream("MATCH (n) RETURN n.name AS name", {"x": 1})
+
+        assert next(stream) == {"name": "APT28"}
+        records[1].data.assert_not_called()
+        assert list(stream) == [{"name": "APT29"}]
+        mock_session.run.assert_called_once_with(
+            "MATCH (n) RETURN n.name AS name", {"x": 1}
+        )
+
+    def test_execute_stream_uses_read_session(
+        self, db_driver, mock_neo4j_driver, mock_session
+    ):
+        """Test that streaming opens a read-mode session."""
+        mock_session.run.return_value = iter([])
+
+        list(db_driver.execute_stream("MATCH (n) RETURN n"))
+
+        session_kwargs = mock_neo4j_driver.return_value.session.call_args.kwargs
+        assert session_kwargs["default_access_mode"] == "READ"
+
+    def test_execute_stream_reuses_bound_session(
+        self, db_driver, mock_neo4j_driver, mock_session
+    ):
+        """Test that streaming reads from the request-bound session."""
+        mock_session.run.return_value = iter([])
+
+        db_driver.bind_session()
+        list(db_driver.execute_stream("MATCH (n) RETURN n"))
+
+        assert mock_neo4j_driver.return_value.session.call_count == 1
+        mock_session.run.assert_called_once()
+        mock_session.close.assert_not_called()
+
+    @pytest.mark.parametrize("bound", [False, True])
+    def test_execute_stream_session_is_read_only(
+        self, db_driver, mock_neo4j_driver, mock_session, bound
+    ):
+        """Test that streamed queries always run in a READ_ACCESS session."""
+        mock_session.run.return_value = iter([])
+
+        if bound:
+            db_driver.bind_session()
+        list(db_driver.execute_stream("CALL db.createLabel('X')"))
+
+        mock_session.run.assert_called_once()
+        session_kwargs = mock_neo4j_driver.return_value.session.call_args.kwargs
+        assert session_kwargs["default_access_mode"] == "READ"
+
+    def test_execute_stream_raises_runtime_error(self, db_driver, mock_session):
+        """Test that query failures surface as RuntimeError."""
+        mock_session.run.side_effect = Exception("Syntax error")
+
+        with pytest.raises(RuntimeError, match="Query failed: Syntax error"):
+            list(db_driver.execute_stream("MATCH (n RETURN n"))
+
+
 class TestGraphDBDriverRunSafeQuery:
     """Test suite for GraphDBDriver run_safe_query method."""
 
@@ -337,6 +646,169 @@ class TestGraphDBDriverRunSafeQuery:
             pytest.fail("ResultWrapper should evaluate to False")
 
 
+class TestGraphDBDriverWriteGuard:
+    """Test suite for write keyword rejection on read paths."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "CREATE (n:Tool {name: 'x'})",
+            "MATCH (n) SET n.seen = true RETURN n",
+            "match (n) detach delete n",
+            "MERGE (n:Tool {name: $name})",
+            "MATCH (n) REMOVE n.name",
+            "DROP INDEX tool_name",
+            "MATCH (n) FOREACH (x IN [1] | SET n.x = x)",
+            "MATCH (n {name: 'it''s'}) DELETE n",
+            "MATCH (n) // comment\nDELETE n",
+        ],
+    )
+    def test_run_safe_query_rejects_write_keywords(
+        self, db_driver, mock_session, query
+    ):
+        """Test that write queries fail without reaching the database."""
+        result = db_driver.run_safe_query(query)
+
+        assert result.success is False
+        assert result.error == "Write keyword in read query"
+        mock_session.execute_read.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (n) RETURN n.created_at AS created",
+            "MATCH (n) RETURN n.dataset, n.offset",
+            "MATCH (n) WHERE n.name = $name RETURN n",
+            "MATCH (n {name:'DELETE me'}) RETURN n",
+            'MATCH (n) WHERE n.name = "Set \\" Create" RETURN n',
+            "MATCH (n:`Drop Zone`) RETURN n.set AS merge_flag",
+            "MATCH (n) // create a report\nRETURN n /* DETACH */",
+        ],
+    )
+    def test_run_safe_query_allows_keyword_substrings(
+        self, db_driver, mock_session, query
+    ):
+        """Test that identifiers containing keywords are not rejected."""
+        mock_session.execute_read.return_value = []
+
+        assert db_driver.run_safe_query(query).success is True
+
+    def test_execute_stream_rejects_write_keywords(self, db_driver, mock_session):
+        """Test that streaming refuses write queries before opening a session."""
+        with pytest.raises(RuntimeError, match="Write keyword in read query"):
+            next(db_driver.execute_stream("CREATE (n:Tool) RETURN n"))
+
+        mock_session.run.assert_not_called()
+
+
+class TestQueryNormalization:
+    """Test suite for query normalization before dispatch."""
+
+    def test_collapses_whitespace(self):
+        """Test that runs of whitespace become single spaces."""
+        query, literals, _ = _normalize_query("MATCH  (n)\n\t RETURN n ")
+
+        assert query == "MATCH (n) RETURN n"
+        assert literals == ()
+
+    def test_extracts_limit_and_skip(self):
+        """Test that integer LIMIT/SKIP values become parameters."""
+        query, literals, _ = _normalize_query("MATCH (n) RETURN n SKIP 5 LIMIT 100")
+
+        assert query == "MATCH (n) RETURN n SKIP $_lit0 LIMIT $_lit1"
+        assert literals == (("_lit0", 5), ("_lit1", 100))
+
+    def test_extracts_string_equality(self):
+        """Test that simple string comparisons become parameters."""
+        query, literals, _ = _normalize_query("MATCH (n) WHERE n.name = 'APT  28' RETURN n")
+
+        assert query == "MATCH (n) WHERE n.name = $_lit0 RETURN n"
+        assert literals == (("_lit0", "APT  28"),)
+
+    def test_string_contents_untouched(self):
+        """Test that whitespace and keywords inside strings are preserved."""
+        original = 'MATCH (n) WHERE n.q CONTAINS "x = \'y\'  LIMIT 5" RETURN n'
+
+        query, literals, _ = _normalize_query(original)
+
+        assert query == original
+        assert literals == ()
+
+    def test_escaped_strings_not_extracted(self):
+        """Test that strings with escapes are left inline."""
+        query, literals, _ = _normalize_query("MATCH (n) WHERE n.x = 'it\\'s' RETURN n")
+
+        assert "'it\\'s'" in query
+        assert literals == ()
+
+    def test_line_comment_removed(self):
+        """Test that a // comment does not swallow the following lines."""
+        query, literals, _ = _normalize_query("MATCH (n) // first pass\nRETURN n LIMIT 5")
+
+        assert query == "MATCH (n) RETURN n LIMIT $_lit0"
+        assert literals == (("_lit0", 5),)
+
+    def test_comment_with_quote_ignored(self):
+        """Test that quotes inside comments do not start a string literal."""
+        query, literals, _ = _normalize_query(
+            "MATCH (n) // don't match\nWHERE n.name = 'APT28' /* it's */ RETURN n"
+        )
+
+        assert query == "MATCH (n) WHERE n.name = $_lit0 RETURN n"
+        assert literals == (("_lit0", "APT28"),)
+
+    def test_backtick_identifier_untouched(self):
+        """Test that backtick names keep their whitespace and comment markers."""
+        original = "MATCH (n:`Threat  Actor`) RETURN n.`a // b` AS `x  y`"
+
+        query, literals, _ = _normalize_query(original)
+
+        assert query == original
+        assert literals == ()
+
+    def test_same_shape_same_digest(self):
+        """Test that queries differing only in literals share a digest."""
+        _, _, first = _normalize_query("MATCH (n) RETURN n LIMIT 10")
+        _, _, second = _normalize_query("MATCH (n)  RETURN n LIMIT 50")
+
+        assert first == second
+        assert len(first) == 32
+
+    def test_run_safe_query_sends_normalized_query(self, db_driver, mock_session):
+        """Test that run_safe_query executes the parameterized form."""
+        mock_session.execute_read.return_value = []
+
+        with patch.object(db_driver, "execute", return_value=[]) as mock_execute:
+            db_driver.run_safe_query(
+                "MATCH (n) WHERE n.name = 'APT28' RETURN n LIMIT 5", {"x": 1}
+            )
+
+        query, params = mock_execute.call_args.args
+        assert query == "MATCH (n) WHERE n.name = $_lit0 RETURN n LIMIT $_lit1"
+        assert params == {"x": 1, "_lit0": "APT28", "_lit1": 5}
+
+    def test_run_safe_query_keeps_query_on_name_clash(self, db_driver):
+        """Test that a caller parameter named like a literal disables rewriting."""
+        original = "MATCH (n) RETURN n LIMIT 5"
+
+        with patch.object(db_driver, "execute", return_value=[]) as mock_execute:
+            db_driver.run_safe_query(original, {"_lit0": "mine"})
+
+        query, params = mock_execute.call_args.args
+        assert query == original
+        assert params == {"_lit0": "mine"}
+
+    def test_cache_separates_literal_values(self, db_driver, mock_session):
+        """Test that normalized queries with different literals are cached apart."""
+        mock_session.execute_read.side_effect = [[{"n": 1}], [{"n": 2}]]
+
+        first = db_driver.run_safe_query("MATCH (n) RETURN n LIMIT 1")
+        second = db_driver.run_safe_query("MATCH (n) RETURN n LIMIT 2")
+
+        assert first.data == [{"n": 1}]
+        assert second.data == [{"n": 2}]
+
+
 class TestGraphDBDriverSessionManagement:
     """Test suite for session management in GraphDBDriver."""
 
@@ -352,6 +824,18 @@ class TestGraphDBDriverSessionManagement:
         mock_session.__enter__.assert_called_once()
         mock_session.__exit__.assert_called_once()
 
+    def test_execute_targets_configured_database(
+        self, db_driver, mock_neo4j_driver, mock_session
+    ):
+        """Test that sessions are opened on the configured database."""
+        mock_session.execute_read.return_value = []
+
+        db_driver.execute("MATCH (n) RETURN n")
+
+        mock_neo4j_driver.return_value.session.assert_called_once_with(
+            database=db_driver.database
+        )
+
     def test_execute_closes_session_on_error(self, db_driver, mock_session):
         """Test that session closes even when query fails."""
         query = "INVALID"
@@ -361,3 +845,301 @@ class TestGraphDBDriverSessionManagement:
             db_driver.execute(query)
 
         mock_session.__exit__.assert_called_once()
+
+
+class TestGraphDBDriverBoundSession:
+    """Test suite for request-scoped session reuse."""
+
+    def test_bound_session_reused_across_queries(
+        self, db_driver, mock_neo4j_driver, mock_session
+    ):
+        """Test that execute reuses the bound session for every query."""
+        mock_session.execute_read.return_value = []
+
+        db_driver.bind_session()
+        db_driver.execute("MATCH (n) RETURN n")
+        db_driver.execute("MATCH (m) RETURN m")
+
+        mock_neo4j_driver.return_value.session.assert_called_once_with(
+            database=db_driver.database, default_access_mode="READ"
+        )
+        mock_session.__exit__.assert_not_called()
+        mock_session.close.assert_not_called()
+
+    def test_release_session_closes_bound_session(
+        self, db_driver, mock_neo4j_driver, mock_session
+    ):
+        """Test that release_session closes and unbinds the session."""
+        mock_session.execute_read.return_value = []
+
+        db_driver.bind_session()
+        db_driver.release_session()
+        db_driver.execute("MATCH (n) RETURN n")
+
+        mock_session.close.assert_called_once()
+        assert mock_neo4j_driver.return_value.session.call_count == 2
+        mock_session.__exit__.assert_called_once()
+
+    def test_bind_session_is_idempotent(
+        self, db_driver, mock_neo4j_driver, mock_session
+    ):
+        """Test that binding twice keeps the first session."""
+        db_driver.bind_session()
+        db_driver.bind_session()
+
+        assert mock_neo4j_driver.return_value.session.call_count == 1
+
+    def test_release_without_bind(self, db_driver, mock_session):
+        """Test that releasing with no bound session does nothing."""
+        db_driver.release_session()
+
+        mock_session.close.assert_not_called()
+
+
+class TestGraphDBDriverExecuteBatch:
+    """Test suite for GraphDBDriver execute_batch method."""
+
+    def test_execute_batch_chunks_rows(self, db_driver, mock_session):
+        """Test that rows are written in chunks of batch_size."""
+        rows = [{"name": f"Actor{i}"} for i in range(5)]
+        query = "UNWIND $rows AS row MERGE (n:ThreatActor {name: row.name})"
+        mock_session.execute_write.return_value = []
+
+        db_driver.execute_batch(query, rows, batch_size=2)
+
+        chunks = [c.args[1] for c in mock_session.execute_write.call_args_list]
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    def test_execute_batch_returns_records_of_all_chunks(
+        self, db_driver, mock_session
+    ):
+        """Test that the records of every chunk are returned in order."""
+        mock_session.execute_write.side_effect = [[{"count": 2}], [{"count": 1}]]
+
+        records = db_driver.execute_batch(
+            "UNWIND $rows AS row RETURN count(*) AS count",
+            [{"a": i} for i in range(3)],
+            batch_size=2,
+        )
+
+        assert records == [{"count": 2}, {"count": 1}]
+
+    def test_execute_batch_custom_param_name(self, db_driver, mock_session):
+        """Test that the list parameter name can be customized."""
+        query = "UNWIND $nodes AS props MERGE (n:Tool {name: props.name})"
+        mock_session.execute_write.return_value = []
+        db_driver.execute_batch(query, [{"name": "Mimikatz"}], param_name="nodes")
+
+        tx = Mock()
+        tx.run.return_value = [Mock(data=Mock(return_value={"count": 1}))]
+        work, chunk = mock_session.execute_write.call_args.args
+        assert work(tx, chunk) == [{"count": 1}]
+        tx.run.assert_called_once_with(query, {"nodes": [{"name": "Mimikatz"}]})
+
+    def test_execute_batch_reuses_bound_session(
+        self, db_driver, mock_neo4j_driver, mock_session
+    ):
+        """Test that chunks run on the request-bound session when present."""
+        mock_session.execute_write.return_value = []
+
+        db_driver.bind_session()
+        db_driver.execute_batch("UNWIND $rows AS row RETURN row", [{"a": 1}] * 3, 1)
+
+        assert mock_neo4j_driver.return_value.session.call_count == 1
+        mock_session.close.assert_not_called()
+
+    def test_execute_batch_empty_rows(self, db_driver, mock_session):
+        """Test that an empty row list executes nothing."""
+        assert db_driver.execute_batch("UNWIND $rows AS row RETURN row", []) == []
+        mock_session.execute_write.assert_not_called()
+
+    def test_execute_batch_rejects_invalid_batch_size(self, db_driver):
+        """Test that a batch size below 1 is rejected."""
+        with pytest.raises(ValueError):
+            db_driver.execute_batch("UNWIND $rows AS row RETURN row", [{}], 0)
+
+    def test_execute_batch_raises_runtime_error(self, db_driver, mock_session):
+        """Test that chunk failures are wrapped in RuntimeError."""
+        mock_session.execute_write.side_effect = Exception("Constraint violation")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            db_driver.execute_batch("UNWIND $rows AS row RETURN row", [{"a": 1}])
+
+        assert "Batch query failed at row 0" in str(exc_info.value)
+
+
+class TestGraphDBDriverRunReadMany:
+    """Test suite for GraphDBDriver run_read_many method."""
+
+    def test_queries_share_one_read_transaction(self, db_driver, mock_session):
+        """Test all queries run inside a single execute_read call."""
+        tx = Mock()
+        mock_session.execute_read.side_effect = lambda work: work(tx)
+        first, second = Mock(), Mock()
+        first.data.return_value = {"nodes": 3}
+        second.data.return_value = {"relationships": 5}
+        tx.run.side_effect = [[first], [second]]
+
+        result = db_driver.run_read_many(
+            [
+                ("MATCH (n) RETURN count(n) AS nodes", None),
+                ("MATCH ()-[r]->() RETURN count(r) AS relationships", {}),
+            ]
+        )
+
+        assert result.success is True
+        assert result.data == [[{"nodes": 3}], [{"relationships": 5}]]
+        mock_session.execute_read.assert_called_once()
+        assert tx.run.call_count == 2
+
+    def test_uses_read_session(self, db_driver, mock_neo4j_driver, mock_session):
+        """Test the transaction runs on a READ_ACCESS session."""
+        mock_session.execute_read.return_value = [[]]
+
+        db_driver.run_read_many([("RETURN 1", None)])
+
+        session_kwargs = mock_neo4j_driver.return_value.session.call_args.kwargs
+        assert session_kwargs["default_access_mode"] == "READ"
+
+    def test_write_query_rejected(self, db_driver, mock_session):
+        """Test a write keyword in any query rejects the whole batch."""
+        result = db_driver.run_read_many(
+            [("RETURN 1", None), ("MATCH (n) DELETE n", None)]
+        )
+
+        assert result.success is False
+        mock_session.execute_read.assert_not_called()
+
+    def test_failure_returns_error(self, db_driver, mock_session):
+        """Test a failing transaction returns an error wrapper."""
+        mock_session.execute_read.side_effect = Exception("Syntax error")
+
+        result = db_driver.run_read_many([("RETURN 1", None)])
+
+        assert result.success is False
+        assert "Syntax error" in result.error
+
+
+class TestGraphDBDriverQueryCache:
+    """Test suite for the run_safe_query result cache."""
+
+    def test_repeated_read_served_from_cache(self, db_driver, mock_session):
+        """Test that an identical read query hits the database once."""
+        mock_session.execute_read.return_value = [{"name": "APT28"}]
+        query = "MATCH (n:ThreatActor) RETURN n.name AS name"
+
+        first = db_driver.run_safe_query(query, {"limit": 10})
+        second = db_driver.run_safe_query(query, {"limit": 10})
+
+        assert first.data == second.data == [{"name": "APT28"}]
+        assert mock_session.execute_read.call_count == 1
+
+    def test_cached_data_is_copied(self, db_driver, mock_session):
+        """Test that mutating returned data does not change the cache."""
+        mock_session.execute_read.return_value = [{"name": "APT28"}]
+        query = "MATCH (n) RETURN n.name AS name"
+
+        db_driver.run_safe_query(query).data.append({"name": "Injected"})
+
+        assert db_driver.run_safe_query(query).data == [{"name": "APT28"}]
+
+    def test_cached_records_are_copied(self, db_driver, mock_session):
+        """Test that mutating a returned record does not change the cache."""
+        mock_session.execute_read.return_value = [{"n": {"tags": ["apt"]}}]
+        query = "MATCH (n) RETURN properties(n) AS n"
+
+        record = db_driver.run_safe_query(query).data[0]
+        record["n"]["tags"].append("Injected")
+        record["extra"] = 1
+
+        assert db_driver.run_safe_query(query).data == [{"n": {"tags": ["apt"]}}]
+
+    def test_cached_columns_are_copied(self, db_driver, mock_session):
+        """Test that mutating a returned row does not change the cache."""
+        mock_session.execute_read.return_value = {"keys": ["name"], "rows": [["APT28"]]}
+        query = "MATCH (n) RETURN n.name AS name"
+
+        db_driver.run_safe_query(query, result_format="columns").data["rows"][0][0] = "X"
+
+        cached = db_driver.run_safe_query(query, result_format="columns")
+        assert cached.data == {"keys": ["name"], "rows": [["APT28"]]}
+
+    def test_different_parameters_not_shared(self, db_driver, mock_session):
+        """Test that different parameters use separate cache entries."""
+        mock_session.execute_read.return_value = []
+        query = "MATCH (n {name: $name}) RETURN n"
+
+        db_driver.run_safe_query(query, {"name": "APT28"})
+        db_driver.run_safe_query(query, {"name": "APT29"})
+
+        assert mock_session.execute_read.call_count == 2
+
+    def test_write_invalidates_cache(self, db_driver, mock_session):
+        """Test that a write query clears cached read results."""
+        mock_session.execute_read.return_value = []
+        mock_session.execute_write.return_value = []
+        query = "MATCH (n) RETURN count(n) AS count"
+
+        db_driver.run_safe_query(query)
+        db_driver.execute("CREATE (n:Tool {name: 'x'})", write=True)
+        db_driver.run_safe_query(query)
+
+        assert mock_session.execute_read.call_count == 2
+
+    def test_unhashable_parameters_not_cached(self, db_driver, mock_session):
+        """Test that list parameters bypass the cache instead of failing."""
+        mock_session.execute_read.return_value = []
+        query = "UNWIND $names AS name RETURN name"
+
+        result = db_driver.run_safe_query(query, {"names": ["a", "b"]})
+        db_driver.run_safe_query(query, {"names": ["a", "b"]})
+
+        assert result.success is True
+        assert mock_session.execute_read.call_count == 2
+
+    def test_failures_not_cached(self, db_driver, mock_session):
+        """Test that failed queries are retried on the next call."""
+        mock_session.execute_read.side_effect = [Exception("boom"), []]
+        query = "MATCH (n) RETURN n"
+
+        assert db_driver.run_safe_query(query).success is False
+        assert db_driver.run_safe_query(query).success is True
+
+    def test_use_cache_false_refreshes_entry(self, db_driver, mock_session):
+        """Test use_cache=False runs the query and updates the cache."""
+        mock_session.execute_read.side_effect = [[{"n": 1}], [{"n": 2}]]
+        query = "MATCH (n) RETURN count(n) AS n"
+
+        db_driver.run_safe_query(query)
+        fresh = db_driver.run_safe_query(query, use_cache=False)
+        cached = db_driver.run_safe_query(query)
+
+        assert fresh.data == [{"n": 2}]
+        assert cached.data == [{"n": 2}]
+        assert mock_session.execute_read.call_count == 2
+
+    def test_cache_disabled_with_zero_ttl(self, mock_neo4j_driver, mock_session):
+        """Test that cache_ttl=0 disables caching."""
+        mock_neo4j_driver.return_value.session.return_value = mock_session
+        mock_session.execute_read.return_value = []
+        driver = GraphDBDriver("bolt://localhost", "user", "pass", cache_ttl=0)
+
+        driver.run_safe_query("MATCH (n) RETURN n")
+        driver.run_safe_query("MATCH (n) RETURN n")
+
+        assert mock_session.execute_read.call_count == 2
+
+
+class TestRustCodec:
+    """Test detection of the neo4j-rust-ext codec."""
+
+    def test_available_when_module_found(self):
+        """Test True when the neo4j._rust module spec is found."""
+        with patch("src.driver.importlib.util.find_spec", return_value=Mock()) as spec:
+            assert rust_codec_available() is True
+        spec.assert_called_once_with("neo4j._rust")
+
+    def test_unavailable_when_missing(self):
+        """Test False when the extension is not installed."""
+        with patch("src.driver.importlib.util.find_spec", return_value=None):
+            assert rust_codec_available() is False
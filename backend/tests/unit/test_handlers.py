@@ -8,8 +8,11 @@ Tests should NOT call handlers.init_handlers() again unless specifically
 testing initialization logic.
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
+from neo4j.time import Date
 from src.driver import ResultWrapper
 from src.services.query_builder import QueryValidationError
 from src.api import handlers
@@ -45,9 +48,7 @@ class TestHealthCheckHandler:
 
     def test_health_check_success(self, client, mock_driver):
         """Test successful health check."""
-        mock_driver.run_safe_query.return_value = ResultWrapper(
-            success=True, data=[{"health": 1}]
-        )
+        mock_driver.ping.return_value = True
 
         response = client.get("/api/health")
         assert response.status_code == 200
@@ -55,12 +56,11 @@ class TestHealthCheckHandler:
         data = response.get_json()
         assert data["status"] == "healthy"
         assert data["database"] == "connected"
+        mock_driver.run_safe_query.assert_not_called()
 
     def test_health_check_database_unhealthy(self, client, mock_driver):
         """Test health check when database is disconnected."""
-        mock_driver.run_safe_query.return_value = ResultWrapper(
-            success=False, error="Connection failed"
-        )
+        mock_driver.ping.return_value = False
 
         response = client.get("/api/health")
         assert response.status_code == 503
@@ -82,7 +82,7 @@ class TestHealthCheckHandler:
 
     def test_health_check_exception_handling(self, client, mock_driver):
         """Test health check handles exceptions gracefully."""
-        mock_driver.run_safe_query.side_effect = Exception("Database error")
+        mock_driver.ping.side_effect = Exception("Database error")
 
         response = client.get("/api/health")
         assert response.status_code == 503
@@ -91,15 +91,105 @@ class TestHealthCheckHandler:
         assert data["status"] == "unhealthy"
 
 
+class TestHealthCheckCache:
+    """Test memoization of the health check database probe."""
+
+    def test_probe_reused_within_ttl(self, client, mock_driver):
+        """Test repeated health checks within the TTL probe once."""
+        mock_driver.ping.return_value = True
+
+        for _ in range(5):
+            assert client.get("/api/health").status_code == 200
+
+        mock_driver.ping.assert_called_once()
+
+    def test_probe_repeated_after_ttl(self, client, mock_driver):
+        """Test a stale cache entry triggers a new probe."""
+        mock_driver.ping.side_effect = [False, True]
+
+        with patch("src.api.handlers.time.monotonic", return_value=100.0):
+            assert client.get("/api/health").status_code == 503
+        with patch("src.api.handlers.time.monotonic", return_value=106.0):
+            assert client.get("/api/health").status_code == 200
+
+        assert mock_driver.ping.call_count == 2
+
+    def test_failed_probe_also_cached(self, client, mock_driver):
+        """Test failures are cached so an outage does not multiply probes."""
+        mock_driver.ping.return_value = False
+
+        client.get("/api/health")
+        response = client.get("/api/health")
+
+        assert response.status_code == 503
+        mock_driver.ping.assert_called_once()
+
+    def test_concurrent_probes_coalesced(self, mock_driver):
+        """Test concurrent callers with a stale cache share one probe."""
+        release = threading.Event()
+
+        def slow_ping():
+            release.wait(1)
+            return True
+
+        mock_driver.ping.side_effect = slow_ping
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(handlers._probe_database()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 5
+        mock_driver.ping.assert_called_once()
+
+
+class TestHealthCheckGrace:
+    """Test the stale-while-error fallback of the health check."""
+
+    def test_failure_within_grace_reports_degraded(self, client, mock_driver):
+        """Test a failed probe shortly after a success returns 200 degraded."""
+        mock_driver.ping.side_effect = [True, False]
+
+        with patch("src.api.handlers.time.monotonic", return_value=100.0):
+            client.get("/api/health")
+        with patch("src.api.handlers.time.monotonic", return_value=110.0):
+            response = client.get("/api/health")
+
+        assert response.status_code == 200
+        assert response.get_json()["database"] == "degraded"
+
+    def test_failure_after_grace_reports_unhealthy(self, client, mock_driver):
+        """Test a failed probe long after the last success returns 503."""
+        mock_driver.ping.side_effect = [True, False]
+
+        with patch("src.api.handlers.time.monotonic", return_value=100.0):
+            client.get("/api/health")
+        with patch("src.api.handlers.time.monotonic", return_value=200.0):
+            response = client.get("/api/health")
+
+        assert response.status_code == 503
+        assert response.get_json()["database"] == "disconnected"
+
+    def test_failure_without_prior_success(self, client, mock_driver):
+        """Test no grace applies before the first successful probe."""
+        mock_driver.ping.return_value = False
+
+        assert client.get("/api/health").status_code == 503
+
+
 class TestGetStatsHandler:
     """Test database statistics endpoint handler."""
 
     def test_get_stats_success(self, client, mock_driver):
         """Test successful stats retrieval."""
-        mock_driver.run_safe_query.side_effect = [
-            ResultWrapper(success=True, data=[{"count": 100}]),
-            ResultWrapper(success=True, data=[{"count": 250}]),
-        ]
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True, data=[{"nodes": 100, "relationships": 250}]
+        )
 
         response = client.get("/api/stats")
         assert response.status_code == 200
@@ -109,12 +199,21 @@ class TestGetStatsHandler:
         assert data["nodes"] == 100
         assert data["relationships"] == 250
 
+    def test_get_stats_single_round_trip(self, client, mock_driver):
+        """Test both counts are fetched with one query."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True, data=[{"nodes": 1, "relationships": 0}]
+        )
+
+        client.get("/api/stats")
+
+        mock_driver.run_safe_query.assert_called_once()
+
     def test_get_stats_empty_database(self, client, mock_driver):
         """Test stats with empty database."""
-        mock_driver.run_safe_query.side_effect = [
-            ResultWrapper(success=True, data=[{"count": 0}]),
-            ResultWrapper(success=True, data=[{"count": 0}]),
-        ]
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True, data=[{"nodes": 0, "relationships": 0}]
+        )
 
         response = client.get("/api/stats")
         assert response.status_code == 200
@@ -123,12 +222,11 @@ class TestGetStatsHandler:
         assert data["nodes"] == 0
         assert data["relationships"] == 0
 
-    def test_get_stats_node_query_fails(self, client, mock_driver):
-        """Test stats when node query fails."""
-        mock_driver.run_safe_query.side_effect = [
-            ResultWrapper(success=False, error="Query failed"),
-            ResultWrapper(success=True, data=[{"count": 250}]),
-        ]
+    def test_get_stats_query_fails(self, client, mock_driver):
+        """Test stats when the count query fails."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=False, error="Query failed"
+        )
 
         response = client.get("/api/stats")
         assert response.status_code == 500
@@ -137,18 +235,42 @@ class TestGetStatsHandler:
         assert data["success"] is False
         assert "Query failed" in data["error"]
 
-    def test_get_stats_relationship_query_fails(self, client, mock_driver):
-        """Test stats when relationship query fails."""
+    def test_get_stats_cached(self, client, mock_driver):
+        """Test counts are served from memory on repeated calls."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True, data=[{"nodes": 5, "relationships": 7}]
+        )
+
+        client.get("/api/stats")
+        response = client.get("/api/stats")
+
+        assert response.get_json()["nodes"] == 5
+        mock_driver.run_safe_query.assert_called_once()
+        # Only the handler caches; the driver cache would stack its TTL
+        assert mock_driver.run_safe_query.call_args.kwargs == {"use_cache": False}
+
+    def test_get_stats_fresh_bypasses_caches(self, client, mock_driver):
+        """Test fresh=1 recounts and skips the driver's query cache."""
         mock_driver.run_safe_query.side_effect = [
-            ResultWrapper(success=True, data=[{"count": 100}]),
-            ResultWrapper(success=False, error="Rel query failed"),
+            ResultWrapper(success=True, data=[{"nodes": 5, "relationships": 7}]),
+            ResultWrapper(success=True, data=[{"nodes": 6, "relationships": 8}]),
         ]
 
-        response = client.get("/api/stats")
-        assert response.status_code == 500
+        client.get("/api/stats")
+        response = client.get("/api/stats?fresh=1")
 
-        data = response.get_json()
-        assert data["success"] is False
+        assert response.get_json()["nodes"] == 6
+        assert mock_driver.run_safe_query.call_args.kwargs == {"use_cache": False}
+
+    def test_get_stats_failure_not_cached(self, client, mock_driver):
+        """Test a failed count is retried on the next request."""
+        mock_driver.run_safe_query.side_effect = [
+            ResultWrapper(success=False, error="Query failed"),
+            ResultWrapper(success=True, data=[{"nodes": 1, "relationships": 0}]),
+        ]
+
+        assert client.get("/api/stats").status_code == 500
+        assert client.get("/api/stats").status_code == 200
 
     def test_get_stats_driver_not_initialized(self, client, monkeypatch):
         """Test stats when driver not initialized."""
@@ -187,6 +309,134 @@ class TestExecuteQueryHandler:
         assert data["success"] is True
         assert data["count"] == 2
 
+    def test_execute_query_ndjson_stream(self, client, mock_driver):
+        """Test query results are streamed as NDJSON when requested."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"name": "APT28"}, {"name": "APT29"}]
+        )
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH (n:ThreatActor) RETURN n.name AS name"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert response.get_data() == b'{"name":"APT28"}\n{"name":"APT29"}\n'
+        mock_driver.run_safe_query.assert_not_called()
+
+    def test_execute_query_ndjson_empty_result(self, client, mock_driver):
+        """Test an empty NDJSON stream for queries without results."""
+        mock_driver.execute_stream.return_value = iter([])
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH (n:Nothing) RETURN n"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.get_data() == b""
+
+    def test_execute_query_ndjson_initial_error(self, client, mock_driver):
+        """Test errors before the first record produce a 400 response."""
+        mock_driver.execute_stream.return_value = Mock(
+            __next__=Mock(side_effect=RuntimeError("Query failed: syntax"))
+        )
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH (n RETURN n"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 400
+        assert "syntax" in response.get_json()["error"]
+
+    def test_execute_query_ndjson_error_mid_stream(self, client, mock_driver):
+        """Test errors after the first record end the stream with an error line."""
+
+        def records():
+            yield {"name": "APT28"}
+            raise RuntimeError("Query failed: connection lost")
+
+        mock_driver.execute_stream.return_value = records()
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH (n) RETURN n.name AS name"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        lines = response.get_data().splitlines()
+        assert lines[0] == b'{"name":"APT28"}'
+        assert b"connection lost" in lines[1]
+
+    def test_execute_query_hides_name_lc(self, client, mock_driver):
+        """Test the internal name_lc property is removed from node maps."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data=[{"n": {"name": "APT28", "name_lc": "apt28"}, "name_lc": "apt28"}],
+        )
+
+        response = client.post(
+            "/api/query", json={"query": "MATCH (n) RETURN n, n.name_lc AS name_lc"}
+        )
+
+        assert response.get_json()["data"] == [
+            {"n": {"name": "APT28"}, "name_lc": "apt28"}
+        ]
+
+    def test_execute_query_ndjson_hides_name_lc(self, client, mock_driver):
+        """Test streamed records do not expose name_lc either."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"path": [{"name": "APT28", "name_lc": "apt28"}]}]
+        )
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH p=(n) RETURN nodes(p) AS path"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.get_data() == b'{"path":[{"name":"APT28"}]}\n'
+
+    def test_execute_query_ndjson_temporal_values(self, client, mock_driver):
+        """Test Neo4j dates are streamed in ISO format."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"first_seen": Date(2020, 1, 1)}]
+        )
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH (n) RETURN n.first_seen AS first_seen"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.get_data() == b'{"first_seen":"2020-01-01"}\n'
+
+    def test_execute_query_ndjson_unencodable_value(self, client, mock_driver):
+        """Test values that cannot be encoded end the stream with an error line."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"name": "APT28"}, {"name": object()}]
+        )
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH (n) RETURN n.name AS name"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        lines = response.get_data().splitlines()
+        assert lines[0] == b'{"name":"APT28"}'
+        assert b"error" in lines[1]
+
+    def test_execute_query_json_when_any_accepted(self, client, mock_driver):
+        """Test wildcard Accept headers keep the regular JSON response."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(success=True, data=[])
+
+        response = client.post(
+            "/api/query",
+            json={"query": "MATCH (n) RETURN n"},
+            headers={"Accept": "*/*"},
+        )
+        assert response.get_json()["success"] is True
+        mock_driver.execute_stream.assert_not_called()
+
     def test_execute_query_missing_query(self, client, mock_driver):
         """Test query execution without query field."""
         response = client.post("/api/query", json={"parameters": {}})
@@ -273,7 +523,7 @@ class TestAutocompleteHandler:
 
     def test_autocomplete_min_length(self, client, mock_driver):
         """Test autocomplete with query less than 3 characters."""
-        mock_autocomplete = Mock()
+        mock_autocomplete = Mock(MIN_PREFIX_LEN=3)
         handlers.init_handlers(mock_driver, mock_autocomplete)
 
         response = client.get("/api/autocomplete?q=Sh")
@@ -283,6 +533,16 @@ class TestAutocompleteHandler:
         assert data["success"] is True
         assert data["count"] == 0
         assert "Minimum 3 characters" in data["message"]
+        mock_autocomplete.suggest_node_names.assert_not_called()
+
+    def test_autocomplete_uses_service_min_prefix_len(self, client, mock_driver):
+        """Test the minimum query length follows the service setting."""
+        handlers._autocomplete_service.MIN_PREFIX_LEN = 2
+
+        response = client.get("/api/autocomplete?q=Sh")
+
+        assert response.status_code == 200
+        handlers._autocomplete_service.suggest_node_names.assert_called_once()
 
     def test_autocomplete_with_fuzzy_fallback(self, client, mock_driver):
         """Test autocomplete falls back to fuzzy search."""
@@ -391,6 +651,57 @@ class TestGetNodesHandler:
         response = client.get("/api/nodes?label=InvalidLabel")
         assert response.status_code == 400
 
+    def test_get_nodes_invalid_label_rejected_early(self, client, mock_driver):
+        """Test unknown labels are rejected before any query is built."""
+        response = client.get("/api/nodes?label=InvalidLabel")
+        assert response.status_code == 400
+
+        data = response.get_json()
+        assert data["error"] == "Invalid label"
+        mock_driver.run_safe_query.assert_not_called()
+
+    def test_get_nodes_columns_format(self, client, mock_driver):
+        """Test columnar node retrieval returns keys and rows."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data={"keys": ["n"], "rows": [[{"name": "APT28"}], [{"name": "APT29"}]]},
+        )
+
+        response = client.get("/api/nodes?format=columns")
+        assert response.status_code == 200
+
+        data = response.get_json()
+        assert data["keys"] == ["n"]
+        assert data["rows"] == [[{"name": "APT28"}], [{"name": "APT29"}]]
+        assert data["count"] == 2
+        assert "nodes" not in data
+        assert mock_driver.run_safe_query.call_args.kwargs == {
+            "result_format": "columns"
+        }
+
+    def test_get_nodes_hides_name_lc(self, client, mock_driver):
+        """Test node maps are returned without name_lc in both formats."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True, data=[{"n": {"name": "APT28", "name_lc": "apt28"}}]
+        )
+        assert client.get("/api/nodes").get_json()["nodes"] == [
+            {"n": {"name": "APT28"}}
+        ]
+
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data={"keys": ["n"], "rows": [[{"name": "APT28", "name_lc": "apt28"}]]},
+        )
+        assert client.get("/api/nodes?format=columns").get_json()["rows"] == [
+            [{"name": "APT28"}]
+        ]
+
+    def test_get_nodes_invalid_format(self, client, mock_driver):
+        """Test unknown response formats are rejected."""
+        response = client.get("/api/nodes?format=xml")
+        assert response.status_code == 400
+        mock_driver.run_safe_query.assert_not_called()
+
     def test_get_nodes_query_failed(self, client, mock_driver):
         """Test node retrieval when query fails."""
         mock_driver.run_safe_query.return_value = ResultWrapper(
@@ -408,6 +719,153 @@ class TestGetNodesHandler:
         assert response.status_code == 503
 
 
+class TestGetNodesStream:
+    """Test streamed /api/nodes responses."""
+
+    def test_stream_matches_buffered_shape(self, client, mock_driver):
+        """Test the streamed body decodes to the usual response."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"n": {"name": "APT28"}}, {"n": {"name": "APT29"}}]
+        )
+
+        response = client.get("/api/nodes?stream=1&limit=2")
+
+        assert response.status_code == 200
+        assert response.get_json() == {
+            "success": True,
+            "nodes": [{"n": {"name": "APT28"}}, {"n": {"name": "APT29"}}],
+            "count": 2,
+        }
+        mock_driver.run_safe_query.assert_not_called()
+
+    def test_stream_empty_result(self, client, mock_driver):
+        """Test an empty stream is still a valid document."""
+        mock_driver.execute_stream.return_value = iter([])
+
+        response = client.get("/api/nodes?stream=1")
+
+        assert response.get_json() == {"success": True, "nodes": [], "count": 0}
+
+    def test_stream_initial_error(self, client, mock_driver):
+        """Test errors before the first record produce a 500 response."""
+        mock_driver.execute_stream.return_value = Mock(
+            __next__=Mock(side_effect=RuntimeError("Query failed: down"))
+        )
+
+        response = client.get("/api/nodes?stream=1")
+
+        assert response.status_code == 500
+        assert response.get_json()["success"] is False
+
+    def test_stream_error_mid_stream(self, client, mock_driver):
+        """Test a failure after the first record is reported in the body."""
+
+        def records():
+            yield {"n": {"name": "APT28"}}
+            raise RuntimeError("Query failed: connection lost")
+
+        mock_driver.execute_stream.return_value = records()
+
+        data = client.get("/api/nodes?stream=1").get_json()
+
+        assert data["nodes"] == [{"n": {"name": "APT28"}}]
+        assert data["count"] == 1
+        assert "connection lost" in data["error"]
+
+
+    def test_stream_hides_name_lc(self, client, mock_driver):
+        """Test streamed node maps do not expose name_lc."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"n": {"name": "APT28", "name_lc": "apt28"}}]
+        )
+
+        data = client.get("/api/nodes?stream=1").get_json()
+
+        assert data["nodes"] == [{"n": {"name": "APT28"}}]
+
+    def test_stream_temporal_values(self, client, mock_driver):
+        """Test Neo4j dates are encoded like in the buffered response."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"n": {"name": "APT28", "first_seen": Date(2020, 1, 1)}}]
+        )
+
+        data = client.get("/api/nodes?stream=1").get_json()
+
+        assert data["nodes"] == [{"n": {"name": "APT28", "first_seen": "2020-01-01"}}]
+        assert "error" not in data
+
+    def test_stream_unencodable_value(self, client, mock_driver):
+        """Test an unencodable value closes the document with an error."""
+        mock_driver.execute_stream.return_value = iter(
+            [{"n": {"name": "APT28"}}, {"n": {"name": object()}}]
+        )
+
+        data = client.get("/api/nodes?stream=1").get_json()
+
+        assert data["nodes"] == [{"n": {"name": "APT28"}}]
+        assert data["count"] == 1
+        assert "error" in data
+
+
+class TestGetNodeNamesHandler:
+    """Test the ETag-cached node names endpoint."""
+
+    NAMES = [{"name": "APT28", "label": "ThreatActor"}]
+
+    @pytest.fixture
+    def names(self, mock_driver):
+        """Return the mocked get_all_node_names of the autocomplete service."""
+        service = handlers._autocomplete_service
+        service.get_all_node_names.return_value = ResultWrapper(
+            success=True, data=self.NAMES
+        )
+        return service.get_all_node_names
+
+    def test_get_node_names(self, client, names):
+        """Test names are returned with an ETag and max-age."""
+
+        response = client.get("/api/nodes/names")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"success": True, "names": self.NAMES, "count": 1}
+        assert response.headers["ETag"]
+        assert "max-age=" in response.headers["Cache-Control"]
+
+    def test_snapshot_reused(self, client, names):
+        """Test repeat requests do not query the database."""
+
+        first = client.get("/api/nodes/names")
+        second = client.get("/api/nodes/names")
+
+        names.assert_called_once_with(label=None, max_nodes=1000, use_cache=False)
+        assert first.data == second.data
+
+    def test_if_none_match_returns_304(self, client, names):
+        """Test a matching If-None-Match gets 304 without a body."""
+        etag = client.get("/api/nodes/names").headers["ETag"]
+
+        response = client.get("/api/nodes/names", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    def test_invalid_label(self, client, names):
+        """Test invalid label returns 400."""
+        response = client.get("/api/nodes/names?label=Bogus")
+
+        assert response.status_code == 400
+        names.assert_not_called()
+
+    def test_failure_not_cached(self, client, names):
+        """Test a failed query returns 500 and is retried next time."""
+        names.return_value = ResultWrapper(success=False, error="down")
+
+        assert client.get("/api/nodes/names").status_code == 500
+        assert client.get("/api/nodes/names").status_code == 500
+        assert names.call_count == 2
+
+
 class TestGetNodeByNameHandler:
     """Test get node by name endpoint handler."""
 
@@ -477,6 +935,15 @@ class TestGetNodeByNameHandler:
         response = client.get("/api/node/Test?label=InvalidLabel")
         assert response.status_code == 400
 
+    def test_get_node_by_name_invalid_label_rejected_early(self, client, mock_driver):
+        """Test unknown labels are rejected before any query is built."""
+        response = client.get("/api/node/Test?label=InvalidLabel&hops=1")
+        assert response.status_code == 400
+
+        data = response.get_json()
+        assert data["error"] == "Invalid label"
+        mock_driver.run_safe_query.assert_not_called()
+
     def test_get_node_by_name_missing_label(self, client, mock_driver):
         """Test node retrieval without label."""
         response = client.get("/api/node/APT28?hops=1")
@@ -529,6 +996,62 @@ class TestGetNodeByNameHandler:
         response = client.get("/api/node/APT28?label=ThreatActor&hops=1")
         assert response.status_code == 500
 
+    def test_get_node_by_name_hops_zero_fast_path(self, client, mock_driver):
+        """Test hops=0 returns the single node without edges."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data=[
+                {
+                    "start": {"name": "APT28", "type": "APT"},
+                    "start_label": "ThreatActor",
+                    "connected": None,
+                    "connected_label": None,
+                    "relationship_details": [],
+                }
+            ],
+        )
+
+        response = client.get("/api/node/APT28?label=ThreatActor&hops=0")
+        assert response.status_code == 200
+
+        data = response.get_json()
+        graph = data["data"][0]
+        assert graph["n"] == {"name": "APT28", "type": "APT", "label": "ThreatActor"}
+        assert graph["nodes"] == [
+            {"id": "APT28", "data": graph["n"], "isMainNode": True}
+        ]
+        assert graph["edges"] == []
+        assert graph["connections"] == []
+        assert graph["truncated"] is False
+        assert data["count"] == 1
+
+    def test_get_node_by_name_uses_cache(self, client, mock_driver):
+        """Test repeated lookups are served from the node cache."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data=[{"start": {"name": "APT28"}, "start_label": "ThreatActor"}],
+        )
+
+        first = client.get("/api/node/APT28?label=ThreatActor&hops=1")
+        second = client.get("/api/node/APT28?label=ThreatActor&hops=1")
+
+        assert first.status_code == 200
+        assert second.get_json() == first.get_json()
+        assert mock_driver.run_safe_query.call_count == 1
+
+    def test_get_node_by_name_cache_cleared_on_init(self, client, mock_driver):
+        """Test re-initializing handlers invalidates cached nodes."""
+        mock_driver.run_safe_query.return_value = ResultWrapper(
+            success=True,
+            data=[{"start": {"name": "APT28"}, "start_label": "ThreatActor"}],
+        )
+        client.get("/api/node/APT28?label=ThreatActor&hops=1")
+
+        handlers.init_handlers(mock_driver, handlers._autocomplete_service)
+        client.get("/api/node/APT28?label=ThreatActor&hops=1")
+
+        assert mock_driver.run_safe_query.call_count == 2
+
 
 class TestTransformNeo4jResults:
     """Test transformation function."""
@@ -557,6 +1080,22 @@ class TestTransformNeo4jResults:
         assert result[0]["n"]["label"] == "ThreatActor"
         assert len(result[0]["connections"]) == 0
 
+    def test_transform_drops_internal_properties(self):
+        """Test name_lc is not included in node data."""
+        neo4j_data = [
+            {
+                "start": {"name": "APT28", "name_lc": "apt28"},
+                "start_label": "ThreatActor",
+                "connected": {"name": "X-Agent", "name_lc": "x-agent"},
+                "connected_label": "Malware",
+                "relationship_details": [],
+            }
+        ]
+
+        result = handlers.transform_neo4j_results_to_graph(neo4j_data)
+
+        assert all("name_lc" not in node["data"] for node in result[0]["nodes"])
+
     def test_transform_with_relationships(self):
         """Test transformation with relationships."""
         neo4j_data = [
@@ -634,3 +1173,107 @@ class TestTransformNeo4jResults:
         assert len(result) == 1
         assert len(result[0]["edges"]) == 2
         assert len(result[0]["nodes"]) >= 2
+
+    def test_transform_deduplicates_edges(self):
+        """Test the same edge seen in multiple paths is only added once."""
+        rel = {
+            "type": "USES",
+            "start_node": {"name": "APT28"},
+            "start_node_label": "ThreatActor",
+            "end_node": {"name": "X-Agent"},
+            "end_node_label": "Malware",
+        }
+        neo4j_data = [
+            {
+                "start": {"name": "APT28"},
+                "start_label": "ThreatActor",
+                "connected": {"name": "X-Agent"},
+                "connected_label": "Malware",
+                "relationship_details": [rel, dict(rel)],
+            },
+            {
+                "start": {"name": "APT28"},
+                "start_label": "ThreatActor",
+                "connected": {"name": "X-Agent"},
+                "connected_label": "Malware",
+                "relationship_details": [rel],
+            },
+        ]
+
+        result = handlers.transform_neo4j_results_to_graph(neo4j_data)
+
+        assert len(result[0]["edges"]) == 1
+        assert len(result[0]["connections"]) == 1
+
+    def test_transform_truncates_at_max_edges(self, monkeypatch):
+        """Test transformation stops once MAX_TRANSFORM_EDGES is reached."""
+        monkeypatch.setattr(handlers, "MAX_TRANSFORM_EDGES", 2)
+        neo4j_data = [
+            {
+                "start": {"name": "APT28"},
+                "start_label": "ThreatActor",
+                "connected": {"name": f"Tool{i}"},
+                "connected_label": "Tool",
+                "relationship_details": [
+                    {
+                        "type": "USES",
+                        "start_node": {"name": "APT28"},
+                        "start_node_label": "ThreatActor",
+                        "end_node": {"name": f"Tool{i}"},
+                        "end_node_label": "Tool",
+                    }
+                ],
+            }
+            for i in range(5)
+        ]
+
+        result = handlers.transform_neo4j_results_to_graph(neo4j_data)
+
+        assert result[0]["truncated"] is True
+        assert len(result[0]["edges"]) == 2
+        assert len(result[0]["connections"]) == 2
+
+    def test_transform_not_truncated_by_default(self):
+        """Test small results are not marked as truncated."""
+        neo4j_data = [
+            {
+                "start": {"name": "APT28"},
+                "start_label": "ThreatActor",
+                "relationship_details": [],
+            }
+        ]
+
+        result = handlers.transform_neo4j_results_to_graph(neo4j_data)
+
+        assert result[0]["truncated"] is False
+
+    def test_transform_edge_ids_do_not_collide(self):
+        """Test names containing '-' produce distinct edges."""
+        neo4j_data = [
+            {
+                "start": {"name": "A"},
+                "start_label": "ThreatActor",
+                "relationship_details": [
+                    {
+                        "type": "USES",
+                        "start_node": {"name": "A-USES"},
+                        "start_node_label": "ThreatActor",
+                        "end_node": {"name": "B"},
+                        "end_node_label": "Tool",
+                    },
+                    {
+                        "type": "USES",
+                        "start_node": {"name": "A"},
+                        "start_node_label": "ThreatActor",
+                        "end_node": {"name": "USES-B"},
+                        "end_node_label": "Tool",
+                    },
+                ],
+            }
+        ]
+
+        result = handlers.transform_neo4j_results_to_graph(neo4j_data)
+
+        edge_ids = [edge["id"] for edge in result[0]["edges"]]
+        assert len(edge_ids) == 2
+        assert len(set(edge_ids)) == 2
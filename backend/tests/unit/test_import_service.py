@@ -8,6 +8,7 @@ All fixtures are defined in conftest.py for reusability.
 import json
 import pytest
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -34,6 +35,15 @@ class TestLoadJsonFile:
 
         assert "File not found" in str(exc_info.value)
 
+    def test_load_utf8_json(self, import_service, tmp_path):
+        """Test non-ASCII names are decoded from the raw bytes."""
+        path = tmp_path / "utf8.json"
+        path.write_bytes('{"nodes": [{"name": "Ком-Бот"}]}'.encode("utf-8"))
+
+        data = import_service.load_json_file(str(path))
+
+        assert data["nodes"][0]["name"] == "Ком-Бот"
+
     def test_load_invalid_json(self, import_service, invalid_json_file):
         """Test that loading invalid JSON raises JSONDecodeError."""
         with pytest.raises(json.JSONDecodeError):
@@ -206,6 +216,35 @@ class TestValidateNodes:
         assert len(errors) > 0
         assert any("must be an object" in error for error in errors)
 
+    def test_allowed_names_skip_per_node_checks(self, import_service):
+        """Test allowed labels and properties never reach the builder."""
+        nodes = [
+            {"label": "ThreatActor", "properties": {"name": f"APT{i}"}}
+            for i in range(5)
+        ]
+        builder = import_service.builder
+        builder.validate_label = Mock(wraps=builder.validate_label)
+        builder.validate_property = Mock(wraps=builder.validate_property)
+
+        errors, _ = import_service.validate_nodes(nodes)
+
+        assert errors == []
+        builder.validate_label.assert_not_called()
+        builder.validate_property.assert_not_called()
+
+    def test_repeated_invalid_label_reported_per_node(self, import_service):
+        """Test an invalid label still reports an error for every node."""
+        nodes = [
+            {"label": "InvalidLabel", "properties": {"name": "A"}},
+            {"label": "InvalidLabel", "properties": {"name": "B"}},
+        ]
+
+        errors, _ = import_service.validate_nodes(nodes)
+
+        assert len(errors) == 2
+        assert errors[0].startswith("Node 0")
+        assert errors[1].startswith("Node 1")
+
 
 class TestValidateRelationships:
     """Test suite for validate_relationships method."""
@@ -220,6 +259,122 @@ class TestValidateRelationships:
 
         assert errors == []
 
+    def test_warns_on_unknown_reference(self, import_service):
+        """Test references are checked by (label, name) pair."""
+        nodes = [
+            {"label": "ThreatActor", "properties": {"name": "APT28"}},
+            {"label": "Tool", "properties": {"name": "X-Agent"}},
+        ]
+        relationships = [
+            {
+                "type": "USES",
+                "from": {"label": "ThreatActor", "property": "name", "value": "APT28"},
+                "to": {"label": "Malware", "property": "name", "value": "X-Agent"},
+            },
+        ]
+
+        errors, warnings = import_service.validate_relationships(relationships, nodes)
+
+        assert errors == []
+        assert warnings == [
+            "Relationship 0: Referenced node not found: "
+            "Malware with name='X-Agent'"
+        ]
+
+    def test_unhashable_reference_is_invalid(self, import_service):
+        """Test list/dict reference values are reported, not raised."""
+        nodes = [{"label": "ThreatActor", "properties": {"name": "APT28"}}]
+        relationships = [
+            {
+                "type": "USES",
+                "from": {"label": "ThreatActor", "property": "name", "value": "APT28"},
+                "to": {"label": "Malware", "property": "name", "value": ["X"]},
+            },
+            {
+                "type": "USES",
+                "from": {"label": ["ThreatActor"], "property": "name", "value": "APT28"},
+                "to": {"label": "Malware", "property": "name", "value": {"a": 1}},
+            },
+        ]
+
+        errors, warnings = import_service.validate_relationships(relationships, nodes)
+
+        assert warnings == []
+        assert errors == [
+            "Relationship 0: to - invalid reference value: ['X']",
+            "Relationship 1: 'from.label' must be a string",
+            "Relationship 1: to - invalid reference value: {'a': 1}",
+        ]
+
+    def test_malformed_nodes_left_out_of_index(self, import_service):
+        """Test nodes with non-string names do not break reference checks."""
+        nodes = [
+            {"label": "ThreatActor", "properties": {"name": "APT28"}},
+            {"label": "Malware", "properties": {"name": ["X-Agent"]}},
+            {"label": ["Tool"], "properties": {"name": "Mimikatz"}},
+            {"label": "Tool", "properties": "not-a-dict"},
+        ]
+        relationships = [
+            {
+                "type": "USES",
+                "from": {"label": "ThreatActor", "property": "name", "value": "APT28"},
+                "to": {"label": "Malware", "property": "name", "value": "X-Agent"},
+            },
+        ]
+
+        errors, warnings = import_service.validate_relationships(relationships, nodes)
+
+        assert errors == []
+        assert warnings == [
+            "Relationship 0: Referenced node not found: "
+            "Malware with name='X-Agent'"
+        ]
+
+    def test_reference_warnings_are_capped(self, import_service):
+        """Test reference checks stop after max_ref_warnings misses."""
+        nodes = [{"label": "ThreatActor", "properties": {"name": "APT28"}}]
+        relationships = [
+            {
+                "type": "USES",
+                "from": {"label": "ThreatActor", "property": "name", "value": "APT28"},
+                "to": {"label": "Malware", "property": "name", "value": f"m{i}"},
+            }
+            for i in range(5)
+        ]
+
+        errors, warnings = import_service.validate_relationships(
+            relationships, nodes, max_ref_warnings=2
+        )
+
+        assert errors == []
+        assert len(warnings) == 3
+        assert warnings[1].startswith("Relationship 1")
+        assert "Stopped checking references" in warnings[2]
+
+    def test_import_without_reference_check(
+        self, import_service, mock_import_driver, tmp_path
+    ):
+        """Test check_refs=False skips missing-reference warnings."""
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({
+            "metadata": {"version": "1.0"},
+            "nodes": [{"label": "ThreatActor", "properties": {"name": "APT28"}}],
+            "relationships": [
+                {
+                    "type": "USES",
+                    "from": {"label": "ThreatActor", "property": "name", "value": "APT28"},
+                    "to": {"label": "Malware", "property": "name", "value": "Unknown"},
+                },
+            ],
+        }))
+
+        result = import_service.import_from_json(
+            str(path), dry_run=True, check_refs=False
+        )
+
+        assert result.success is True
+        assert result.warnings == []
+
     def test_validate_relationship_missing_type(self, import_service):
         """Test validation fails for relationship without type."""
         relationships = [
@@ -234,6 +389,43 @@ class TestValidateRelationships:
         assert len(errors) > 0
         assert any("type" in error.lower() for error in errors)
 
+    def test_allowed_names_skip_builder(self, import_service):
+        """Test whitelisted names are not passed through the builder."""
+        relationships = [
+            {
+                "type": "USES",
+                "from": {"label": "ThreatActor", "property": "name", "value": "A"},
+                "to": {"label": "Malware", "property": "name", "value": "B"},
+                "properties": {"source": "Report"},
+            },
+        ]
+        builder = import_service.builder
+        builder.validate_label = Mock(wraps=builder.validate_label)
+        builder.validate_property = Mock(wraps=builder.validate_property)
+        builder.validate_relationship = Mock(wraps=builder.validate_relationship)
+
+        errors, _ = import_service.validate_relationships(relationships)
+
+        assert errors == []
+        builder.validate_label.assert_not_called()
+        builder.validate_property.assert_not_called()
+        builder.validate_relationship.assert_not_called()
+
+    def test_earlier_errors_do_not_skip_later_relationships(self, import_service):
+        """Test a relationship is still validated after earlier errors."""
+        relationships = [
+            {"from": {"label": "ThreatActor", "property": "name", "value": "A"}},
+            {
+                "type": "INVALID_TYPE",
+                "from": {"label": "ThreatActor", "property": "name", "value": "A"},
+                "to": {"label": "Malware", "property": "name", "value": "B"},
+            },
+        ]
+
+        errors, _ = import_service.validate_relationships(relationships)
+
+        assert any(e.startswith("Relationship 1") for e in errors)
+
     def test_validate_relationship_missing_from(self, import_service):
         """Test validation fails for relationship without 'from'."""
         relationships = [
@@ -375,7 +567,7 @@ class TestImportNodes:
     ):
         """Test successful node import."""
         # Mock the execute method to return proper results
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 1, "label": "ThreatActor"}],
             [{"count": 1, "label": "Malware"}],
         ]
@@ -384,7 +576,7 @@ class TestImportNodes:
 
         assert count == 2
         # Verify execute was called twice (once per label)
-        assert mock_import_driver.execute.call_count == 2
+        assert mock_import_driver.execute_batch.call_count == 2
 
     def test_import_nodes_empty_list(self, import_service, mock_import_driver):
         """Test importing empty node list."""
@@ -394,7 +586,7 @@ class TestImportNodes:
 
         assert count == 0
         # Should not call execute for empty list
-        assert mock_import_driver.execute.call_count == 0
+        assert mock_import_driver.execute_batch.call_count == 0
 
     def test_import_nodes_tracks_per_label_counts(
         self, import_service, mock_import_driver
@@ -407,7 +599,7 @@ class TestImportNodes:
         ]
 
         # Mock returns for two queries
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 2, "label": "ThreatActor"}],  # 2 ThreatActors
             [{"count": 1, "label": "Malware"}],  # 1 Malware
         ]
@@ -423,7 +615,7 @@ class TestImportNodes:
         ]
 
         # Mock execute to raise an exception
-        mock_import_driver.execute.side_effect = Exception("Database error")
+        mock_import_driver.execute_batch.side_effect = Exception("Database error")
 
         with pytest.raises(Exception) as exc_info:
             import_service.import_nodes(nodes)
@@ -431,6 +623,146 @@ class TestImportNodes:
         assert "Database error" in str(exc_info.value)
 
 
+class TestBatchChunking:
+    """Test splitting batch queries into write transactions."""
+
+    def test_batch_size_passed_to_driver(self, mock_import_driver):
+        """Test each label's rows go to execute_batch with batch_size."""
+        service = ImportService(mock_import_driver, batch_size=2)
+        nodes = [
+            {"label": "Malware", "properties": {"name": f"m{i}"}} for i in range(5)
+        ]
+
+        service.import_nodes(nodes)
+
+        call = mock_import_driver.execute_batch.call_args
+        assert len(call.args[1]) == 5
+        assert call.kwargs == {"batch_size": 2, "param_name": "nodes_Malware"}
+
+    def test_chunk_counts_summed(self, mock_import_driver):
+        """Test the counts returned by every chunk are added up."""
+        service = ImportService(mock_import_driver, batch_size=2)
+        nodes = [
+            {"label": "Malware", "properties": {"name": f"m{i}"}} for i in range(5)
+        ]
+        mock_import_driver.execute_batch.return_value = [
+            {"count": 2, "label": "Malware"},
+            {"count": 2, "label": "Malware"},
+            {"count": 1, "label": "Malware"},
+        ]
+
+        assert service.import_nodes(nodes) == 5
+
+    def test_labels_imported_concurrently(self, mock_import_driver):
+        """Test queries for different labels run on separate threads."""
+        service = ImportService(mock_import_driver, max_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def execute_batch(query, rows, batch_size, param_name):
+            # Both labels must be in flight at once to pass the barrier
+            barrier.wait()
+            return [{"count": 1, "label": "X"}]
+
+        mock_import_driver.execute_batch.side_effect = execute_batch
+        nodes = [
+            {"label": "Malware", "properties": {"name": "m"}},
+            {"label": "Tool", "properties": {"name": "t"}},
+        ]
+
+        assert service.import_nodes(nodes) == 2
+
+    def test_single_worker_runs_serially(self, mock_import_driver):
+        """Test max_workers=1 keeps label order."""
+        service = ImportService(mock_import_driver, max_workers=1)
+        mock_import_driver.execute_batch.return_value = [{"count": 1, "label": "X"}]
+        nodes = [
+            {"label": "Malware", "properties": {"name": "m"}},
+            {"label": "Tool", "properties": {"name": "t"}},
+        ]
+
+        service.import_nodes(nodes)
+
+        labels = [
+            call.kwargs["param_name"]
+            for call in mock_import_driver.execute_batch.call_args_list
+        ]
+        assert labels == ["nodes_Malware", "nodes_Tool"]
+
+    def test_relationships_use_batch_size(self, mock_import_driver):
+        """Test relationship patterns are chunked the same way."""
+        service = ImportService(mock_import_driver, batch_size=1)
+        rels = [
+            {
+                "from_label": "ThreatActor",
+                "from_value": "APT28",
+                "to_label": "Malware",
+                "to_value": name,
+                "type": "USES",
+            }
+            for name in ("X-Agent", "Zebrocy")
+        ]
+        mock_import_driver.execute_batch.return_value = [
+            {"count": 1, "from_label": "ThreatActor", "to_label": "Malware", "type": "USES"},
+            {"count": 1, "from_label": "ThreatActor", "to_label": "Malware", "type": "USES"},
+        ]
+
+        assert service.import_relationships(rels) == 2
+        assert mock_import_driver.execute_batch.call_args.kwargs["batch_size"] == 1
+
+
+class TestEnsureNameIndexes:
+    """Test suite for ensure_name_indexes method."""
+
+    def test_runs_index_queries_as_writes(self, import_service, mock_import_driver):
+        """Test one name index query per allowed label is executed."""
+        expected = import_service.builder.name_index_queries()
+
+        import_service.ensure_name_indexes()
+
+        assert mock_import_driver.execute.call_count == len(expected)
+        for call, (query, params) in zip(
+            mock_import_driver.execute.call_args_list, expected
+        ):
+            assert call.args == (query, params)
+            assert call.kwargs == {"write": True, "return_data": False}
+
+
+class TestEnsureNameLcIndex:
+    """Test suite for ensure_name_lc_index method."""
+
+    def test_runs_schema_queries_as_writes(self, import_service, mock_import_driver):
+        """Test every index and backfill query is executed as a write."""
+        expected = import_service.builder.name_lc_schema_queries(
+            import_service.batch_size
+        )
+
+        import_service.ensure_name_lc_index()
+
+        assert mock_import_driver.execute.call_count == len(expected)
+        for call, (query, params) in zip(
+            mock_import_driver.execute.call_args_list, expected
+        ):
+            assert call.args == (query, params)
+            assert call.kwargs["write"] is True
+
+    def test_backfill_repeats_full_batches(self, mock_import_driver):
+        """Test a backfill query is rerun until a batch comes back short."""
+        service = ImportService(mock_import_driver, batch_size=2)
+        index_count = len(service.builder.name_lc_index_queries())
+        backfill_count = len(service.builder.name_lc_backfill_queries())
+        mock_import_driver.execute.side_effect = (
+            [None] * index_count
+            + [[{"count": 2}], [{"count": 2}], [{"count": 1}]]
+            + [[{"count": 0}]] * (backfill_count - 1)
+        )
+
+        service.ensure_name_lc_index()
+
+        assert mock_import_driver.execute.call_count == index_count + backfill_count + 2
+        backfill_calls = mock_import_driver.execute.call_args_list[index_count:]
+        assert all(c.args[1] == {"batch_size": 2} for c in backfill_calls)
+
+
 class TestImportRelationships:
     """Test suite for import_relationships method."""
 
@@ -447,7 +779,7 @@ class TestImportRelationships:
         ]
 
         # Mock the execute method
-        mock_import_driver.execute.return_value = [
+        mock_import_driver.execute_batch.return_value = [
             {
                 "count": 1,
                 "from_label": "ThreatActor",
@@ -459,7 +791,7 @@ class TestImportRelationships:
         count = import_service.import_relationships(relationships)
 
         assert count == 1
-        assert mock_import_driver.execute.call_count == 1
+        assert mock_import_driver.execute_batch.call_count == 1
 
     def test_import_relationships_empty_list(self, import_service, mock_import_driver):
         """Test importing empty relationship list."""
@@ -468,7 +800,7 @@ class TestImportRelationships:
         count = import_service.import_relationships(relationships)
 
         assert count == 0
-        assert mock_import_driver.execute.call_count == 0
+        assert mock_import_driver.execute_batch.call_count == 0
 
     def test_import_relationships_multiple_patterns(
         self, import_service, mock_import_driver
@@ -492,7 +824,7 @@ class TestImportRelationships:
         ]
 
         # Mock returns for two different patterns
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [
                 {
                     "count": 1,
@@ -514,7 +846,7 @@ class TestImportRelationships:
         count = import_service.import_relationships(relationships)
 
         assert count == 2
-        assert mock_import_driver.execute.call_count == 2
+        assert mock_import_driver.execute_batch.call_count == 2
 
 
 class TestImportFromJson:
@@ -525,7 +857,7 @@ class TestImportFromJson:
     ):
         """Test successful complete import from JSON file."""
         # Mock execute to return proper results
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 1, "label": "ThreatActor"}],
             [{"count": 1, "label": "Malware"}],
             [
@@ -551,7 +883,7 @@ class TestImportFromJson:
         self, import_service, mock_import_driver, temp_json_file
     ):
         """Test import with validation enabled."""
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 1, "label": "ThreatActor"}],
             [{"count": 1, "label": "Malware"}],
             [
@@ -573,7 +905,7 @@ class TestImportFromJson:
         self, import_service, mock_import_driver, temp_json_file
     ):
         """Test import with validation disabled."""
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 1, "label": "ThreatActor"}],
             [{"count": 1, "label": "Malware"}],
             [
@@ -600,7 +932,7 @@ class TestImportFromJson:
         assert result.nodes_created == 0
         assert result.relationships_created == 0
         # Should not call execute in dry run mode
-        assert mock_import_driver.execute.call_count == 0
+        assert mock_import_driver.execute_batch.call_count == 0
 
     def test_import_from_json_file_not_found(self, import_service):
         """Test handling of nonexistent file."""
@@ -655,7 +987,7 @@ class TestImportFromJson:
         self, import_service, mock_import_driver, temp_json_file
     ):
         """Test handling of database errors during node import."""
-        mock_import_driver.execute.side_effect = Exception("Database connection failed")
+        mock_import_driver.execute_batch.side_effect = Exception("Database connection failed")
 
         result = import_service.import_from_json(temp_json_file, validate=False)
 
@@ -668,7 +1000,7 @@ class TestImportFromJson:
     ):
         """Test handling of database errors during relationship import."""
         # Nodes succeed, relationships fail
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 1, "label": "ThreatActor"}],
             [{"count": 1, "label": "Malware"}],
             Exception("Database error during relationships"),
@@ -686,7 +1018,7 @@ class TestImportFromJson:
         self, import_service, mock_import_driver, temp_json_file
     ):
         """Test that import tracks execution duration."""
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 1, "label": "ThreatActor"}],
             [{"count": 1, "label": "Malware"}],
             [
@@ -708,7 +1040,7 @@ class TestImportFromJson:
         self, import_service, mock_import_driver, temp_json_file
     ):
         """Test that metadata from JSON is preserved in result."""
-        mock_import_driver.execute.side_effect = [
+        mock_import_driver.execute_batch.side_effect = [
             [{"count": 1, "label": "ThreatActor"}],
             [{"count": 1, "label": "Malware"}],
             [
@@ -771,3 +1103,9 @@ class TestImportResult:
 
         assert result.errors == []
         assert result.warnings == []
+
+    def test_import_result_has_no_instance_dict(self):
+        """Test ImportResult uses slots instead of a per-instance dict."""
+        result = ImportResult(success=True)
+
+        assert not hasattr(result, "__dict__")
@@ -0,0 +1,64 @@
+"""Unit tests for the orjson-backed Flask JSON provider."""
+
+import datetime
+
+import pytest
+from flask import Flask, jsonify
+
+from src.api.json_provider import ORJSONProvider
+
+
+@pytest.fixture
+def json_app():
+    """Provide a Flask app using ORJSONProvider."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    return app
+
+
+class TestORJSONProvider:
+    """Test ORJSONProvider encoding and decoding."""
+
+    def test_jsonify_response(self, json_app):
+        """Test jsonify produces a compact application/json body."""
+        with json_app.app_context():
+            response = jsonify({"success": True, "nodes": [{"name": "APT28"}]})
+
+        assert response.mimetype == "application/json"
+        assert response.get_data() == b'{"success":true,"nodes":[{"name":"APT28"}]}'
+
+    def test_jsonify_kwargs(self, json_app):
+        """Test jsonify with keyword arguments serializes a dict."""
+        with json_app.app_context():
+            response = jsonify(count=2)
+
+        assert response.get_json() == {"count": 2}
+
+    def test_dumps_non_string_keys(self, json_app):
+        """Test integer keys are written as strings like stdlib json."""
+        assert json_app.json.dumps({1: "one"}) == '{"1":"one"}'
+
+    def test_dumps_datetime(self, json_app):
+        """Test datetimes are encoded natively."""
+        value = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+        assert json_app.json.dumps({"at": value}) == '{"at":"2024-01-02T03:04:05"}'
+
+    def test_dumps_iso_format_objects(self, json_app):
+        """Test values with iso_format() (Neo4j temporal types) are encoded."""
+
+        class FakeNeo4jDate:
+            def iso_format(self):
+                return "2024-01-02"
+
+        assert json_app.json.dumps([FakeNeo4jDate()]) == '["2024-01-02"]'
+
+    def test_dumps_unsupported_type_raises(self, json_app):
+        """Test values without a JSON form raise TypeError."""
+        with pytest.raises(TypeError):
+            json_app.json.dumps({"value": object()})
+
+    def test_loads(self, json_app):
+        """Test decoding JSON text and bytes."""
+        assert json_app.json.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert json_app.json.loads(b'{"a": 1}') == {"a": 1}
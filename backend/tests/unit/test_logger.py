@@ -0,0 +1,40 @@
+"""Unit tests for the logger setup helper."""
+
+import logging
+
+from src.logger import setup_logger
+
+
+class TestSetupLogger:
+    """Test setup_logger behaviour."""
+
+    def test_returns_configured_logger(self):
+        """Test a new logger gets one handler and does not propagate."""
+        logger = setup_logger("TestLoggerNew", logging.WARNING)
+
+        assert logger.name == "TestLoggerNew"
+        assert logger.level == logging.WARNING
+        assert len(logger.handlers) == 1
+        assert logger.propagate is False
+
+    def test_repeated_calls_reuse_logger(self):
+        """Test repeated calls do not add handlers."""
+        first = setup_logger("TestLoggerRepeat")
+        second = setup_logger("TestLoggerRepeat")
+
+        assert first is second
+        assert len(second.handlers) == 1
+
+    def test_repeated_calls_update_level(self):
+        """Test the level of a cached logger can still be changed."""
+        setup_logger("TestLoggerLevel", logging.INFO)
+        logger = setup_logger("TestLoggerLevel", logging.DEBUG)
+
+        assert logger.level == logging.DEBUG
+
+    def test_handlers_share_formatter(self):
+        """Test all loggers use the same formatter instance."""
+        first = setup_logger("TestLoggerFormatA")
+        second = setup_logger("TestLoggerFormatB")
+
+        assert first.handlers[0].formatter is second.handlers[0].formatter
@@ -4,3 +4,183 @@ This module tests the Flask endpoints, database initialization,
 and error handling in the main application.
 
 """
+
+import dataclasses
+from unittest.mock import Mock, patch
+
+from src import main
+
+
+class TestGetDriver:
+    """Test the process-wide driver accessor."""
+
+    def test_get_driver_initializes_once(self, monkeypatch):
+        """Test the driver is created on first use and then reused."""
+        monkeypatch.setattr(main, "DB_DRIVER", None)
+        driver = Mock()
+
+        with patch.object(main, "init_database", return_value=driver) as mock_init:
+            assert main.get_driver() is driver
+            assert main.get_driver() is driver
+
+        mock_init.assert_called_once()
+
+
+class TestRequestSession:
+    """Test the per-request database session hooks."""
+
+    def test_request_binds_and_releases_session(self, monkeypatch):
+        """Test each request binds a session and releases it afterwards."""
+        driver = Mock()
+        monkeypatch.setattr(main, "DB_DRIVER", driver)
+
+        main.app.test_client().get("/does-not-exist")
+
+        driver.bind_session.assert_called_once()
+        driver.release_session.assert_called_once()
+
+    def test_hooks_without_driver(self, monkeypatch):
+        """Test the hooks do nothing before the driver exists."""
+        monkeypatch.setattr(main, "DB_DRIVER", None)
+
+        response = main.app.test_client().get("/does-not-exist")
+
+        assert response.status_code == 404
+
+
+class TestWarmup:
+    """Test the optional startup warmup."""
+
+    def test_warmup_runs_all_queries(self):
+        """Test every warmup query is sent in one read transaction."""
+        driver = Mock()
+        driver.run_read_many.return_value = Mock(success=True)
+
+        main._warmup(driver)
+
+        driver.run_read_many.assert_called_once_with(main._warmup_queries())
+        driver.run_safe_query.assert_not_called()
+
+    def test_warmup_ignores_failures(self):
+        """Test a failing warmup transaction does not abort startup."""
+        driver = Mock()
+        driver.run_read_many.return_value = Mock(success=False, error="boom")
+
+        main._warmup(driver)
+
+        driver.run_read_many.assert_called_once()
+
+    def test_init_database_warms_up_when_enabled(self, monkeypatch):
+        """Test NEO4J_WARMUP=1 triggers the warmup after connecting."""
+        monkeypatch.setattr(
+            main, "settings", dataclasses.replace(main.settings, warmup=True)
+        )
+        driver = Mock()
+        driver.run_safe_query.return_value = Mock(success=True)
+
+        with patch.object(main, "GraphDBDriver", return_value=driver), patch.object(
+            main, "_warmup"
+        ) as mock_warmup:
+            assert main.init_database() is driver
+
+        mock_warmup.assert_called_once_with(driver)
+
+    def test_init_database_skips_warmup_by_default(self, monkeypatch):
+        """Test the warmup is off unless explicitly enabled."""
+        monkeypatch.setattr(
+            main, "settings", dataclasses.replace(main.settings, warmup=False)
+        )
+        driver = Mock()
+        driver.run_safe_query.return_value = Mock(success=True)
+
+        with patch.object(main, "GraphDBDriver", return_value=driver), patch.object(
+            main, "_warmup"
+        ) as mock_warmup:
+            main.init_database()
+
+        mock_warmup.assert_not_called()
+
+
+class TestEnsureNameLc:
+    """Test the name_lc indexes are ensured at startup."""
+
+    def test_runs_only_index_queries(self):
+        """Test the name_lc indexes are created without a backfill."""
+        driver = Mock()
+
+        main._ensure_name_lc(driver)
+
+        expected = main.AdminQueryBuilder().name_lc_index_queries()
+        assert not any("SET" in query for query, _ in expected)
+        assert [c.args for c in driver.execute.call_args_list] == expected
+        assert all(
+            c.kwargs == {"write": True, "return_data": False}
+            for c in driver.execute.call_args_list
+        )
+
+    def test_failures_do_not_abort_startup(self):
+        """Test a failing query is logged and the rest still run."""
+        driver = Mock()
+        driver.execute.side_effect = RuntimeError("Query failed")
+
+        main._ensure_name_lc(driver)
+
+        assert driver.execute.call_count == len(
+            main.AdminQueryBuilder().name_lc_index_queries()
+        )
+
+    def test_init_database_ensures_name_lc(self, monkeypatch):
+        """Test init_database ensures the name_lc indexes after connecting."""
+        driver = Mock()
+        driver.run_safe_query.return_value = Mock(success=True)
+
+        with patch.object(main, "GraphDBDriver", return_value=driver), patch.object(
+            main, "_ensure_name_lc"
+        ) as mock_ensure:
+            main.init_database()
+
+        mock_ensure.assert_called_once_with(driver)
+
+
+class TestInitApp:
+    """Test application setup shared by main() and the WSGI entry point."""
+
+    def test_init_app_registers_api_once(self, monkeypatch):
+        """Test the blueprint and handlers are set up only on first call."""
+        driver = Mock()
+        monkeypatch.setattr(main, "DB_DRIVER", driver)
+        monkeypatch.setattr(main.app, "blueprints", {})
+
+        with patch("src.api.handlers.init_handlers") as mock_init, patch.object(
+            main.app, "register_blueprint"
+        ) as mock_register:
+            assert main.init_app() is main.app
+            main.app.blueprints["api"] = Mock()
+            main.init_app()
+
+        mock_init.assert_called_once()
+        assert mock_init.call_args.args[0] is driver
+        mock_register.assert_called_once()
+
+    def test_init_app_starts_autocomplete_index(self, monkeypatch):
+        """Test AUTOCOMPLETE_INDEX=1 starts the name index refresh."""
+        monkeypatch.setattr(main, "DB_DRIVER", Mock())
+        monkeypatch.setattr(main.app, "blueprints", {})
+        monkeypatch.setattr(
+            main,
+            "settings",
+            dataclasses.replace(
+                main.settings,
+                autocomplete_index=True,
+                autocomplete_index_refresh_sec=60.0,
+                autocomplete_index_max=500,
+            ),
+        )
+
+        with patch("src.api.handlers.init_handlers") as mock_init, patch.object(
+            main.app, "register_blueprint"
+        ), patch.object(main, "AutocompleteService") as mock_service:
+            main.init_app()
+
+        mock_service.return_value.start_index_refresh.assert_called_once_with(60.0, 500)
+        assert mock_init.call_args.args[1] is mock_service.return_value
@@ -4,7 +4,12 @@ This module tests the query builder's ability to create safe,
 parameterized Cypher queries and prevent injection attacks.
 """
 
+import random
+
+from unittest.mock import patch
+
 import pytest
+from src.constants import ALLOWED_LABELS
 from src.services.query_builder import (
     SafeQueryBuilder,
     AdminQueryBuilder,
@@ -285,8 +290,20 @@ class TestSearchNodes:
             match_type="starts_with",
         )
 
-        assert "STARTS WITH" in query
-        assert "toLower" in query
+        assert "n.name_lc STARTS WITH $search_value" in query
+        assert params["search_value"] == "ali"
+
+    def test_starts_with_other_property_lowercases_in_cypher(self):
+        """Test prefix search on properties without a name_lc copy."""
+        builder = SafeQueryBuilder()
+        query, params = builder.search_nodes(
+            search_property="title",
+            search_value="Ali",
+            match_type="starts_with",
+        )
+
+        assert "toLower(n.title) STARTS WITH $search_value" in query
+        assert params["search_value"] == "ali"
 
     def test_contains_match(self):
         """Test building contains search query."""
@@ -294,12 +311,12 @@ class TestSearchNodes:
         query, params = builder.search_nodes(
             label="ThreatActor",
             search_property="name",
-            search_value="lic",
+            search_value="Lic",
             match_type="contains",
         )
 
-        assert "CONTAINS" in query
-        assert "toLower" in query
+        assert "n.name_lc CONTAINS $search_value" in query
+        assert params["search_value"] == "lic"
 
     def test_search_without_label(self):
         """Test search across all node types."""
@@ -483,6 +500,7 @@ class TestAdminMergeNode:
 
         assert "MERGE (n:ThreatActor {name: $match_name})" in query
         assert "SET n += $set_properties" in query
+        assert "n.name_lc = toLower(n.name)" in query
         assert params["match_name"] == "APT28"
         assert params["set_properties"] == {
             "type": "Nation-State",
@@ -568,7 +586,7 @@ class TestAdminMergeNodesBatch:
         query, params = threat_actor_query
         assert "UNWIND $nodes_ThreatActor AS props" in query
         assert "MERGE (n:ThreatActor {name: props.name})" in query
-        assert "SET n += props" in query
+        assert "SET n += props, n.name_lc = toLower(n.name)" in query
         assert "RETURN count(n) AS count" in query
         assert "'ThreatActor' AS label" in query
         assert len(params["nodes_ThreatActor"]) == 2  # Two ThreatActor nodes
@@ -1259,7 +1277,7 @@ class TestSearchNodesWithMetadata:
         assert "labels(n)[0] AS label" in query
         assert "elementId(n) AS id" in query
         assert "n.name AS name" in query
-        assert params["search_value"] == "Shadow"
+        assert params["search_value"] == "shadow"
 
     def test_search_without_metadata(self):
         """Test that metadata is excluded when not requested."""
@@ -1292,8 +1310,9 @@ class TestSearchNodesWithMetadata:
             search_value="test", match_type="contains", include_metadata=True
         )
 
-        assert "MATCH (n)" in query
-        assert ":ThreatActor" not in query
+        assert "MATCH (n)" not in query
+        for label in ALLOWED_LABELS:
+            assert f"MATCH (n:{label}) WHERE n.name_lc CONTAINS" in query
 
     def test_exact_match_type(self):
         """Test exact match type uses equality."""
@@ -1312,7 +1331,22 @@ class TestSearchNodesWithMetadata:
         )
 
         assert "STARTS WITH" in query
-        assert "toLower" in query
+        assert "n.name_lc" in query
+
+    def test_starts_with_without_label_queries_each_label(self):
+        """Test label-less name prefixes use one indexed lookup per label."""
+        builder = SafeQueryBuilder()
+        query, params = builder.search_nodes(
+            search_value="APT", match_type="starts_with"
+        )
+
+        assert "MATCH (n)" not in query
+        for label in ALLOWED_LABELS:
+            assert (
+                f"MATCH (n:{label}) WHERE n.name_lc STARTS WITH $search_value"
+                in query
+            )
+        assert query.count("UNION") == len(ALLOWED_LABELS) - 1
 
     def test_contains_match_type(self):
         """Test contains match type uses CONTAINS."""
@@ -1322,7 +1356,24 @@ class TestSearchNodesWithMetadata:
         )
 
         assert "CONTAINS" in query
-        assert "toLower" in query
+        assert "toLower($search_value)" not in query
+
+    def test_exact_match_keeps_case(self):
+        """Test exact matches do not lowercase the search value."""
+        builder = SafeQueryBuilder()
+        _, params = builder.search_nodes(search_value="APT28", match_type="exact")
+
+        assert params["search_value"] == "APT28"
+
+    def test_time_filter_other_property_lowercased_in_python(self):
+        """Test time-filtered matches on other properties lower the value once."""
+        builder = SafeQueryBuilder()
+        query, params = builder.search_nodes_with_time_filter(
+            search_property="title", search_value="Ali", match_type="contains"
+        )
+
+        assert "toLower(n.title) CONTAINS $search_value" in query
+        assert params["search_value"] == "ali"
 
     def test_invalid_match_type_raises_error(self):
         """Test that invalid match type raises error."""
@@ -1414,22 +1465,23 @@ class TestFuzzySearchNodes:
         builder = SafeQueryBuilder()
         query, params = builder.fuzzy_search_nodes(search_value="shadow")
 
-        assert "WHEN toLower(n.name) STARTS WITH toLower($search_value) THEN 1" in query
+        assert "WHEN n.name_lc STARTS WITH $search_value THEN 1" in query
         assert "ELSE 2" in query
 
 
 class TestCheckNodeExists:
     """Test suite for check_node_exists method."""
 
-    def test_check_exists_returns_count_and_boolean(self):
-        """Test that query returns both count and exists boolean."""
+    def test_check_exists_returns_boolean(self):
+        """Test that query returns an existential boolean."""
         builder = SafeQueryBuilder()
         query, params = builder.check_node_exists(
             property_name="name", property_value="APT28"
         )
 
-        assert "count(n) AS count" in query
-        assert "count(n) > 0 AS exists" in query
+        assert "RETURN EXISTS {" in query
+        assert "} AS exists" in query
+        assert "count(" not in query
 
     def test_check_exists_with_label(self):
         """Test existence check with specific label."""
@@ -1470,6 +1522,135 @@ class TestCheckNodeExists:
         assert "DROP TABLE" not in query
 
 
+class TestQueryTemplateCache:
+    """Test reuse of validated query text across calls."""
+
+    def test_search_query_built_once(self):
+        """Test only the search value changes between calls."""
+        builder = SafeQueryBuilder()
+        builder.search_nodes(label="Tool", search_value="a", match_type="contains")
+
+        with patch.object(
+            SafeQueryBuilder, "_search_nodes_query", side_effect=AssertionError
+        ):
+            query, params = SafeQueryBuilder().search_nodes(
+                label="Tool", search_value="b", match_type="contains"
+            )
+
+        assert ":Tool" in query
+        assert params["search_value"] == "b"
+
+    def test_fuzzy_query_shared(self):
+        """Test fuzzy search returns identical text for the same label."""
+        builder = SafeQueryBuilder()
+
+        first, _ = builder.fuzzy_search_nodes(label="Malware", search_value="x")
+        second, params = builder.fuzzy_search_nodes(label="Malware", search_value="y")
+
+        assert first is second
+        assert params["search_value"] == "y"
+
+    def test_time_filter_query_shared_across_dates(self):
+        """Test time-filtered text only depends on which dates are set."""
+        builder = SafeQueryBuilder()
+
+        first, _ = builder.search_nodes_with_time_filter(
+            label="Malware", search_value="a", start_date="2020-01-01", end_date="2021-01-01"
+        )
+        second, params = builder.search_nodes_with_time_filter(
+            label="Malware", search_value="B", start_date="2022-01-01", end_date="2023-01-01"
+        )
+        start_only, start_params = builder.search_nodes_with_time_filter(
+            label="Malware", search_value="b", start_date="2022-01-01"
+        )
+
+        assert first is second
+        assert params == {
+            "search_value": "b",
+            "limit": builder.max_results,
+            "start_date": "2022-01-01",
+            "end_date": "2023-01-01",
+        }
+        assert start_only is not first
+        assert "end_date" not in start_params
+
+    def test_invalid_arguments_not_cached(self):
+        """Test validation still raises on every call."""
+        builder = SafeQueryBuilder()
+
+        for _ in range(2):
+            with pytest.raises(QueryValidationError):
+                builder.search_nodes(label="Bogus", search_value="x")
+
+
+class TestNameLcSchemaQueries:
+    """Test suite for AdminQueryBuilder.name_lc_schema_queries."""
+
+    def test_index_and_backfill_per_label(self):
+        """Test one text index and one backfill query per allowed label."""
+        builder = AdminQueryBuilder()
+        queries = builder.name_lc_schema_queries()
+
+        assert len(queries) == 2 * len(ALLOWED_LABELS)
+        index_queries = [q for q, _ in queries[: len(ALLOWED_LABELS)]]
+        backfill_queries = [q for q, _ in queries[len(ALLOWED_LABELS):]]
+        assert (
+            "CREATE TEXT INDEX node_name_lc_ThreatActor IF NOT EXISTS "
+            "FOR (n:ThreatActor) ON (n.name_lc)"
+        ) in index_queries
+        assert all("SET n.name_lc = toLower(n.name)" in q for q in backfill_queries)
+        assert all("IF NOT EXISTS" in q for q in index_queries)
+
+    def test_backfill_is_batched(self):
+        """Test backfill queries update at most batch_size nodes each."""
+        queries = AdminQueryBuilder().name_lc_backfill_queries(batch_size=500)
+
+        assert len(queries) == len(ALLOWED_LABELS)
+        for query, params in queries:
+            assert "WITH n LIMIT $batch_size" in query
+            assert "RETURN count(n) AS count" in query
+            assert params == {"batch_size": 500}
+
+
+class TestNameIndexQueries:
+    """Test suite for AdminQueryBuilder.name_index_queries."""
+
+    def test_range_index_per_label(self):
+        """Test one idempotent name index per allowed label."""
+        queries = AdminQueryBuilder().name_index_queries()
+
+        assert len(queries) == len(ALLOWED_LABELS)
+        assert (
+            "CREATE INDEX node_name_ThreatActor IF NOT EXISTS "
+            "FOR (n:ThreatActor) ON (n.name)",
+            {},
+        ) in queries
+
+
+class TestCheckNodesExist:
+    """Test suite for check_nodes_exist method."""
+
+    def test_single_unwind_query(self):
+        """Test all values are sent as one list parameter."""
+        builder = SafeQueryBuilder()
+        query, params = builder.check_nodes_exist(
+            property_values=["APT28", "Lazarus"], label="ThreatActor"
+        )
+
+        assert "UNWIND $values AS value" in query
+        assert "MATCH (n:ThreatActor {name: value})" in query
+        assert "EXISTS {" in query
+        assert "count(" not in query
+        assert params == {"values": ["APT28", "Lazarus"]}
+
+    def test_invalid_label_rejected(self):
+        """Test label is validated against the whitelist."""
+        builder = SafeQueryBuilder()
+
+        with pytest.raises(QueryValidationError):
+            builder.check_nodes_exist(property_values=["x"], label="Bogus")
+
+
 class TestGetAllNodeNames:
     """Test suite for get_all_node_names method."""
 
@@ -1519,6 +1700,27 @@ class TestGetAllNodeNames:
         assert "n.title AS title" in query
         assert "ORDER BY n.title" in query
 
+    def test_get_all_names_as_list(self):
+        """Test as_list collects the ordered rows into one record."""
+        builder = SafeQueryBuilder()
+        query, params = builder.get_all_node_names(label="Malware", as_list=True)
+
+        assert "WITH DISTINCT n.name AS name, labels(n)[0] AS label" in query
+        assert "ORDER BY name" in query
+        assert "RETURN collect({name: name, label: label}) AS rows" in query
+        assert query.index("LIMIT $limit") < query.index("collect(")
+
+    def test_get_all_names_without_label_uses_label_scans(self):
+        """Test the label-less query unions one branch per allowed label."""
+        builder = SafeQueryBuilder()
+        query, params = builder.get_all_node_names()
+
+        assert "MATCH (n)" not in query
+        assert query.count("UNION") == len(ALLOWED_LABELS) - 1
+        for label in ALLOWED_LABELS:
+            assert f"MATCH (n:{label}) WHERE n.name IS NOT NULL RETURN n" in query
+        assert query == builder.get_all_node_names()[0]
+
 
 class TestGetNodeWithRelationshipsEnhanced:
     """Test suite for enhanced get_node_with_relationships method."""
@@ -1670,6 +1872,36 @@ class TestMergeNode:
 
         assert "MERGE" in query
         assert ":ThreatActor" in query
+        assert params["set_properties"] == {}
+
+    def test_merge_node_query_text_independent_of_set_properties(self):
+        """Test query text is stable so Neo4j can reuse the cached plan."""
+        builder = AdminQueryBuilder()
+        query_without, _ = builder.merge_node("ThreatActor", {"name": "APT28"})
+        query_with, _ = builder.merge_node(
+            "ThreatActor",
+            {"name": "APT29"},
+            {"type": "APT", "first_seen": "2020-01-01"},
+        )
+
+        assert query_without == query_with
+
+    def test_merge_node_query_text_constant_across_random_inputs(self):
+        """Test 100 random property sets for one label yield one query text."""
+        rng = random.Random(42)
+        optional_properties = ["type", "first_seen", "last_seen", "description"]
+        builder = AdminQueryBuilder()
+
+        queries = set()
+        for _ in range(100):
+            keys = rng.sample(optional_properties, rng.randint(0, 4))
+            set_properties = {key: f"value-{rng.random()}" for key in keys}
+            query, _ = builder.merge_node(
+                "Malware", {"name": f"name-{rng.random()}"}, set_properties
+            )
+            queries.add(query)
+
+        assert len(queries) == 1
 
     def test_merge_node_invalid_label(self):
         """Test merge_node rejects invalid label."""
@@ -2027,10 +2259,41 @@ class TestFuzzySearchNodes:
             search_value="shadow",
         )
 
-        assert "CONTAINS" in query.upper()
-        assert "toLower" in query
+        assert "n.name_lc CONTAINS $search_value" in query
+        assert "toLower" not in query
         assert params["search_value"] == "shadow"
 
+    def test_fuzzy_search_lowercases_value(self):
+        """Test the search value is lowercased once in Python."""
+        builder = SafeQueryBuilder()
+        _, params = builder.fuzzy_search_nodes(search_value="ShadowGroup")
+
+        assert params["search_value"] == "shadowgroup"
+
+    def test_fuzzy_search_without_label_queries_each_label(self):
+        """Test label-less name search uses one lookup per label."""
+        builder = SafeQueryBuilder()
+        query, _ = builder.fuzzy_search_nodes(search_value="shadow")
+
+        assert "MATCH (n)" not in query
+        for label in ALLOWED_LABELS:
+            assert (
+                f"MATCH (n:{label}) WHERE n.name_lc CONTAINS $search_value"
+                in query
+            )
+
+    def test_fuzzy_search_other_property_lowercases_once(self):
+        """Test non-name properties are lowercased once per node."""
+        builder = SafeQueryBuilder()
+        query, _ = builder.fuzzy_search_nodes(
+            label="Vulnerability", search_property="title", search_value="x"
+        )
+
+        assert query.count("toLower(") == 1
+        assert "WITH n, toLower(n.title) AS lowered" in query
+        assert "WHERE lowered CONTAINS $search_value" in query
+        assert "WHEN lowered STARTS WITH $search_value THEN 1" in query
+
     def test_fuzzy_search_with_label(self):
         """Test fuzzy search with label filter."""
         builder = SafeQueryBuilder()
@@ -2113,14 +2376,42 @@ class TestSearchNodesWithTimeFilter:
             search_value="shadow",
         )
 
-        assert "MATCH (n)" in query
-        assert "search_value" in params
+        assert "MATCH (n)" not in query
+        assert params["search_value"] == "shadow"
         assert "start_date" not in params
         assert "end_date" not in params
         # Should have text search but no time filtering
-        assert "toLower(n.name) STARTS WITH toLower($search_value)" in query
+        assert "n.name_lc STARTS WITH $search_value" in query
         assert "published_date" not in query
 
+    def test_time_filter_name_prefix_uses_name_lc(self):
+        """Test name prefixes are lowercased and matched on name_lc."""
+        builder = SafeQueryBuilder()
+        query, params = builder.search_nodes_with_time_filter(
+            label="Malware",
+            search_value="Shadow",
+            start_date="2022-01-01",
+            end_date="2023-01-01",
+        )
+
+        assert "MATCH (n:Malware)" in query
+        assert "n.name_lc STARTS WITH $search_value" in query
+        assert "toLower" not in query
+        assert params["search_value"] == "shadow"
+
+    def test_time_filter_without_label_queries_each_label(self):
+        """Test label-less prefix search keeps the time filter per label."""
+        builder = SafeQueryBuilder()
+        query, params = builder.search_nodes_with_time_filter(
+            search_value="apt",
+            start_date="2022-01-01",
+            end_date="2023-01-01",
+        )
+
+        assert "CALL {" in query
+        assert "WHERE n.name IS NOT NULL" in query
+        assert "n.published_date >= $start_date" in query
+
     def test_time_filter_with_label(self):
         """Test time filter with label filter."""
         builder = SafeQueryBuilder()
@@ -2190,8 +2481,9 @@ class TestCheckNodeExists:
             label="ThreatActor",
         )
 
-        # CORRECTED: Check for actual query structure (count-based)
-        assert "count(n)" in query.lower()
+        # Existence is an EXISTS subquery, not a count
+        assert "MATCH (n:ThreatActor {name: $value})" in query
+        assert "exists {" in query.lower()
         assert ":ThreatActor" in query
         assert params["value"] == "APT28"
 
@@ -2226,7 +2518,8 @@ class TestGetAllNodeNames:
         builder = SafeQueryBuilder()
         query, params = builder.get_all_node_names()
 
-        assert "MATCH (n)" in query
+        assert "MATCH (n:ThreatActor)" in query
+        assert "MATCH (n)" not in query
 
     def test_get_all_names_includes_metadata(self):
         """Test getting names includes metadata when requested."""
@@ -2285,6 +2578,16 @@ class TestCountMethods:
         assert "COUNT" in query.upper()
         assert "-[r]-" in query
 
+    def test_count_stats(self):
+        """Test counting nodes and relationships in one query."""
+        builder = SafeQueryBuilder()
+        query, params = builder.count_stats()
+
+        assert "count(n) AS nodes" in query
+        assert "count(r) AS relationships" in query
+        assert "RETURN nodes, relationships" in query
+        assert params == {}
+
 
 class TestGetAllNodes:
     """Test get_all_nodes method."""
@@ -2305,6 +2608,13 @@ class TestGetAllNodes:
 
         assert ":ThreatActor" in query
 
+    def test_get_all_nodes_returns_property_maps(self):
+        """Test nodes are returned as property maps, not graph entities."""
+        builder = SafeQueryBuilder()
+        query, params = builder.get_all_nodes()
+
+        assert "RETURN properties(n) AS n" in query
+
     def test_get_all_nodes_custom_limit(self):
         """Test getting all nodes with custom limit."""
         builder = SafeQueryBuilder()